@@ -2,8 +2,14 @@
 Fraud detection API routes
 """
 
-from fastapi import APIRouter, HTTPException
-from api.schemas.request_response import FraudRequest, FraudResponse
+import csv
+import io
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from pydantic import ValidationError
+from api.schemas.request_response import (
+    FraudRequest, FraudResponse, FraudBatchRequest, FraudBatchResponse
+)
 from services.fraud_service import FraudService
 from database.db_manager import db
 from loguru import logger
@@ -40,6 +46,71 @@ async def check_scheme_fraud(request: FraudRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _screen_batch(schemes: list) -> FraudBatchResponse:
+    """Screen a batch of schemes and bulk-save the results"""
+    results = fraud_service.detect_fraud_batch(schemes)
+
+    db.save_fraud_checks([
+        {
+            'user_telegram_id': 'api_user',
+            'scheme_name': scheme['scheme_name'],
+            'scheme_description': scheme['description'],
+            'is_fraud': result['is_fraud'],
+            'confidence': result['confidence'],
+            'fraud_signals': result['fraud_signals'],
+            'verified': result['verified']
+        }
+        for scheme, result in zip(schemes, results)
+    ])
+
+    return FraudBatchResponse(
+        results=[FraudResponse(**r) for r in results],
+        total=len(results),
+        fraud_count=sum(1 for r in results if r['is_fraud'])
+    )
+
+
+@router.post("/check-scheme/batch", response_model=FraudBatchResponse)
+async def check_scheme_fraud_batch(request: FraudBatchRequest):
+    """
+    Screen many schemes (e.g. forwarded messages) in one call
+    """
+    try:
+        return _screen_batch([s.dict() for s in request.schemes])
+
+    except Exception as e:
+        logger.error(f"❌ Fraud batch API error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/check-scheme/batch/csv", response_model=FraudBatchResponse)
+async def check_scheme_fraud_csv(file: UploadFile = File(...)):
+    """
+    Screen every row of a CSV file
+
+    Columns follow FraudRequest (scheme_name, description, source, contact).
+    """
+    content = (await file.read()).decode("utf-8-sig")
+    schemes = []
+
+    for line_no, row in enumerate(csv.DictReader(io.StringIO(content)), start=2):
+        row = {k.strip(): v.strip() for k, v in row.items() if k and v not in (None, "")}
+        try:
+            schemes.append(FraudRequest(**row).dict())
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=f"Row {line_no}: {e.errors()}")
+
+    if not schemes:
+        raise HTTPException(status_code=422, detail="CSV has no scheme rows")
+
+    try:
+        return _screen_batch(schemes)
+
+    except Exception as e:
+        logger.error(f"❌ Fraud CSV batch API error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/common-scams")
 async def get_common_scams():
     """
@@ -63,4 +134,33 @@ async def get_common_scams():
         }
     ]
     
-    return {"scams": scams, "helpline": "1930 (Cyber Crime Helpline)"}
\ No newline at end of file
+    return {"scams": scams, "helpline": "1930 (Cyber Crime Helpline)"}
+
+@router.get("/rules")
+async def get_fraud_rules():
+    """
+    Currently active fraud rules version
+    """
+    rules = fraud_service.rules.current()
+    return {
+        "version": rules.version,
+        "fraud_keywords": len(rules.fraud_keywords),
+        "verified_schemes": len(rules.verified_schemes)
+    }
+
+
+@router.post("/rules/reload")
+async def reload_fraud_rules():
+    """
+    Reload fraud rules from disk without restarting
+    """
+    reloaded = fraud_service.rules.reload()
+    return {"reloaded": reloaded, "version": fraud_service.rules.version}
+
+
+@router.get("/cache-stats")
+async def get_fraud_cache_stats():
+    """
+    Verdict cache size and hit/miss counters
+    """
+    return fraud_service.cache.stats()
@@ -2,14 +2,25 @@
 Loan API routes
 """
 
-from fastapi import APIRouter, HTTPException
-from api.schemas.request_response import LoanRequest, LoanResponse
+import csv
+import io
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query
+from pydantic import ValidationError
+from api.schemas.request_response import (
+    LoanRequest, LoanResponse, LoanBatchRequest, LoanBatchResponse,
+    EMIGridRequest, EMIGridResponse, AmortizationRequest, AmortizationResponse
+)
+from services.emi_engine import amortization_schedule, grid_rows
 from services.loan_service import LoanService
+from services.scheme_registry import get_scheme_registry
 from database.db_manager import db
 from loguru import logger
 
 router = APIRouter(prefix="/loan", tags=["Loan"])
 loan_service = LoanService()
+scheme_registry = get_scheme_registry()
 
 
 @router.post("/check-eligibility", response_model=LoanResponse)
@@ -36,33 +47,152 @@ async def check_loan_eligibility(request: LoanRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _screen_batch(applicants: list) -> LoanBatchResponse:
+    """Score a batch of applicants and bulk-save the results"""
+    results = loan_service.predict_eligibility_batch(applicants)
+
+    db.save_loan_queries([
+        {
+            'user_telegram_id': 'api_user',
+            **user_data,
+            **{k: v for k, v in result.items() if k not in ['message_hindi', 'message_english']}
+        }
+        for user_data, result in zip(applicants, results)
+    ])
+
+    return LoanBatchResponse(
+        results=[LoanResponse(**r) for r in results],
+        total=len(results),
+        eligible_count=sum(1 for r in results if r['eligible'])
+    )
+
+
+@router.post("/check-eligibility/batch", response_model=LoanBatchResponse)
+async def check_loan_eligibility_batch(request: LoanBatchRequest):
+    """
+    Check loan eligibility for many applicants in one call
+    """
+    try:
+        return _screen_batch([a.dict() for a in request.applicants])
+
+    except Exception as e:
+        logger.error(f"❌ Loan batch API error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/check-eligibility/batch/csv", response_model=LoanBatchResponse)
+async def check_loan_eligibility_csv(file: UploadFile = File(...)):
+    """
+    Check loan eligibility for every row of a CSV file
+
+    Columns follow LoanRequest (income, age, employment_type, ...).
+    """
+    content = (await file.read()).decode("utf-8-sig")
+    applicants = []
+
+    for line_no, row in enumerate(csv.DictReader(io.StringIO(content)), start=2):
+        row = {k.strip(): v.strip() for k, v in row.items() if k and v not in (None, "")}
+        try:
+            applicants.append(LoanRequest(**row).dict())
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=f"Row {line_no}: {e.errors()}")
+
+    if not applicants:
+        raise HTTPException(status_code=422, detail="CSV has no applicant rows")
+
+    try:
+        return _screen_batch(applicants)
+
+    except Exception as e:
+        logger.error(f"❌ Loan CSV batch API error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/emi-grid", response_model=EMIGridResponse)
+async def get_emi_grid(request: EMIGridRequest):
+    """
+    EMI for every amount × interest rate × tenure combination
+    """
+    rows = grid_rows(request.amounts, request.interest_rates, request.tenures_months)
+    return EMIGridResponse(rows=rows, count=len(rows))
+
+
+@router.post("/amortization", response_model=AmortizationResponse)
+async def get_amortization(request: AmortizationRequest):
+    """
+    Month-by-month interest/principal split for one loan
+    """
+    schedule = amortization_schedule(request.amount, request.interest_rate, request.tenure_months)
+    rows = [
+        {key: round(float(values[i]), 2) if key != "month" else int(values[i])
+         for key, values in schedule.items()}
+        for i in range(request.tenure_months)
+    ]
+
+    return AmortizationResponse(
+        emi=round(float(schedule["payment"][0]), 2),
+        total_interest=round(float(schedule["interest"].sum()), 2),
+        schedule=rows
+    )
+
+
 @router.get("/schemes")
-async def get_government_schemes():
+async def get_government_schemes(
+    category: Optional[str] = None,
+    purpose: str = "loan",
+    min_amount: Optional[float] = Query(None, ge=0),
+    max_amount: Optional[float] = Query(None, ge=0),
+    q: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
+):
     """
-    Get list of verified government loan schemes
+    List verified government loan schemes
+
+    Filters: category/purpose (see /loan/schemes/facets; purpose=all lists
+    every scheme), amount range, q (name, alias or prefix, e.g. "kcc",
+    "मनरेगा", "pradhan mantri k")
     """
-    schemes = [
-        {
-            "name": "प्रधानमंत्री मुद्रा योजना (PM MUDRA)",
-            "max_amount": 1000000,
-            "purpose": "Business",
-            "interest_rate": "8-12%",
-            "verified": True
-        },
-        {
-            "name": "किसान क्रेडिट कार्ड (KCC)",
-            "max_amount": 300000,
-            "purpose": "Agriculture",
-            "interest_rate": "4-7%",
-            "verified": True
-        },
-        {
-            "name": "Stand Up India",
-            "max_amount": 10000000,
-            "purpose": "SC/ST/Women entrepreneurs",
-            "interest_rate": "Base rate + margin",
-            "verified": True
+    try:
+        schemes, total = scheme_registry.filter(
+            category=category,
+            purpose=None if purpose.lower() == "all" else purpose,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            query=q,
+            offset=offset,
+            limit=limit
+        )
+        return {
+            "schemes": [s.to_dict() for s in schemes],
+            "count": len(schemes),
+            "total": total,
+            "offset": offset,
+            "limit": limit
         }
-    ]
-    
-    return {"schemes": schemes, "count": len(schemes)}
\ No newline at end of file
+    except Exception as e:
+        logger.error(f"Scheme listing error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/schemes/facets")
+async def get_scheme_facets():
+    """
+    Categories and purposes with scheme counts
+    """
+    return {
+        "categories": scheme_registry.categories(),
+        "purposes": scheme_registry.purposes(),
+        "total": len(scheme_registry)
+    }
+
+
+@router.get("/schemes/{scheme_id}")
+async def get_scheme(scheme_id: str):
+    """
+    One scheme by id or any of its names/aliases
+    """
+    scheme = scheme_registry.get(scheme_id) or scheme_registry.lookup(scheme_id)
+    if scheme is None:
+        raise HTTPException(status_code=404, detail=f"Scheme not found: {scheme_id}")
+    return scheme.to_dict()
@@ -3,6 +3,7 @@ RAG chatbot API routes
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from api.schemas.request_response import RAGRequest, RAGResponse
 from services.rag_service import RAGService
 from database.db_manager import db
@@ -18,10 +19,13 @@ async def ask_question(request: RAGRequest):
     Ask a question about banking/schemes using RAG
     """
     try:
-        result = rag_service.answer_question(
+        # Off the event loop so concurrent questions can share a retrieval batch
+        result = await run_in_threadpool(
+            rag_service.answer_question,
             request.question,
             language=request.language,
-            include_sources=request.include_sources
+            include_sources=request.include_sources,
+            filters=request.filters.model_dump(exclude_none=True) if request.filters else None
         )
         
         # Save to database
@@ -81,4 +85,17 @@ async def get_rag_status():
         
     except Exception as e:
         logger.error(f"❌ Status check error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/filters")
+async def get_filter_options():
+    """
+    Sources, languages and scheme tags accepted by /rag/ask filters
+    """
+    try:
+        return rag_service.get_filter_options()
+
+    except Exception as e:
+        logger.error(f"❌ Filter options error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -4,6 +4,7 @@ Pydantic schemas for API requests/responses
 
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from typing_extensions import Annotated
 from datetime import datetime
 
 
@@ -29,6 +30,60 @@ class LoanResponse(BaseModel):
     message_english: str
 
 
+class LoanBatchRequest(BaseModel):
+    applicants: List[LoanRequest] = Field(..., min_length=1, max_length=10000)
+
+
+class LoanBatchResponse(BaseModel):
+    results: List[LoanResponse]
+    total: int
+    eligible_count: int
+
+
+class EMIGridRequest(BaseModel):
+    amounts: List[Annotated[float, Field(gt=0)]] = Field(
+        ..., min_length=1, max_length=20, description="Loan amounts in INR"
+    )
+    interest_rates: List[Annotated[float, Field(ge=0, le=60)]] = Field(
+        ..., min_length=1, max_length=20, description="Annual rates in %"
+    )
+    tenures_months: List[Annotated[int, Field(gt=0, le=480)]] = Field(..., min_length=1, max_length=40)
+
+
+class EMIGridRow(BaseModel):
+    amount: float
+    interest_rate: float
+    tenure_months: int
+    emi: float
+    total_payment: float
+    total_interest: float
+
+
+class EMIGridResponse(BaseModel):
+    rows: List[EMIGridRow]
+    count: int
+
+
+class AmortizationRequest(BaseModel):
+    amount: float = Field(..., gt=0)
+    interest_rate: float = Field(..., ge=0, le=60)
+    tenure_months: int = Field(..., gt=0, le=480)
+
+
+class AmortizationRow(BaseModel):
+    month: int
+    payment: float
+    interest: float
+    principal: float
+    balance: float
+
+
+class AmortizationResponse(BaseModel):
+    emi: float
+    total_interest: float
+    schedule: List[AmortizationRow]
+
+
 # Fraud Schemas
 class FraudRequest(BaseModel):
     scheme_name: str = Field(..., min_length=1)
@@ -37,6 +92,12 @@ class FraudRequest(BaseModel):
     contact: str = Field("", description="Contact information")
 
 
+class SignalMatch(BaseModel):
+    signal: str
+    start: int
+    end: int
+
+
 class FraudResponse(BaseModel):
     is_fraud: bool
     confidence: float
@@ -44,19 +105,41 @@ class FraudResponse(BaseModel):
     warning_message_hindi: str
     warning_message_english: str
     verified: bool
+    signal_matches: List[SignalMatch] = []
+    rules_version: Optional[str] = None
+
+
+class FraudBatchRequest(BaseModel):
+    schemes: List[FraudRequest] = Field(..., min_length=1, max_length=10000)
+
+
+class FraudBatchResponse(BaseModel):
+    results: List[FraudResponse]
+    total: int
+    fraud_count: int
 
 
 # RAG Schemas
+class RAGFilters(BaseModel):
+    source: Optional[List[str]] = Field(None, description="PDF file names (or parts of them)")
+    language: Optional[str] = Field(None, description="hindi/english")
+    scheme: Optional[List[str]] = Field(None, description="Scheme tags or names, e.g. kcc, mudra")
+    page_from: Optional[int] = Field(None, ge=1)
+    page_to: Optional[int] = Field(None, ge=1)
+
+
 class RAGRequest(BaseModel):
     question: str = Field(..., min_length=1)
     language: str = Field("hindi", description="Response language")
     include_sources: bool = Field(True)
+    filters: Optional[RAGFilters] = Field(None, description="Restrict retrieval to matching documents")
 
 
 class RAGResponse(BaseModel):
     answer: str
     sources: List[str]
     confidence: float
+    answer_mode: str = Field("generative", description="faq/extractive/generative/none")
 
 
 # General
@@ -21,8 +21,14 @@ sys.path.insert(0, str(project_root))
 from services.loan_service import LoanService
 from services.fraud_service import FraudService
 from services.rag_service import RAGService
+from services.emi_engine import emi_grid
+from services.scheme_registry import get_scheme_registry
 from database.db_manager import db
 from bots.voice_handler import VoiceHandler
+from utils.debug_log import get_debug_logger
+from utils.number_parser import parse_number
+
+debug_log = get_debug_logger("bot.loan")
 
 # Conversation states - NOW 10 STATES for all fields
 (
@@ -38,6 +44,10 @@ from bots.voice_handler import VoiceHandler
     AWAITING_PURPOSE
 ) = range(10)
 
+# /emi table: tenures (rows) × annual rates (columns)
+EMI_TABLE_TENURES = [12, 24, 36, 48, 60]
+EMI_TABLE_RATES = [4.0, 8.5, 12.0]
+
 
 class GraminSahayakBot:
 
@@ -50,6 +60,7 @@ class GraminSahayakBot:
         self.fraud_service = FraudService()
         self.rag_service = RAGService()
         self.voice_handler = VoiceHandler()
+        self.scheme_registry = get_scheme_registry()
 
         self.app = (
             Application.builder()
@@ -103,6 +114,7 @@ class GraminSahayakBot:
         self.app.add_handler(CommandHandler("fraud", self.fraud))
         self.app.add_handler(CommandHandler("schemes", self.schemes))
         self.app.add_handler(CommandHandler("stats", self.stats))
+        self.app.add_handler(CommandHandler("emi", self.emi))
 
         loan_conv = ConversationHandler(
             entry_points=[CommandHandler("loan", self.loan_start)],
@@ -165,6 +177,8 @@ class GraminSahayakBot:
             "📚 **मदद**\n\n"
             "/start - शुरू करें\n"
             "/loan - लोन जांच\n"
+            "/emi 200000 - EMI तालिका\n"
+            "/schemes KCC - योजना की जानकारी\n"
             "/cancel - रद्द करें"
         )
 
@@ -172,13 +186,56 @@ class GraminSahayakBot:
         await self._safe_send_message(update, "🔍 योजना का नाम भेजें")
 
     async def schemes(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """/schemes [name] - loan schemes, or one scheme's details"""
+        registry = self.scheme_registry
+        query = " ".join(context.args) if context and context.args else ""
+
+        if query:
+            scheme = registry.lookup(query) or next(iter(registry.find_in_text(query)), None)
+            matches = [scheme] if scheme else registry.search_prefix(query, limit=5)
+
+            if len(matches) == 1:
+                await self._safe_send_message(update, self._format_scheme(matches[0]))
+            elif matches:
+                lines = [f"{i}️⃣ {s.name_hi or s.name}" for i, s in enumerate(matches, 1)]
+                await self._safe_send_message(
+                    update, "🔎 क्या आप इनमें से कोई योजना ढूंढ रहे हैं?\n\n" + "\n".join(lines)
+                )
+            else:
+                await self._safe_send_message(update, "❌ यह योजना नहीं मिली। /schemes से सूची देखें")
+            return
+
+        loans, _ = registry.filter(purpose="loan", limit=8)
+        lines = []
+        for i, s in enumerate(loans, 1):
+            limit = f" – {self._format_amount(s.amount_max)} तक" if s.amount_max else ""
+            lines.append(f"{i}. {s.name_hi or s.name}{limit}")
+
         await self._safe_send_message(update,
-            "🏛️ **सरकारी योजनाएं**\n\n"
-            "1️⃣ मुद्रा योजना – ₹10L तक\n"
-            "2️⃣ किसान क्रेडिट कार्ड\n"
-            "3️⃣ स्टैंड अप इंडिया"
+            "🏛️ **सरकारी योजनाएं**\n\n" + "\n".join(lines) +
+            f"\n\n📚 कुल {len(registry)} योजनाएं। विवरण: /schemes किसान क्रेडिट कार्ड"
         )
 
+    @staticmethod
+    def _format_amount(amount: float) -> str:
+        if amount >= 1e7:
+            return f"₹{amount / 1e7:g} करोड़"
+        if amount >= 1e5:
+            return f"₹{amount / 1e5:g} लाख"
+        return f"₹{amount:,.0f}"
+
+    def _format_scheme(self, scheme) -> str:
+        lines = [f"🏛️ **{scheme.name_hi or scheme.name}**"]
+        if scheme.name_hi:
+            lines.append(scheme.name)
+        lines.append(f"\n{scheme.description}")
+        if scheme.amount_max:
+            lines.append(f"\n💰 अधिकतम: {self._format_amount(scheme.amount_max)}")
+        if scheme.interest_rate:
+            lines.append(f"📈 ब्याज: {scheme.interest_rate}")
+        lines.append(f"🔗 स्रोत: {scheme.source}")
+        return "\n".join(lines)
+
     async def stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         try:
             stats = db.get_user_stats(str(update.effective_user.id))
@@ -187,6 +244,47 @@ class GraminSahayakBot:
             msg = "📊 डेटा नहीं मिला"
         await self._safe_send_message(update, msg)
 
+    async def emi(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """/emi <amount> [rate] - EMI table for several tenures and rates"""
+        if not context.args:
+            await self._safe_send_message(update, "💡 उदाहरण: /emi 200000  या  /emi 2 लाख 9.5")
+            return
+
+        args = list(context.args)
+        rates = EMI_TABLE_RATES
+
+        # A trailing number up to 40 is read as the annual rate
+        if len(args) > 1:
+            try:
+                rate = float(args[-1].rstrip("%"))
+                if 0 <= rate <= 40:
+                    rates = [rate]
+                    args = args[:-1]
+            except ValueError:
+                pass
+
+        try:
+            amount = int(self._extract_number(" ".join(args)).replace(",", ""))
+        except ValueError:
+            amount = 0
+
+        if amount <= 0:
+            await self._safe_send_message(update, "❌ सही राशि लिखें, जैसे /emi 200000")
+            return
+
+        grid = emi_grid([amount], rates, EMI_TABLE_TENURES)["emi"][0]
+
+        header = "महीने " + "".join(f"{r:>9.1f}%" for r in rates)
+        lines = [header, "-" * len(header)]
+        for k, tenure in enumerate(EMI_TABLE_TENURES):
+            lines.append(f"{tenure:>5} " + "".join(f"{grid[j, k]:>10,.0f}" for j in range(len(rates))))
+
+        await self._safe_send_message(
+            update,
+            f"📅 ₹{amount:,} की मासिक EMI (₹)\n<pre>" + "\n".join(lines) + "</pre>",
+            parse_mode="HTML"
+        )
+
     # LOAN FLOW - ALL 10 STEPS
     async def loan_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         context.user_data.clear()
@@ -206,7 +304,7 @@ class GraminSahayakBot:
     async def get_gender(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         gender = update.message.text.strip()
         context.user_data["loan"]["gender"] = gender
-        logger.info(f"Gender: {gender}")
+        debug_log.log("loan_step", gender=gender)
 
         keyboard = [["हाँ / Yes"], ["नहीं / No"]]
         await self._safe_send_message(
@@ -219,7 +317,7 @@ class GraminSahayakBot:
     async def get_married(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         married = update.message.text.strip()
         context.user_data["loan"]["marital_status"] = married
-        logger.info(f"Married: {married}")
+        debug_log.log("loan_step", marital_status=married)
 
         keyboard = [["0"], ["1"], ["2"], ["3+"]]
         await self._safe_send_message(
@@ -232,7 +330,7 @@ class GraminSahayakBot:
     async def get_dependents(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         dependents = update.message.text.strip()
         context.user_data["loan"]["dependents"] = dependents
-        logger.info(f"Dependents: {dependents}")
+        debug_log.log("loan_step", dependents=dependents)
 
         await self._safe_send_message(
             update,
@@ -252,7 +350,7 @@ class GraminSahayakBot:
                 return AWAITING_INCOME
             
             context.user_data["loan"]["income"] = income
-            logger.info(f"Income: {income}")
+            debug_log.log("loan_step", income=income)
 
             keyboard = [["स्नातक / Graduate"], ["अस्नातक / Not Graduate"]]
             await self._safe_send_message(
@@ -268,7 +366,7 @@ class GraminSahayakBot:
     async def get_education(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         education = update.message.text.strip()
         context.user_data["loan"]["education"] = education
-        logger.info(f"Education: {education}")
+        debug_log.log("loan_step", education=education)
 
         keyboard = [["हाँ / Yes"], ["नहीं / No"]]
         await self._safe_send_message(
@@ -281,7 +379,7 @@ class GraminSahayakBot:
     async def get_employment(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         employment = update.message.text.strip()
         context.user_data["loan"]["employment_type"] = employment
-        logger.info(f"Employment: {employment}")
+        debug_log.log("loan_step", employment_type=employment)
 
         keyboard = [["ग्रामीण / Rural"], ["शहरी / Urban"], ["अर्ध-शहरी / Semiurban"]]
         await self._safe_send_message(
@@ -294,7 +392,7 @@ class GraminSahayakBot:
     async def get_property(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         property_area = update.message.text.strip()
         context.user_data["loan"]["property_area"] = property_area
-        logger.info(f"Property: {property_area}")
+        debug_log.log("loan_step", property_area=property_area)
 
         await self._safe_send_message(
             update,
@@ -314,7 +412,7 @@ class GraminSahayakBot:
                 return AWAITING_CREDIT_SCORE
             
             context.user_data["loan"]["credit_score"] = score
-            logger.info(f"Credit: {score}")
+            debug_log.log("loan_step", credit_score=score)
 
             await self._safe_send_message(
                 update,
@@ -336,7 +434,7 @@ class GraminSahayakBot:
                 return AWAITING_LOAN_AMOUNT
             
             context.user_data["loan"]["loan_amount_requested"] = amt
-            logger.info(f"Amount: {amt}")
+            debug_log.log("loan_step", loan_amount_requested=amt)
 
             keyboard = [["घर"], ["खेती"], ["व्यवसाय"], ["शिक्षा"]]
             await self._safe_send_message(
@@ -352,7 +450,7 @@ class GraminSahayakBot:
     async def get_purpose(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         purpose = update.message.text.strip()
         context.user_data["loan"]["loan_purpose"] = purpose
-        logger.info(f"Purpose: {purpose}")
+        debug_log.log("loan_step", loan_purpose=purpose)
         
         await self._safe_send_message(
             update,
@@ -360,7 +458,7 @@ class GraminSahayakBot:
             reply_markup=ReplyKeyboardRemove()
         )
 
-        logger.info(f"Full loan data: {context.user_data['loan']}")
+        debug_log.log("loan_submit", user=update.effective_user.id, **context.user_data["loan"])
         
         # Run prediction in executor if it's blocking
         result = await asyncio.get_event_loop().run_in_executor(
@@ -379,21 +477,11 @@ class GraminSahayakBot:
         return ConversationHandler.END
 
     def _extract_number(self, text: str) -> str:
-        import re
-        text = text.strip().lower()
-        if text.replace(",", "").isdigit():
-            return text.replace(",", "")
-        
-        hindi_map = {'हजार': 1000, 'लाख': 100000, 'बीस': 20, 'तीस': 30}
-        for word, val in hindi_map.items():
-            if word in text:
-                digits = re.findall(r'\d+', text)
-                if digits and word in ['हजार', 'लाख']:
-                    return str(int(digits[0]) * val)
-                return str(val)
-        
-        digits = re.findall(r'\d+', text)
-        return digits[0] if digits else text
+        """First number in the reply ("25000", "ढाई लाख", "25k") as digits"""
+        value = parse_number(text.strip())
+        if value is None:
+            return text.strip()
+        return str(int(round(value)))
 
     async def cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         context.user_data.clear()
@@ -109,6 +109,22 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def save_loan_queries(self, rows: list):
+        """Bulk insert loan queries (unknown keys are dropped)"""
+        columns = set(LoanQuery.__table__.columns.keys())
+        session = self.get_session()
+        try:
+            session.add_all(
+                LoanQuery(**{k: v for k, v in row.items() if k in columns})
+                for row in rows
+            )
+            session.commit()
+        except Exception as e:
+            logger.error(f"❌ Error saving loan queries: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
     def save_fraud_check(self, data: dict):
         session = self.get_session()
         try:
@@ -120,6 +136,22 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def save_fraud_checks(self, rows: list):
+        """Bulk insert fraud checks (unknown keys are dropped)"""
+        columns = set(FraudCheck.__table__.columns.keys())
+        session = self.get_session()
+        try:
+            session.add_all(
+                FraudCheck(**{k: v for k, v in row.items() if k in columns})
+                for row in rows
+            )
+            session.commit()
+        except Exception as e:
+            logger.error(f"❌ Error saving fraud checks: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
     def save_rag_query(self, data: dict):
         session = self.get_session()
         try:
@@ -131,6 +163,23 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def iter_rag_questions(self, since: datetime = None, batch_size: int = 1000):
+        """
+        Yield (question, language) for logged RAG queries, streamed in batches
+        """
+        session = self.get_session()
+        try:
+            query = session.query(RAGQuery.question, RAGQuery.language).filter(
+                RAGQuery.question.isnot(None)
+            )
+            if since is not None:
+                query = query.filter(RAGQuery.created_at >= since)
+
+            for question, language in query.yield_per(batch_size):
+                yield question, language
+        finally:
+            session.close()
+
     def save_conversation(self, telegram_id, message_type, message_text, message_data=None):
         session = self.get_session()
         try:
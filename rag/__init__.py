@@ -7,7 +7,13 @@ from .pdf_loader import PDFLoader
 from .chunker import TextChunker
 from .embedder import Embedder
 from .vector_store import VectorStore
+from .bm25 import BM25Index
+from .metadata_index import MetadataIndex
 from .retriever import Retriever
+from .micro_batcher import RetrievalBatcher
+from .reranker import Reranker
+from .context_builder import ContextBuilder
+from .extractive import ExtractiveAnswerer
 from .rag_pipeline import RAGPipeline
 
 __all__ = [
@@ -15,6 +21,12 @@ __all__ = [
     'TextChunker',
     'Embedder',
     'VectorStore',
+    'BM25Index',
+    'MetadataIndex',
     'Retriever',
+    'RetrievalBatcher',
+    'Reranker',
+    'ContextBuilder',
+    'ExtractiveAnswerer',
     'RAGPipeline'
 ]
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+BM25 Index - Lexical retrieval over the RAG chunks
+Inverted index stored as flat numpy postings (CSR layout), persisted
+next to faiss.index so it loads in milliseconds
+"""
+
+import os
+import re
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+import numpy as np
+from loguru import logger
+
+# Words in Latin or Devanagari script; matras are not matched by \w alone.
+# The danda (। ॥, U+0964/5) ends a sentence and is not part of the word
+_TOKEN_RE = re.compile(r"[\w\u0900-\u0963\u0966-\u097F]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens - scheme names, acronyms and numbers survive"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed document list
+
+    Postings for term t are doc_ids[indptr[t]:indptr[t+1]] with matching
+    term frequencies in tfs; a query touches only its terms' slices.
+    """
+
+    FILE_NAME = "bm25.npz"
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        self.vocab = {}
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.doc_ids = np.zeros(0, dtype=np.int32)
+        self.tfs = np.zeros(0, dtype=np.float32)
+        self.doc_len = np.zeros(0, dtype=np.float32)
+        self.idf = np.zeros(0, dtype=np.float32)
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.doc_len)
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, texts: Iterable[str], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        index = cls(k1, b)
+        postings = {}  # term -> ([doc ids], [tfs])
+        doc_len = []
+
+        for doc_id, text in enumerate(texts):
+            counts = Counter(tokenize(text))
+            doc_len.append(sum(counts.values()))
+            for term, tf in counts.items():
+                ids, freqs = postings.setdefault(term, ([], []))
+                ids.append(doc_id)
+                freqs.append(tf)
+
+        terms = sorted(postings)
+        index.vocab = {term: i for i, term in enumerate(terms)}
+
+        lengths = np.array([len(postings[t][0]) for t in terms], dtype=np.int64)
+        index.indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        index.doc_ids = np.fromiter(
+            (d for t in terms for d in postings[t][0]), dtype=np.int32, count=int(lengths.sum())
+        )
+        index.tfs = np.fromiter(
+            (f for t in terms for f in postings[t][1]), dtype=np.float32, count=int(lengths.sum())
+        )
+        index.doc_len = np.asarray(doc_len, dtype=np.float32)
+        index._compute_idf(lengths)
+
+        logger.info(f"✅ BM25 index: {index.n_docs} docs, {len(terms)} terms")
+        return index
+
+    def _compute_idf(self, doc_freq: np.ndarray):
+        n = max(self.n_docs, 1)
+        self.idf = np.log1p((n - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+
+        avgdl = float(self.doc_len.mean()) if self.n_docs else 1.0
+        # Per-document length normalisation, precomputed once
+        self._norm = (self.k1 * (1 - self.b + self.b * self.doc_len / max(avgdl, 1e-9))).astype(np.float32)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for the query"""
+        scores = np.zeros(self.n_docs, dtype=np.float32)
+
+        for term, qtf in Counter(tokenize(query)).items():
+            t = self.vocab.get(term)
+            if t is None:
+                continue
+            start, end = self.indptr[t], self.indptr[t + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.tfs[start:end]
+            # Each doc appears once per term, so fancy-index += is safe
+            scores[docs] += qtf * self.idf[t] * tf * (self.k1 + 1) / (tf + self._norm[docs])
+
+        return scores
+
+    def search(self, query: str, k: int = 10, ids: np.ndarray = None) -> List[Tuple[int, float]]:
+        """
+        Top-k (doc_id, score) with score > 0, best first
+
+        ids optionally restricts the candidates (metadata filters).
+        """
+        if self.n_docs == 0:
+            return []
+
+        scores = self.scores(query)
+        candidates = np.arange(self.n_docs) if ids is None else np.asarray(ids, dtype=np.int64)
+        if not len(candidates):
+            return []
+
+        candidate_scores = scores[candidates]
+        k = min(k, len(candidates))
+        top = np.argpartition(-candidate_scores, k - 1)[:k]
+        top = top[np.argsort(-candidate_scores[top], kind="stable")]
+
+        return [
+            (int(candidates[i]), float(candidate_scores[i]))
+            for i in top if candidate_scores[i] > 0
+        ]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str):
+        path = os.path.join(directory, self.FILE_NAME)
+        terms = np.array(sorted(self.vocab, key=self.vocab.get), dtype=np.str_)
+
+        np.savez(
+            path,
+            terms=terms,
+            indptr=self.indptr,
+            doc_ids=self.doc_ids,
+            tfs=self.tfs,
+            doc_len=self.doc_len,
+            params=np.array([self.k1, self.b], dtype=np.float64),
+        )
+        logger.info(f"💾 BM25 index saved to {path}")
+
+    @classmethod
+    def load(cls, directory: str) -> "BM25Index":
+        path = os.path.join(directory, cls.FILE_NAME)
+
+        with np.load(path, allow_pickle=False) as data:
+            k1, b = data["params"].tolist()
+            index = cls(k1, b)
+            index.vocab = {term: i for i, term in enumerate(data["terms"].tolist())}
+            index.indptr = data["indptr"]
+            index.doc_ids = data["doc_ids"]
+            index.tfs = data["tfs"]
+            index.doc_len = data["doc_len"]
+
+        index._compute_idf(np.diff(index.indptr))
+        return index
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[int]], k: int = 60) -> List[Tuple[int, float]]:
+    """
+    Fuse ranked id lists: score(d) = sum over lists of 1 / (k + rank)
+
+    Returns (id, fused score) sorted best first.
+    """
+    fused = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
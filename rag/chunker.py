@@ -3,7 +3,8 @@ Text Chunker - Memory-safe document chunking
 Optimized for Hindi/English mixed content
 """
 
-from typing import List, Dict
+from bisect import bisect_right
+from typing import Iterable, List, Dict, Tuple
 from loguru import logger
 import os
 
@@ -24,39 +25,105 @@ class TextChunker:
         if not text or len(text) < 50:
             return []
 
-        # Trim very large documents
-        if len(text) > self.MAX_TEXT_LENGTH:
-            logger.warning(f"⚠️ Trimming large document: {filename}")
-            text = text[:self.MAX_TEXT_LENGTH]
+        # Rebuild the page stream from recorded spans (whole text = page 1)
+        page_spans = document.get("page_spans") or [(1, 0, len(text))]
+        pages = ((page_num, text[start:end]) for page_num, start, end in page_spans)
+
+        return self.chunk_pages(pages, filename)
 
+    def chunk_pages(self, pages: Iterable[Tuple[int, str]], filename: str = "unknown") -> List[Dict[str, str]]:
+        """
+        Chunk a stream of (page_number, text) pairs
+
+        Only the unchunked tail of the document is buffered, so memory is
+        bounded by page size. Each chunk records 'page_start'/'page_end'.
+        """
         chunks = []
+        buffer = ""
+        buffer_offset = 0                   # document offset of buffer[0]
+        page_starts: List[int] = []         # document offset where each page begins
+        page_numbers: List[int] = []
+        total_length = 0
         start = 0
-        chunk_id = 0
-
-        while start < len(text) and chunk_id < self.MAX_CHUNKS_PER_DOC:
-            end = start + self.chunk_size
-
-            # Sentence boundary detection (Hindi + English)
-            if end < len(text):
-                for boundary in ["। ", ". ", "? ", "! ", "\n"]:
-                    pos = text.rfind(boundary, start, end)
-                    if pos != -1:
-                        end = pos + 1
-                        break
-
-            chunk_text = text[start:end].strip()
-
-            if chunk_text:
-                chunks.append({
-                    "text": chunk_text,
-                    "source": filename,
-                    "chunk_id": chunk_id,
-                    "start_char": start,
-                    "end_char": end
-                })
-                chunk_id += 1
-
-            start = max(end - self.chunk_overlap, start + 1)
+        trimmed = False
+
+        def page_at(offset: int) -> int:
+            return page_numbers[max(bisect_right(page_starts, offset) - 1, 0)]
+
+        def emit(final: bool):
+            nonlocal buffer, buffer_offset, start
+
+            text_end = buffer_offset + len(buffer)
+
+            while start < text_end and len(chunks) < self.MAX_CHUNKS_PER_DOC:
+                end = start + self.chunk_size
+
+                # Wait for more pages unless the chunk is complete
+                if end >= text_end and not final:
+                    break
+
+                # Sentence boundary detection (Hindi + English)
+                if end < text_end:
+                    for boundary in ["। ", ". ", "? ", "! ", "\n"]:
+                        pos = buffer.rfind(boundary, start - buffer_offset, end - buffer_offset)
+                        if pos != -1:
+                            end = buffer_offset + pos + 1
+                            break
+
+                raw_text = buffer[start - buffer_offset:end - buffer_offset]
+                chunk_text = raw_text.strip()
+
+                if chunk_text:
+                    # Pages from the first/last real character, not the
+                    # space that joins two pages
+                    first = start + len(raw_text) - len(raw_text.lstrip())
+                    last = start + len(raw_text.rstrip()) - 1
+                    chunks.append({
+                        "text": chunk_text,
+                        "source": filename,
+                        "chunk_id": len(chunks),
+                        "start_char": start,
+                        "end_char": end,
+                        "page_start": page_at(first),
+                        "page_end": page_at(last)
+                    })
+
+                start = max(end - self.chunk_overlap, start + 1)
+
+            # Drop text that can no longer be part of a chunk
+            if start > buffer_offset:
+                buffer = buffer[start - buffer_offset:]
+                buffer_offset = start
+
+        for page_num, page_text in pages:
+            if not page_text:
+                continue
+
+            if total_length:
+                page_text = " " + page_text
+
+            # Trim very large documents
+            if total_length + len(page_text) > self.MAX_TEXT_LENGTH:
+                page_text = page_text[:self.MAX_TEXT_LENGTH - total_length]
+                trimmed = True
+
+            page_starts.append(total_length + (1 if total_length else 0))
+            page_numbers.append(page_num)
+            buffer += page_text
+            total_length += len(page_text)
+
+            emit(final=False)
+
+            if trimmed or len(chunks) >= self.MAX_CHUNKS_PER_DOC:
+                break
+
+        if trimmed:
+            logger.warning(f"⚠️ Trimming large document: {filename}")
+
+        if total_length < 50:
+            return []
+
+        emit(final=True)
 
         logger.info(f"📝 Chunked {filename}: {len(chunks)} chunks")
         return chunks
@@ -0,0 +1,181 @@
+"""
+Context Builder - Deduplicated, token-budgeted LLM context
+
+Retrieved chunks overlap (CHUNK_OVERLAP) and often sit next to each other
+in the same document. Chunks from one source that overlap or touch are
+merged into a single segment with the repeated text removed; segments
+are then packed in relevance order until RAG_CONTEXT_TOKENS (counted
+with the LLM's tokenizer, see utils.token_counter) is used up.
+"""
+
+import os
+from typing import Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+from utils.token_counter import TokenCounter, get_token_counter
+
+
+# Segments smaller than this aren't worth truncating into the leftover budget
+MIN_SEGMENT_TOKENS = 40
+
+
+class BuiltContext(NamedTuple):
+    text: str
+    results: List[Dict]   # results that made it into the context
+    tokens: int
+
+
+def format_citation(result: Dict[str, any]) -> str:
+    """
+    Source name with page range, e.g. "Budget.pdf, पृष्ठ 3-4"
+    """
+    page_start = result.get('page_start')
+    page_end = result.get('page_end')
+
+    if page_start is None:
+        return result['source']
+    if page_end is None or page_end == page_start:
+        return f"{result['source']}, पृष्ठ {page_start}"
+    return f"{result['source']}, पृष्ठ {page_start}-{page_end}"
+
+
+def merge_overlap(first: str, second: str, max_overlap: int = 400, min_overlap: int = 12) -> str:
+    """
+    first + second without the text they share (suffix of first == prefix of second)
+    """
+    probe = second[:min(len(second), min_overlap)]
+    if not probe:
+        return first
+
+    window_start = max(0, len(first) - max_overlap)
+    if second in first[window_start:]:
+        return first
+
+    pos = first.find(probe, window_start)
+    while pos != -1:
+        shared = len(first) - pos
+        if second.startswith(first[pos:]):
+            return first + second[shared:]
+        pos = first.find(probe, pos + 1)
+
+    return f"{first} {second}"
+
+
+class ContextBuilder:
+    def __init__(self, token_budget: int = None, counter: Optional[TokenCounter] = None):
+        self.token_budget = token_budget or int(os.getenv('RAG_CONTEXT_TOKENS', 900))
+        self.counter = counter or get_token_counter()
+
+    # ------------------------------------------------------------------
+    # 🔹 MERGE
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _position(result: Dict) -> Optional[tuple]:
+        """(start, end) in document characters, or None when unknown"""
+        if result.get('start_char') is not None and result.get('end_char') is not None:
+            return result['start_char'], result['end_char']
+        return None
+
+    def merge_segments(self, results: List[Dict]) -> List[Dict]:
+        """
+        Merge overlapping/adjacent chunks of the same source
+
+        Returns segments in relevance order (rank of their best chunk),
+        each with merged 'text', page range and member 'results'.
+        """
+        by_source: Dict[str, List[tuple]] = {}
+        for rank, result in enumerate(results):
+            by_source.setdefault(result.get('source', 'unknown'), []).append((rank, result))
+
+        segments = []
+        for source, items in by_source.items():
+            # Document order; chunks without offsets fall back to chunk_id
+            items.sort(key=lambda item: (
+                self._position(item[1]) or (item[1].get('chunk_id', -1), item[1].get('chunk_id', -1))
+            ))
+
+            current = None
+            for rank, result in items:
+                position = self._position(result)
+
+                if current is not None and self._adjacent(current, result):
+                    current['text'] = merge_overlap(current['text'], result['text'])
+                    current['rank'] = min(current['rank'], rank)
+                    if position is not None and current['end'] is not None:
+                        current['end'] = max(current['end'], position[1])
+                    current['last_chunk_id'] = result.get('chunk_id', -1)
+                    if result.get('page_end') is not None:
+                        current['page_end'] = max(current['page_end'] or 0, result['page_end'])
+                    current['results'].append(result)
+                    continue
+
+                if current is not None:
+                    segments.append(current)
+                current = {
+                    'source': source,
+                    'text': result['text'],
+                    'rank': rank,
+                    'end': position[1] if position else None,
+                    'last_chunk_id': result.get('chunk_id', -1),
+                    'page_start': result.get('page_start'),
+                    'page_end': result.get('page_end'),
+                    'results': [result],
+                }
+            segments.append(current)
+
+        segments.sort(key=lambda s: s['rank'])
+        return segments
+
+    def _adjacent(self, segment: Dict, result: Dict) -> bool:
+        position = self._position(result)
+        if position is not None and segment['end'] is not None:
+            return position[0] <= segment['end']
+        chunk_id = result.get('chunk_id', -1)
+        return chunk_id >= 0 and chunk_id == segment['last_chunk_id'] + 1
+
+    # ------------------------------------------------------------------
+    # 🔹 PACK
+    # ------------------------------------------------------------------
+    def build(self, results: List[Dict], token_budget: int = None, headers: bool = True) -> BuiltContext:
+        """
+        Context text within the token budget
+
+        headers=True prefixes each segment with "संदर्भ i (स्रोत: ...)" like
+        Retriever.format_context always did; False joins plain texts.
+        """
+        if not results:
+            return BuiltContext("", [], 0)
+
+        budget = token_budget or self.token_budget
+        segments = self.merge_segments(results)
+
+        parts, used, total = [], [], 0
+        for segment in segments:
+            header = (
+                f"संदर्भ {len(parts) + 1} (स्रोत: {format_citation(segment)}):\n" if headers else ""
+            )
+            text = segment['text']
+            cost = self.counter.count(header + text) + 1
+
+            if total + cost > budget:
+                remaining = budget - total - self.counter.count(header) - 1
+                # Always keep something from the best segment
+                if remaining < MIN_SEGMENT_TOKENS and parts:
+                    continue
+                text = self.counter.truncate(text, remaining)
+                if not text:
+                    continue
+                cost = self.counter.count(header + text) + 1
+
+            parts.append(f"{header}{text}\n" if headers else text)
+            used.extend(segment['results'])
+            total += cost
+
+        context = "\n".join(parts) if headers else "\n\n".join(parts)
+
+        logger.info(
+            f"🧩 Context: {len(results)} chunks -> {len(segments)} segments, "
+            f"{len(parts)} packed, ~{total}/{budget} tokens"
+        )
+        return BuiltContext(context, used, total)
@@ -65,6 +65,23 @@ class Embedder:
         """
         return self.embed_text(query)
 
+    def embed_queries(self, queries: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Embed several queries in one forward pass
+
+        Returns:
+            numpy array of shape (n_queries, embedding_dim)
+        """
+        if not queries:
+            return np.zeros((0, self.dimension), dtype="float32")
+
+        return self.model.encode(
+            list(queries),
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True
+        )
+
 
 # Test function
 if __name__ == "__main__":
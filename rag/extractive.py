@@ -0,0 +1,132 @@
+"""
+Extractive Answerer - Answer straight from a high-confidence chunk
+
+When the top retrieved chunk's calibrated score clears
+RAG_EXTRACTIVE_MIN_SCORE, its sentences are scored against the question
+and the best one or two are returned verbatim with the source - no LLM
+call. Anything less certain returns None and the caller generates as
+usual.
+
+Scorers (RAG_EXTRACTIVE_SCORER):
+    lexical    share of the question's content words found in the sentence
+    embedding  cosine of sentence and question embeddings (cross-lingual)
+"""
+
+import os
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from .bm25 import tokenize
+from .context_builder import format_citation
+
+
+# Sentence ends: danda/?/! + space, "." + space + a likely sentence start
+# (so abbreviations like "p.a. to banks" stay whole), or a newline
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[।?!])\s+|(?<=\.)\s+(?=[A-Z0-9(\u0900-\u097F])|\n+")
+
+# Question words and fillers that say nothing about the answer
+STOPWORDS = {
+    "क्या", "है", "हैं", "की", "के", "का", "में", "से", "को", "और", "कैसे", "कौन", "कितना",
+    "कितनी", "कब", "कहाँ", "होता", "होती", "मिलता", "मिलती", "बताओ", "बताइए", "मुझे", "यह", "वह",
+    "what", "is", "are", "the", "a", "an", "of", "for", "in", "on", "to", "how", "which",
+    "who", "when", "where", "does", "do", "can", "i", "me", "my", "tell", "about", "and",
+}
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s and s.strip()]
+
+
+def content_tokens(text: str) -> List[str]:
+    return [t for t in tokenize(text) if t not in STOPWORDS and len(t) > 1]
+
+
+class ExtractiveAnswerer:
+    def __init__(self, embedder=None):
+        self.min_score = float(os.getenv('RAG_EXTRACTIVE_MIN_SCORE', 0.85))
+        self.scorer = os.getenv('RAG_EXTRACTIVE_SCORER', 'lexical').lower()
+        self.min_overlap = float(os.getenv('RAG_EXTRACTIVE_MIN_OVERLAP', 0.6))
+        self.min_similarity = float(os.getenv('RAG_EXTRACTIVE_MIN_SIM', 0.6))
+        self.max_sentences = int(os.getenv('RAG_EXTRACTIVE_MAX_SENTENCES', 2))
+        self.embedder = embedder
+
+        if self.scorer == 'embedding' and embedder is None:
+            logger.warning("⚠️ Embedding scorer needs an embedder, using lexical")
+            self.scorer = 'lexical'
+
+    # ------------------------------------------------------------------
+    # 🔹 SCORING
+    # ------------------------------------------------------------------
+    def _lexical_scores(self, question: str, sentences: List[str]) -> np.ndarray:
+        wanted = set(content_tokens(question))
+        if not wanted:
+            return np.zeros(len(sentences))
+        return np.array([
+            len(wanted & set(tokenize(sentence))) / len(wanted)
+            for sentence in sentences
+        ])
+
+    def _embedding_scores(self, question: str, sentences: List[str]) -> np.ndarray:
+        vectors = self.embedder.embed_queries([question] + sentences).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+        return vectors[1:] @ vectors[0]
+
+    # ------------------------------------------------------------------
+    # 🔹 ANSWER
+    # ------------------------------------------------------------------
+    def answer(self, question: str, results: List[Dict]) -> Optional[Dict[str, any]]:
+        """
+        {'answer', 'sources', 'confidence', 'sentences'} or None
+        """
+        if not results:
+            return None
+
+        top = results[0]
+        top_score = top.get('calibrated_score', 0.0)
+        if top_score < self.min_score:
+            return None
+
+        # Sentences from every hit that is itself confident, in rank order
+        candidates = []
+        for result in results:
+            if result.get('calibrated_score', 0.0) < self.min_score:
+                break
+            for position, sentence in enumerate(split_sentences(result['text'])):
+                if len(sentence) >= 20:
+                    candidates.append((result, position, sentence))
+
+        if not candidates:
+            return None
+
+        sentences = [sentence for _, _, sentence in candidates]
+        if self.scorer == 'embedding':
+            scores = self._embedding_scores(question, sentences)
+            threshold = self.min_similarity
+        else:
+            scores = self._lexical_scores(question, sentences)
+            threshold = self.min_overlap
+
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            logger.info(f"ℹ️ Extractive: best sentence {scores[best]:.2f} < {threshold}, using LLM")
+            return None
+
+        # Best sentence, plus the next one from the same chunk if it also scores
+        result, position, sentence = candidates[best]
+        picked = [sentence]
+        for (other, other_pos, other_sentence), score in zip(candidates[best + 1:], scores[best + 1:]):
+            if len(picked) >= self.max_sentences:
+                break
+            if other is result and other_pos == position + len(picked) and score >= threshold / 2:
+                picked.append(other_sentence)
+
+        logger.info(f"⚡ Extractive answer (score {scores[best]:.2f}, hit {top_score:.2f})")
+        return {
+            'answer': " ".join(picked),
+            'sources': [format_citation(result)],
+            'confidence': round(float(result.get('calibrated_score', top_score)), 2),
+            'sentences': picked,
+        }
@@ -0,0 +1,169 @@
+"""
+Metadata Index - Per-attribute posting lists over chunk ids
+
+Source file, language and scheme tags map to sorted id arrays, page ranges
+to per-chunk arrays. select() turns a filter dict into the allowed id set
+that VectorStore hands to FAISS as an IDSelector (and BM25 as a mask), so
+filtering happens inside the search instead of by over-fetching.
+
+Filters (all optional, combined with AND; list values are OR'ed):
+    source:    file name or part of it, e.g. "Budget.pdf" / ["kcc", "budget"]
+    language:  "hindi" / "english"
+    scheme:    tag or any alias, e.g. "kcc", "Kisan Credit Card", "मुद्रा"
+    page_from / page_to: chunk page range must overlap [page_from, page_to]
+"""
+
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+from utils.keyword_matcher import KeywordMatcher
+from utils.language_utils import detect_language
+
+
+# alias (lowercase) -> scheme tag
+SCHEME_TAGS: Dict[str, str] = {
+    "mudra": "mudra", "मुद्रा": "mudra", "shishu": "mudra", "kishore": "mudra", "tarun": "mudra",
+    "kisan credit card": "kcc", "kcc": "kcc", "किसान क्रेडिट कार्ड": "kcc",
+    "pm kisan": "pm-kisan", "pm-kisan": "pm-kisan", "किसान सम्मान निधि": "pm-kisan",
+    "fasal bima": "pmfby", "pmfby": "pmfby", "फसल बीमा": "pmfby",
+    "pmegp": "pmegp", "employment generation programme": "pmegp",
+    "stand up india": "stand-up-india", "stand-up india": "stand-up-india",
+    "svanidhi": "svanidhi", "स्वनिधि": "svanidhi",
+    "jan dhan": "jan-dhan", "जन धन": "jan-dhan",
+    "self help group": "shg", "shg": "shg", "स्वयं सहायता समूह": "shg",
+    "cgtmse": "cgtmse", "credit guarantee": "cgtmse",
+    "ahidf": "ahidf", "animal husbandry infrastructure": "ahidf", "पशुपालन": "ahidf",
+    "nabard": "nabard", "नाबार्ड": "nabard",
+    "msme": "msme", "micro and small enterprise": "msme", "सूक्ष्म": "msme",
+}
+
+FILTER_KEYS = {"source", "language", "scheme", "page_from", "page_to"}
+
+
+def _as_list(value: Union[str, Iterable[str]]) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+class MetadataIndex:
+    def __init__(self):
+        self.n_docs = 0
+        self.postings: Dict[str, Dict[str, np.ndarray]] = {}
+        self.page_start = np.zeros(0, dtype=np.float64)  # NaN = unknown page
+        self.page_end = np.zeros(0, dtype=np.float64)
+        self.scheme_matcher = KeywordMatcher(SCHEME_TAGS)
+
+    @classmethod
+    def build(cls, chunks: List[Dict]) -> "MetadataIndex":
+        index = cls()
+        index.n_docs = len(chunks)
+
+        buckets: Dict[str, Dict[str, List[int]]] = {"source": {}, "language": {}, "scheme": {}}
+        index.page_start = np.full(len(chunks), np.nan)
+        index.page_end = np.full(len(chunks), np.nan)
+
+        for i, chunk in enumerate(chunks):
+            text = chunk.get("text", "")
+            buckets["source"].setdefault(chunk.get("source", "unknown"), []).append(i)
+            buckets["language"].setdefault(detect_language(text), []).append(i)
+            for tag in {m.value for m in index.scheme_matcher.iter_matches(text)}:
+                buckets["scheme"].setdefault(tag, []).append(i)
+
+            if chunk.get("page_start") is not None:
+                index.page_start[i] = chunk["page_start"]
+                index.page_end[i] = chunk.get("page_end") or chunk["page_start"]
+
+        index.postings = {
+            attr: {value: np.asarray(ids, dtype=np.int64) for value, ids in values.items()}
+            for attr, values in buckets.items()
+        }
+
+        logger.info(
+            f"🏷️ Metadata index: {len(index.postings['source'])} sources, "
+            f"{len(index.postings['scheme'])} scheme tags over {index.n_docs} chunks"
+        )
+        return index
+
+    def values(self, attribute: str) -> List[str]:
+        """Known values of an attribute (sources, languages, scheme tags)"""
+        return sorted(self.postings.get(attribute, {}))
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def select(self, filters: Optional[Dict]) -> Optional[np.ndarray]:
+        """
+        Sorted int64 ids matching all filters
+
+        Returns None when nothing is filtered (search everything) and an
+        empty array when the filters exclude every chunk.
+        """
+        filters = {k: v for k, v in (filters or {}).items() if v not in (None, "", [])}
+        if not filters:
+            return None
+
+        unknown = set(filters) - FILTER_KEYS
+        if unknown:
+            raise ValueError(f"Unknown filter(s): {', '.join(sorted(unknown))}")
+
+        selected: Optional[np.ndarray] = None
+
+        def narrow(ids: np.ndarray):
+            nonlocal selected
+            selected = ids if selected is None else np.intersect1d(selected, ids, assume_unique=True)
+
+        if "source" in filters:
+            narrow(self._union("source", self._match_sources(filters["source"])))
+        if "language" in filters:
+            narrow(self._union("language", [v.lower() for v in _as_list(filters["language"])]))
+        if "scheme" in filters:
+            narrow(self._union("scheme", self._match_schemes(filters["scheme"])))
+        if "page_from" in filters or "page_to" in filters:
+            narrow(self._page_range(filters.get("page_from"), filters.get("page_to")))
+
+        return selected
+
+    def _union(self, attribute: str, values: Iterable[str]) -> np.ndarray:
+        postings = self.postings.get(attribute, {})
+        arrays = [postings[v] for v in values if v in postings]
+        if not arrays:
+            return np.zeros(0, dtype=np.int64)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays))
+
+    def _match_sources(self, wanted) -> List[str]:
+        """Exact file name, else case-insensitive substring"""
+        sources = self.postings.get("source", {})
+        matched = []
+        for value in _as_list(wanted):
+            if value in sources:
+                matched.append(value)
+                continue
+            needle = value.lower()
+            matched.extend(s for s in sources if needle in s.lower())
+        return matched
+
+    def _match_schemes(self, wanted) -> List[str]:
+        """Tags given directly or via any alias the matcher knows"""
+        tags = set()
+        for value in _as_list(wanted):
+            value = value.strip().lower()
+            if value in self.postings.get("scheme", {}):
+                tags.add(value)
+            tags.update(m.value for m in self.scheme_matcher.iter_matches(value))
+        return sorted(tags)
+
+    def _page_range(self, page_from: Optional[int], page_to: Optional[int]) -> np.ndarray:
+        """Chunks whose page span overlaps the range; unknown pages never match"""
+        mask = ~np.isnan(self.page_start)
+        with np.errstate(invalid="ignore"):
+            if page_from is not None:
+                mask &= self.page_end >= page_from
+            if page_to is not None:
+                mask &= self.page_start <= page_to
+        return np.flatnonzero(mask).astype(np.int64)
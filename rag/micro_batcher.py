@@ -0,0 +1,152 @@
+"""
+Micro-batcher - Coalesces concurrent retrievals into one batched search
+
+Requests arriving from different threads (API worker pool, bot executor)
+are queued; a single worker waits at most RAG_BATCH_MAX_WAIT_MS after the
+first one, then embeds and searches the whole group with
+Retriever.retrieve_batch. One encoder forward pass + one FAISS call serve
+the group instead of N of each.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .retriever import Retriever
+
+
+_STOP = object()
+
+
+class RetrievalBatcher:
+    def __init__(self, retriever: Retriever, max_batch: int = None, max_wait_ms: float = None):
+        self.retriever = retriever
+        self.max_batch = max_batch or int(os.getenv('RAG_BATCH_MAX_SIZE', 16))
+        if max_wait_ms is None:
+            max_wait_ms = float(os.getenv('RAG_BATCH_MAX_WAIT_MS', 5))
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self.batches = 0
+        self.queries = 0
+
+    # ------------------------------------------------------------------
+    # 🔹 PUBLIC API
+    # ------------------------------------------------------------------
+    def submit(self, query: str, top_k: int = None, filters: Dict = None) -> Future:
+        """Queue a query; the future resolves to retrieve()-style results"""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((query, top_k, filters or None, future))
+        return future
+
+    def retrieve(
+        self,
+        query: str,
+        top_k: int = None,
+        filters: Dict = None,
+        timeout: float = None
+    ) -> List[Dict[str, any]]:
+        """Blocking drop-in for Retriever.retrieve"""
+        return self.submit(query, top_k, filters).result(timeout=timeout)
+
+    def close(self):
+        """Stop the worker after it drains the queue"""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'batches': self.batches,
+            'queries': self.queries,
+            'avg_batch_size': round(self.queries / self.batches, 2) if self.batches else 0.0
+        }
+
+    # ------------------------------------------------------------------
+    # 🔹 WORKER
+    # ------------------------------------------------------------------
+    def _ensure_worker(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="rag-micro-batcher", daemon=True
+                )
+                self._thread.start()
+                logger.info(
+                    f"🧺 Retrieval micro-batcher started "
+                    f"(max_batch={self.max_batch}, max_wait={self.max_wait * 1000:.0f}ms)"
+                )
+
+    def _collect(self) -> Tuple[List[tuple], bool]:
+        """Block for the first request, then gather more until full or timed out"""
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self):
+        while True:
+            batch, stop = self._collect()
+            if batch:
+                self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[tuple]):
+        # retrieve_batch takes one top_k and filter set, so group by them
+        groups: Dict[Tuple[Optional[int], Optional[str]], List[tuple]] = {}
+        for item in batch:
+            filters_key = json.dumps(item[2], sort_keys=True, default=str) if item[2] else None
+            groups.setdefault((item[1], filters_key), []).append(item)
+
+        for (top_k, _), items in groups.items():
+            live = [item for item in items if item[3].set_running_or_notify_cancel()]
+            if not live:
+                continue
+            try:
+                results = self.retriever.retrieve_batch(
+                    [query for query, _, _, _ in live], top_k=top_k, filters=live[0][2]
+                )
+            except Exception as e:
+                logger.error(f"❌ Batched retrieval failed: {e}")
+                for item in live:
+                    item[3].set_exception(e)
+                continue
+
+            for item, result in zip(live, results):
+                item[3].set_result(result)
+
+        self.batches += 1
+        self.queries += len(batch)
+        if len(batch) > 1:
+            logger.debug(f"🧺 Served {len(batch)} queries in one retrieval batch")
@@ -4,34 +4,60 @@ Handles Hindi and English text
 """
 
 import os
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple
 from pypdf import PdfReader
 from loguru import logger
-import re
+
+from utils.text_normalizer import clean_pdf_text
 
 
 class PDFLoader:
     def __init__(self, pdf_directory: str = "data/pdfs"):
         self.pdf_directory = pdf_directory
-        
+
+    def iter_pages(self, filepath: str) -> Iterator[Tuple[int, str]]:
+        """
+        Stream a PDF page by page
+
+        Yields:
+            (page_number, cleaned_text) for every page with text.
+            Page numbers are 1-based, matching the printed PDF.
+        """
+        yield from self._iter_reader_pages(PdfReader(filepath))
+
+    def _iter_reader_pages(self, reader: PdfReader) -> Iterator[Tuple[int, str]]:
+        for page_num, page in enumerate(reader.pages, 1):
+            page_text = page.extract_text()
+            if not page_text:
+                continue
+
+            page_text = self._clean_text(page_text)
+            if page_text:
+                yield page_num, page_text
+
     def load_single_pdf(self, filepath: str) -> Dict[str, str]:
         """
         Load a single PDF and extract text
         
         Returns:
-            Dict with 'filename', 'text', 'pages'
+            Dict with 'filename', 'text', 'pages', 'source' and
+            'page_spans' - list of (page_number, start_char, end_char)
+            locating each page inside 'text'
         """
         try:
             reader = PdfReader(filepath)
-            text = ""
-            
-            for page_num, page in enumerate(reader.pages, 1):
-                page_text = page.extract_text()
-                if page_text:
-                    text += f"\n--- Page {page_num} ---\n{page_text}"
-            
-            # Clean text
-            text = self._clean_text(text)
+            parts = []
+            page_spans = []
+            offset = 0
+
+            for page_num, page_text in self._iter_reader_pages(reader):
+                if parts:
+                    offset += 1  # single space joining pages
+                page_spans.append((page_num, offset, offset + len(page_text)))
+                parts.append(page_text)
+                offset += len(page_text)
+
+            text = " ".join(parts)
             
             filename = os.path.basename(filepath)
             logger.info(f"✅ Loaded {filename}: {len(text)} characters")
@@ -40,29 +66,39 @@ class PDFLoader:
                 'filename': filename,
                 'text': text,
                 'pages': len(reader.pages),
+                'page_spans': page_spans,
                 'source': filepath
             }
             
         except Exception as e:
             logger.error(f"❌ Error loading {filepath}: {e}")
             return None
+
+    def list_pdfs(self) -> List[str]:
+        """
+        Paths of all PDFs in the directory
+        """
+        if not os.path.exists(self.pdf_directory):
+            logger.warning(f"📁 PDF directory not found: {self.pdf_directory}")
+            return []
+
+        return [
+            os.path.join(self.pdf_directory, f)
+            for f in sorted(os.listdir(self.pdf_directory))
+            if f.endswith('.pdf')
+        ]
     
     def load_all_pdfs(self) -> List[Dict[str, str]]:
         """
         Load all PDFs from the directory
         """
         documents = []
-        
-        if not os.path.exists(self.pdf_directory):
-            logger.warning(f"📁 PDF directory not found: {self.pdf_directory}")
-            return documents
-        
-        pdf_files = [f for f in os.listdir(self.pdf_directory) if f.endswith('.pdf')]
+
+        pdf_files = self.list_pdfs()
         
         logger.info(f"📚 Found {len(pdf_files)} PDFs to load")
         
-        for pdf_file in pdf_files:
-            filepath = os.path.join(self.pdf_directory, pdf_file)
+        for filepath in pdf_files:
             doc = self.load_single_pdf(filepath)
             if doc:
                 documents.append(doc)
@@ -74,16 +110,7 @@ class PDFLoader:
         """
         Clean extracted text - handle Hindi/English mixed content
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep Hindi/English
-        text = re.sub(r'[^\w\s\u0900-\u097F.,;:!?()\-\'\"\/]', '', text)
-        
-        # Remove page numbers pattern
-        text = re.sub(r'Page \d+', '', text)
-        
-        return text.strip()
+        return clean_pdf_text(text)
 
 
 # Test function
@@ -91,4 +118,4 @@ if __name__ == "__main__":
     loader = PDFLoader()
     docs = loader.load_all_pdfs()
     for doc in docs:
-        print(f"📄 {doc['filename']}: {doc['pages']} pages, {len(doc['text'])} chars")
\ No newline at end of file
+        print(f"📄 {doc['filename']}: {doc['pages']} pages, {len(doc['text'])} chars")
@@ -1,29 +1,18 @@
 """
 Prompt Templates - Multilingual prompts for RAG
 Optimized for rural users with simple Hindi explanations
+
+Static instruction blocks are module constants built once at import and
+sent as the system message, so every request shares an identical prefix
+(provider-side prefix caching, LLMClient's response cache). Variable
+content - context, then the question - goes last in the user message.
 """
 
-from typing import List, Dict
+from typing import Dict, List, Tuple
 
 
-class PromptTemplate:
-    """
-    Prompt templates for different use cases
-    """
-    
-    @staticmethod
-    def get_rag_prompt(query: str, context: str, language: str = "hindi") -> str:
-        """
-        Generate RAG prompt with context
-        
-        Args:
-            query: User question
-            context: Retrieved context from documents
-            language: Response language (hindi/english)
-        """
-        
-        if language.lower() == "hindi":
-            prompt = f"""तुम एक ग्रामीण सहायक बॉट हो जो गाँव के लोगों को बैंकिंग और सरकारी योजनाओं के बारे में सरल हिंदी में समझाता है।
+RAG_SYSTEM_PROMPTS: Dict[str, str] = {
+    "hindi": """तुम एक ग्रामीण सहायक बॉट हो जो गाँव के लोगों को बैंकिंग और सरकारी योजनाओं के बारे में सरल हिंदी में समझाता है।
 
 **नियम:**
 1. बहुत ही सरल और आसान भाषा का उपयोग करो
@@ -31,18 +20,9 @@ class PromptTemplate:
 3. उदाहरण देकर समझाओ
 4. केवल दिए गए संदर्भ (Context) की जानकारी का उपयोग करो
 5. अगर जानकारी नहीं है तो साफ़-साफ़ बताओ
-6. 3-4 वाक्यों में जवाब दो (जब तक ज्यादा विस्तार न माँगा जाए)
-
-**संदर्भ (Context):**
-{context}
+6. 3-4 वाक्यों में जवाब दो (जब तक ज्यादा विस्तार न माँगा जाए)""",
 
-**प्रश्न:**
-{query}
-
-**जवाब (सरल हिंदी में):**"""
-
-        else:  # English
-            prompt = f"""You are Gramin Sahayak, a helpful assistant for rural users explaining banking and government schemes in simple language.
+    "english": """You are Gramin Sahayak, a helpful assistant for rural users explaining banking and government schemes in simple language.
 
 **Rules:**
 1. Use very simple language
@@ -50,58 +30,120 @@ class PromptTemplate:
 3. Give examples
 4. Only use information from the given Context
 5. If information is not available, clearly state that
-6. Keep answer to 3-4 sentences (unless more detail is requested)
+6. Keep answer to 3-4 sentences (unless more detail is requested)""",
+}
 
-**Context:**
+RAG_USER_TEMPLATES: Dict[str, str] = {
+    "hindi": """**संदर्भ (Context):**
 {context}
 
-**Question:**
+**प्रश्न:**
 {query}
 
-**Answer (in simple language):**"""
+**जवाब (सरल हिंदी में):**""",
 
-        return prompt
-    
-    @staticmethod
-    def get_scheme_explanation_prompt(scheme_name: str, context: str) -> str:
-        """
-        Prompt for explaining government schemes
-        """
-        prompt = f"""नीचे दी गई जानकारी के आधार पर "{scheme_name}" योजना को बहुत ही सरल हिंदी में समझाओ।
-
-**जानकारी:**
+    "english": """**Context:**
 {context}
 
+**Question:**
+{query}
+
+**Answer (in simple language):**""",
+}
+
+SCHEME_SYSTEM_PROMPT = """नीचे दी गई जानकारी के आधार पर बताई गई योजना को बहुत ही सरल हिंदी में समझाओ।
+
 **निम्नलिखित बिंदुओं को शामिल करो:**
 1. यह योजना क्या है? (1 वाक्य)
 2. यह किसके लिए है? (पात्रता)
 3. कितना लोन मिल सकता है?
 4. ब्याज दर क्या है?
-5. कैसे आवेदन करें?
+5. कैसे आवेदन करें?"""
+
+SCHEME_USER_TEMPLATE = """**जानकारी:**
+{context}
+
+**योजना:** {scheme_name}
 
 **जवाब (सरल हिंदी में, गाँव के व्यक्ति को समझाने के लिए):**"""
-        
-        return prompt
-    
-    @staticmethod
-    def get_term_explanation_prompt(term: str, context: str) -> str:
-        """
-        Prompt for explaining banking terms
-        """
-        prompt = f""""{term}" का मतलब बहुत ही सरल हिंदी में समझाओ, जैसे किसी गाँव के व्यक्ति को समझा रहे हो।
 
-**संदर्भ:**
-{context}
+TERM_SYSTEM_PROMPT = """दिए गए शब्द का मतलब बहुत ही सरल हिंदी में समझाओ, जैसे किसी गाँव के व्यक्ति को समझा रहे हो।
 
 **नियम:**
 1. एकदम आसान शब्दों में
 2. रोजमर्रा की भाषा में
 3. उदाहरण के साथ
-4. 2-3 वाक्यों में
+4. 2-3 वाक्यों में"""
+
+TERM_USER_TEMPLATE = """**संदर्भ:**
+{context}
+
+**शब्द:** {term}
 
 **जवाब:**"""
-        
-        return prompt
+
+
+class PromptTemplate:
+    """
+    Prompt templates for different use cases
+    """
+    
+    @staticmethod
+    def get_rag_messages(query: str, context: str, language: str = "hindi") -> Tuple[str, str]:
+        """
+        (system prompt, user message) for RAG
+
+        Args:
+            query: User question
+            context: Retrieved context from documents
+            language: Response language (hindi/english)
+        """
+        key = "hindi" if language.lower() == "hindi" else "english"
+        return (
+            RAG_SYSTEM_PROMPTS[key],
+            RAG_USER_TEMPLATES[key].format(context=context, query=query)
+        )
+
+    @staticmethod
+    def get_rag_prompt(query: str, context: str, language: str = "hindi") -> str:
+        """
+        Single-string RAG prompt (system block + user message)
+        """
+        return "\n\n".join(PromptTemplate.get_rag_messages(query, context, language))
+    
+    @staticmethod
+    def get_scheme_explanation_messages(scheme_name: str, context: str) -> Tuple[str, str]:
+        """
+        (system prompt, user message) for explaining government schemes
+        """
+        return (
+            SCHEME_SYSTEM_PROMPT,
+            SCHEME_USER_TEMPLATE.format(context=context, scheme_name=scheme_name)
+        )
+
+    @staticmethod
+    def get_scheme_explanation_prompt(scheme_name: str, context: str) -> str:
+        """
+        Prompt for explaining government schemes
+        """
+        return "\n\n".join(PromptTemplate.get_scheme_explanation_messages(scheme_name, context))
+    
+    @staticmethod
+    def get_term_explanation_messages(term: str, context: str) -> Tuple[str, str]:
+        """
+        (system prompt, user message) for explaining banking terms
+        """
+        return (
+            TERM_SYSTEM_PROMPT,
+            TERM_USER_TEMPLATE.format(context=context, term=term)
+        )
+
+    @staticmethod
+    def get_term_explanation_prompt(term: str, context: str) -> str:
+        """
+        Prompt for explaining banking terms
+        """
+        return "\n\n".join(PromptTemplate.get_term_explanation_messages(term, context))
     
     @staticmethod
     def get_no_context_prompt(query: str) -> str:
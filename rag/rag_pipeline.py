@@ -3,7 +3,8 @@ RAG Pipeline - End-to-end RAG workflow
 Orchestrates PDF loading, chunking, embedding, indexing, and retrieval
 """
 
-from typing import Dict
+import os
+from typing import Dict, List, Tuple
 from loguru import logger
 
 from .pdf_loader import PDFLoader
@@ -11,6 +12,8 @@ from .chunker import TextChunker
 from .embedder import Embedder
 from .vector_store import VectorStore
 from .retriever import Retriever
+from .micro_batcher import RetrievalBatcher
+from .reranker import Reranker
 from .prompt import PromptTemplate
 
 
@@ -19,6 +22,13 @@ class RAGPipeline:
     Complete RAG pipeline for document Q&A
     """
 
+    # Extra phrasings searched alongside the scheme name (multi-query)
+    SCHEME_QUERY_VARIANTS = [
+        "{scheme} पात्रता eligibility",
+        "{scheme} ब्याज दर interest rate",
+        "{scheme} आवेदन कैसे करें how to apply",
+    ]
+
     def __init__(self, pdf_directory: str = "data/pdfs"):
         self.pdf_directory = pdf_directory
 
@@ -28,8 +38,17 @@ class RAGPipeline:
         self.embedder = Embedder()
         self.vector_store = VectorStore()
         self.retriever = None
+        self.batcher = None
         self.prompt_template = PromptTemplate()
 
+        # Coalesce concurrent queries into batched searches
+        self.micro_batch = os.getenv('RAG_MICRO_BATCH', 'true').lower() == 'true'
+
+        # Optional cross-encoder rerank of over-fetched candidates
+        self.reranker = Reranker() if os.getenv('RAG_RERANK', 'false').lower() == 'true' else None
+        rerank_top_k = os.getenv('RERANK_TOP_K')
+        self.rerank_top_k = int(rerank_top_k) if rerank_top_k else None
+
         self.is_indexed = False
 
     def build_index(self, force_rebuild: bool = False):
@@ -40,30 +59,38 @@ class RAGPipeline:
         # Try loading existing index
         if not force_rebuild and self.vector_store.load():
             logger.info("✅ Loaded existing index")
-            self.retriever = Retriever(self.vector_store, self.embedder)
-            self.is_indexed = True
+            self._init_retriever()
             return
 
         logger.info("🔄 Building new index (memory-safe mode)...")
 
-        # Step 1: Load PDFs
+        # Step 1: Find PDFs
         logger.info("📚 Step 1/4: Loading PDFs...")
-        documents = self.pdf_loader.load_all_pdfs()
+        pdf_files = self.pdf_loader.list_pdfs()
 
-        if not documents:
+        if not pdf_files:
             logger.error("❌ No PDFs found! Please add PDFs to data/pdfs/")
             return
 
         total_chunks = 0
 
-        # Step 2–4: Process ONE document at a time
-        for i, doc in enumerate(documents, start=1):
+        # Step 2–4: Stream ONE document at a time, page by page
+        for i, filepath in enumerate(pdf_files, start=1):
+            filename = os.path.basename(filepath)
             logger.info(
-                f"✂️ Processing document {i}/{len(documents)}: {doc.get('filename', 'unknown')}"
+                f"✂️ Processing document {i}/{len(pdf_files)}: {filename}"
             )
 
-            # Step 2: Chunk document
-            chunks = self.chunker.chunk_document(doc)
+            # Step 2: Chunk document (pages are read lazily)
+            try:
+                chunks = self.chunker.chunk_pages(
+                    self.pdf_loader.iter_pages(filepath),
+                    filename
+                )
+            except Exception as e:
+                logger.error(f"❌ Error loading {filepath}: {e}")
+                continue
+
             if not chunks:
                 continue
 
@@ -83,24 +110,45 @@ class RAGPipeline:
             # Explicit cleanup (important on Windows)
             del chunks, texts, embeddings
 
+        if total_chunks == 0:
+            logger.error("❌ No text could be extracted from the PDFs")
+            return
+
         # Save index once
         self.vector_store.save()
 
         # Initialize retriever
-        self.retriever = Retriever(self.vector_store, self.embedder)
-        self.is_indexed = True
+        self._init_retriever()
 
         logger.info("✅ Index built successfully!")
         logger.info(f"📊 Total chunks indexed: {total_chunks}")
 
+    def _init_retriever(self):
+        self.retriever = Retriever(self.vector_store, self.embedder)
+        if self.micro_batch:
+            if self.batcher is not None:
+                self.batcher.close()
+            self.batcher = RetrievalBatcher(self.retriever)
+        self.is_indexed = True
+
+    def _retrieve(self, question: str, top_k: int, filters: Dict = None):
+        """Retrieve via the micro-batcher when enabled"""
+        if self.batcher is not None:
+            return self.batcher.retrieve(question, top_k=top_k, filters=filters)
+        return self.retriever.retrieve(question, top_k=top_k, filters=filters)
+
     def query(
         self,
         question: str,
         language: str = "hindi",
-        top_k: int = 3
+        top_k: int = 3,
+        filters: Dict = None
     ) -> Dict[str, any]:
         """
         Query the RAG system
+
+        filters narrow retrieval by source, language, scheme tag or page
+        range (see rag.metadata_index)
         """
 
         if not self.is_indexed:
@@ -115,8 +163,12 @@ class RAGPipeline:
                 "retrieved_chunks": []
             }
 
-        # Retrieve relevant chunks
-        results = self.retriever.retrieve(question, top_k=top_k)
+        # Retrieve relevant chunks (over-fetched when reranking)
+        if self.reranker is not None:
+            results = self._retrieve(question, top_k * self.reranker.overfetch, filters)
+            results = self.reranker.rerank(question, results, self.rerank_top_k or top_k)
+        else:
+            results = self._retrieve(question, top_k, filters)
 
         if not results:
             return {
@@ -126,14 +178,18 @@ class RAGPipeline:
                 "retrieved_chunks": []
             }
 
-        # Format context
-        context = self.retriever.retrieve_with_context(question, top_k=top_k)
+        # Format context from the same results (no second retrieval),
+        # deduplicated and packed to the token budget
+        built = self.retriever.context_builder.build(results)
+        context = built.text
 
-        # Extract sources
-        sources = list(set(r["source"] for r in results))
+        # Extract sources of the chunks that made it in (with page ranges when known)
+        sources = list(dict.fromkeys(
+            self.retriever.format_citation(r) for r in built.results
+        ))
 
-        # Generate final prompt
-        prompt = self.prompt_template.get_rag_prompt(
+        # Static system block + variable user message (context, question last)
+        system_prompt, user_prompt = self.prompt_template.get_rag_messages(
             question,
             context,
             language
@@ -142,7 +198,9 @@ class RAGPipeline:
         return {
             "context": context,
             "sources": sources,
-            "prompt": prompt,
+            "prompt": f"{system_prompt}\n\n{user_prompt}",
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
             "retrieved_chunks": results
         }
 
@@ -150,13 +208,22 @@ class RAGPipeline:
         """
         Explain a government scheme
         """
+        return "\n\n".join(self.scheme_messages(scheme_name, top_k))
+
+    def scheme_messages(self, scheme_name: str, top_k: int = 5) -> Tuple[str, str]:
+        """
+        (system prompt, user message) explaining a government scheme
+        """
         if not self.is_indexed:
             self.build_index()
 
-        results = self.retriever.retrieve(scheme_name, top_k=top_k)
-        context = "\n\n".join(r["text"] for r in results)
+        queries = [scheme_name] + [
+            variant.format(scheme=scheme_name) for variant in self.SCHEME_QUERY_VARIANTS
+        ]
+        results = self.retriever.retrieve_multi(queries, top_k=top_k)
+        context = self.retriever.context_builder.build(results, headers=False).text
 
-        return self.prompt_template.get_scheme_explanation_prompt(
+        return self.prompt_template.get_scheme_explanation_messages(
             scheme_name,
             context
         )
@@ -165,17 +232,36 @@ class RAGPipeline:
         """
         Explain a banking/financial term
         """
+        return "\n\n".join(self.term_messages(term, top_k))
+
+    def term_messages(self, term: str, top_k: int = 3) -> Tuple[str, str]:
+        """
+        (system prompt, user message) explaining a banking/financial term
+        """
         if not self.is_indexed:
             self.build_index()
 
         results = self.retriever.retrieve(term, top_k=top_k)
-        context = "\n\n".join(r["text"] for r in results)
+        context = self.retriever.context_builder.build(results, headers=False).text
 
-        return self.prompt_template.get_term_explanation_prompt(
+        return self.prompt_template.get_term_explanation_messages(
             term,
             context
         )
 
+    def get_filter_options(self) -> Dict[str, List[str]]:
+        """
+        Values accepted by the metadata filters
+        """
+        if not self.is_indexed:
+            self.build_index()
+
+        metadata = self.vector_store.metadata
+        if metadata is None:
+            return {"source": [], "language": [], "scheme": []}
+
+        return {attr: metadata.values(attr) for attr in ("source", "language", "scheme")}
+
     def get_stats(self) -> Dict[str, any]:
         """
         Get pipeline statistics
@@ -0,0 +1,182 @@
+"""
+Reranker - Cross-encoder rescoring of retrieved chunks (CPU)
+
+Retrieval over-fetches top_k × RERANK_OVERFETCH candidates; a small
+multilingual cross-encoder scores each (query, chunk) pair and the best
+are kept. Scoring runs in mini-batches against RERANK_BUDGET_MS; when the
+budget would be (or is) exceeded the dense order is returned instead, so
+reranking can only cost a bounded amount of latency.
+
+RERANKER_ONNX_PATH points at an exported (optionally int8-quantized)
+ONNX model, run with onnxruntime; otherwise sentence-transformers'
+CrossEncoder is used.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+class Reranker:
+    def __init__(self, model_name: str = None):
+        self.model_name = model_name or os.getenv(
+            'RERANKER_MODEL',
+            'cross-encoder/mmarco-mMiniLMv2-L12-H384-v1'
+        )
+        self.onnx_path = os.getenv('RERANKER_ONNX_PATH', '')
+        self.overfetch = max(1, int(os.getenv('RERANK_OVERFETCH', 4)))
+        self.budget_ms = float(os.getenv('RERANK_BUDGET_MS', 300))
+        self.batch_size = int(os.getenv('RERANK_BATCH_SIZE', 16))
+        self.max_length = int(os.getenv('RERANK_MAX_LENGTH', 256))
+
+        self._model = None
+        self._session = None
+        self._tokenizer = None
+        self._failed = False
+
+        # Running estimate of per-pair cost, used to skip hopeless batches
+        self._ms_per_pair: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # 🔹 MODEL LOADING (lazy)
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> bool:
+        if self._model is not None or self._session is not None:
+            return True
+        if self._failed:
+            return False
+
+        try:
+            if self.onnx_path:
+                self._load_onnx()
+            else:
+                from sentence_transformers import CrossEncoder
+
+                self._model = CrossEncoder(
+                    self.model_name, max_length=self.max_length, device='cpu'
+                )
+            logger.info(f"✅ Reranker loaded: {self.onnx_path or self.model_name}")
+            return True
+
+        except Exception as e:
+            self._failed = True
+            logger.warning(f"⚠️ Reranker unavailable ({e}), keeping dense order")
+            return False
+
+    def _load_onnx(self):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = int(os.getenv('RERANK_THREADS', os.cpu_count() or 1))
+
+        self._session = ort.InferenceSession(
+            self.onnx_path, options, providers=["CPUExecutionProvider"]
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+    # ------------------------------------------------------------------
+    # 🔹 SCORING
+    # ------------------------------------------------------------------
+    def _score(self, query: str, texts: List[str]) -> np.ndarray:
+        if self._session is None:
+            return np.asarray(
+                self._model.predict(
+                    [(query, t) for t in texts],
+                    batch_size=len(texts),
+                    show_progress_bar=False
+                ),
+                dtype=np.float32
+            ).reshape(-1)
+
+        encoded = self._tokenizer(
+            [query] * len(texts), texts,
+            padding=True, truncation=True,
+            max_length=self.max_length, return_tensors="np"
+        )
+        feeds = {k: v.astype(np.int64) for k, v in encoded.items() if k in self._input_names}
+        logits = self._session.run(None, feeds)[0]
+        return logits[:, -1].astype(np.float32)
+
+    def rerank(self, query: str, results: List[Dict], top_k: int) -> List[Dict]:
+        """
+        Best top_k of results by cross-encoder score
+
+        Falls back to results[:top_k] (dense order) when the model is
+        unavailable or the time budget runs out; reranked results carry a
+        'rerank_score'.
+        """
+        if len(results) <= 1 or not self._ensure_loaded():
+            return results[:top_k]
+
+        n = len(results)
+        if self._ms_per_pair is not None and self._ms_per_pair * n > self.budget_ms:
+            logger.info(
+                f"⏱️ Rerank skipped: ~{self._ms_per_pair * n:.0f}ms for {n} pairs "
+                f"exceeds {self.budget_ms:.0f}ms budget"
+            )
+            # Decay so a one-off slow run doesn't disable reranking for good
+            self._ms_per_pair *= 0.9
+            return results[:top_k]
+
+        start = time.perf_counter()
+        texts = [r['text'] for r in results]
+        scores = []
+
+        for i in range(0, n, self.batch_size):
+            scores.append(self._score(query, texts[i:i + self.batch_size]))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if elapsed_ms > self.budget_ms and i + self.batch_size < n:
+                self._observe(elapsed_ms, i + self.batch_size)
+                logger.warning(
+                    f"⏱️ Rerank budget exceeded ({elapsed_ms:.0f}ms > {self.budget_ms:.0f}ms), "
+                    f"keeping dense order"
+                )
+                return results[:top_k]
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._observe(elapsed_ms, n)
+
+        scores = np.concatenate(scores)
+        order = np.argsort(-scores, kind="stable")[:top_k]
+
+        logger.info(f"🎯 Reranked {n} candidates -> {len(order)} in {elapsed_ms:.0f}ms")
+        return [{**results[i], 'rerank_score': round(float(scores[i]), 4)} for i in order]
+
+    def _observe(self, elapsed_ms: float, pairs: int):
+        per_pair = elapsed_ms / max(pairs, 1)
+        if self._ms_per_pair is None:
+            self._ms_per_pair = per_pair
+        else:
+            self._ms_per_pair = 0.8 * self._ms_per_pair + 0.2 * per_pair
+
+
+def quantize_onnx(model_path: str, output_path: str):
+    """Dynamic int8 quantization of an exported cross-encoder (onnxruntime)"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+    logger.info(f"✅ Quantized model written to {output_path}")
+
+
+# CLI: python -m rag.reranker --quantize model.onnx model_int8.onnx
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) == 4 and sys.argv[1] == "--quantize":
+        quantize_onnx(sys.argv[2], sys.argv[3])
+    else:
+        reranker = Reranker()
+        candidates = [
+            {'text': "किसान क्रेडिट कार्ड पर 4% ब्याज दर पर ऋण मिलता है।"},
+            {'text': "The Union Budget allocates funds to infrastructure."},
+            {'text': "KCC eligibility: farmers, tenant farmers and SHGs."},
+        ]
+        for r in reranker.rerank("Kisan Credit Card eligibility", candidates, top_k=2):
+            print(r.get('rerank_score'), r['text'])
@@ -5,6 +5,8 @@ Combines embedder and vector store
 
 from typing import List, Dict, Tuple
 from loguru import logger
+from .bm25 import reciprocal_rank_fusion
+from .context_builder import ContextBuilder, format_citation
 from .embedder import Embedder
 from .vector_store import VectorStore
 import os
@@ -15,61 +17,228 @@ class Retriever:
         self.vector_store = vector_store
         self.embedder = embedder
         self.top_k = int(os.getenv('TOP_K_RESULTS', 3))
+
+        # Dense + BM25 fused with reciprocal rank fusion
+        self.hybrid = os.getenv('HYBRID_RETRIEVAL', 'true').lower() == 'true'
+        self.rrf_k = int(os.getenv('RRF_K', 60))
+        self.candidate_k = int(os.getenv('HYBRID_CANDIDATES', 20))
+
+        # Hits below this calibrated score never reach the LLM. Off by
+        # default: the calibration uses chunk-to-chunk statistics, and real
+        # query-to-passage scores sit lower, so any cutoff must first be
+        # tuned on real questions
+        self.min_score = float(os.getenv('RAG_MIN_SCORE', 0))
+
+        # Overlap dedup + token budget for the LLM context
+        self.context_builder = ContextBuilder()
     
-    def retrieve(self, query: str, top_k: int = None) -> List[Dict[str, any]]:
+    def retrieve(self, query: str, top_k: int = None, filters: Dict = None) -> List[Dict[str, any]]:
         """
         Retrieve most relevant chunks for a query
         
         Args:
             query: User question in Hindi/English
             top_k: Number of results (default from env)
+            filters: Optional metadata filters (source, language, scheme,
+                page_from/page_to; see rag.metadata_index)
         
         Returns:
-            List of dicts with 'text', 'source', 'score'
+            List of dicts with 'text', 'source', raw 'score',
+            'calibrated_score' (0-1, comparable across queries) and the
+            'page_start'/'page_end' range (None for older indexes);
+            hybrid retrieval adds 'rrf_score' and 'bm25_score'
         """
         if top_k is None:
             top_k = self.top_k
         
         logger.info(f"🔍 Retrieving for query: {query[:50]}...")
-        
-        # Embed query
-        query_embedding = self.embedder.embed_query(query)
-        
-        # Search vector store
-        results = self.vector_store.search(query_embedding, k=top_k)
-        
-        # Format results
+
+        hits = self._search_batch([query], top_k, filters)[0]
+        formatted_results = self._format_hits(hits)
+
+        dropped = len(hits) - len(formatted_results)
+        logger.info(
+            f"✅ Retrieved {len(formatted_results)} relevant chunks"
+            + (f" ({dropped} below min score {self.min_score})" if dropped else "")
+        )
+        return formatted_results
+
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        top_k: int = None,
+        filters: Dict = None
+    ) -> List[List[Dict[str, any]]]:
+        """
+        Retrieve for many queries at once
+
+        All queries are embedded in one forward pass and searched with one
+        FAISS call; BM25 fusion and the min-score cutoff apply per query.
+
+        Returns:
+            One result list per query (same format as retrieve), in input order
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not queries:
+            return []
+
+        logger.info(f"🔍 Retrieving for {len(queries)} queries in one batch")
+
+        return [self._format_hits(hits) for hits in self._search_batch(queries, top_k, filters)]
+
+    def retrieve_multi(
+        self,
+        queries: List[str],
+        top_k: int = None,
+        filters: Dict = None
+    ) -> List[Dict[str, any]]:
+        """
+        Multi-query retrieval: search several phrasings of one question
+        and merge them into a single deduplicated ranking (RRF over the
+        per-query rankings; each chunk keeps its best dense score)
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not queries:
+            return []
+
+        per_query = self._search_batch(queries, top_k, filters)
+
+        best: Dict[int, Tuple[float, Dict]] = {}
+        for hits in per_query:
+            for idx, score, extra in hits:
+                if idx not in best or score > best[idx][0]:
+                    best[idx] = (score, extra)
+
+        fused = reciprocal_rank_fusion(
+            [[idx for idx, _, _ in hits] for hits in per_query],
+            k=self.rrf_k
+        )[:top_k]
+
+        merged = [
+            (idx, best[idx][0], {**best[idx][1], 'rrf_score': round(rrf, 6)})
+            for idx, rrf in fused
+        ]
+        formatted_results = self._format_hits(merged)
+
+        logger.info(
+            f"✅ Retrieved {len(formatted_results)} chunks from {len(queries)} query variants"
+        )
+        return formatted_results
+
+    def _search_batch(
+        self,
+        queries: List[str],
+        top_k: int,
+        filters: Dict = None
+    ) -> List[List[Tuple[int, float, Dict]]]:
+        """Raw (chunk id, dense score, extra fields) hits per query"""
+        allowed = self.vector_store.select_ids(filters)
+        if allowed is not None:
+            logger.info(f"🏷️ Filters {filters} -> {len(allowed)} candidate chunks")
+            if not len(allowed):
+                return [[] for _ in queries]
+
+        query_embeddings = self.embedder.embed_queries(queries)
+
+        hybrid = self.hybrid and self.vector_store.bm25 is not None
+        n = max(top_k, self.candidate_k) if hybrid else top_k
+
+        dense_batch = self.vector_store.search_batch(query_embeddings, k=n, ids=allowed)
+        if not dense_batch:
+            return [[] for _ in queries]
+
+        if not hybrid:
+            return [[(idx, score, {}) for idx, score in dense] for dense in dense_batch]
+
+        return [
+            self._hybrid_search(query, query_embedding, dense, top_k, allowed)
+            for query, query_embedding, dense in zip(queries, query_embeddings, dense_batch)
+        ]
+
+    def _format_hits(self, hits: List[Tuple[int, float, Dict]]) -> List[Dict[str, any]]:
+        """Hits -> result dicts, dropping those below the calibrated cutoff"""
         formatted_results = []
-        for chunk, score in results:
+        for idx, score, extra in hits:
+            calibrated = self.vector_store.calibrated_score(score)
+            if calibrated < self.min_score:
+                continue
+
+            chunk = self.vector_store.chunks[idx]
             formatted_results.append({
                 'text': chunk['text'],
                 'source': chunk.get('source', 'unknown'),
                 'score': score,
-                'chunk_id': chunk.get('chunk_id', -1)
+                'calibrated_score': round(calibrated, 4),
+                'chunk_id': chunk.get('chunk_id', -1),
+                'page_start': chunk.get('page_start'),
+                'page_end': chunk.get('page_end'),
+                'start_char': chunk.get('start_char'),
+                'end_char': chunk.get('end_char'),
+                **extra
             })
-        
-        logger.info(f"✅ Retrieved {len(formatted_results)} relevant chunks")
         return formatted_results
     
-    def retrieve_with_context(self, query: str, top_k: int = None) -> str:
+    def _hybrid_search(
+        self,
+        query: str,
+        query_embedding,
+        dense: List[Tuple[int, float]],
+        top_k: int,
+        allowed=None
+    ) -> List[Tuple[int, float, Dict]]:
+        """
+        Fuse dense and BM25 rankings with RRF
+
+        'score' stays the dense similarity (lexical-only hits are scored
+        against the query vector) so downstream confidence is unchanged.
+        """
+        n = max(top_k, self.candidate_k)
+
+        lexical = self.vector_store.bm25.search(query, k=n, ids=allowed)
+
+        fused = reciprocal_rank_fusion(
+            [[idx for idx, _ in dense], [idx for idx, _ in lexical]],
+            k=self.rrf_k
+        )[:top_k]
+
+        dense_scores = dict(dense)
+        bm25_scores = dict(lexical)
+
+        missing = [idx for idx, _ in fused if idx not in dense_scores]
+        dense_scores.update(self.vector_store.similarity_for_ids(query_embedding, missing))
+
+        return [
+            (idx, dense_scores[idx], {
+                'rrf_score': round(rrf, 6),
+                'bm25_score': round(bm25_scores.get(idx, 0.0), 4)
+            })
+            for idx, rrf in fused
+        ]
+
+    def retrieve_with_context(self, query: str, top_k: int = None, filters: Dict = None) -> str:
         """
         Retrieve and format context for LLM
         
         Returns:
             Formatted context string
         """
-        results = self.retrieve(query, top_k)
-        
+        return self.format_context(self.retrieve(query, top_k, filters))
+
+    def format_context(self, results: List[Dict[str, any]], token_budget: int = None) -> str:
+        """
+        Format already-retrieved results as LLM context
+
+        Overlapping/adjacent chunks are merged and the text is packed to
+        the token budget (see ContextBuilder).
+        """
         if not results:
             return "कोई प्रासंगिक जानकारी नहीं मिली। (No relevant information found.)"
-        
-        context_parts = []
-        for i, result in enumerate(results, 1):
-            context_parts.append(
-                f"संदर्भ {i} (स्रोत: {result['source']}):\n{result['text']}\n"
-            )
-        
-        return "\n".join(context_parts)
+
+        return self.context_builder.build(results, token_budget).text
+
+    format_citation = staticmethod(format_citation)
 
 
 # Test function
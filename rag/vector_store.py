@@ -1,25 +1,72 @@
 """
 Vector Store - FAISS-based vector database
 Handles indexing and persistence (memory-safe & incremental)
+
+VECTOR_METRIC=cosine stores L2-normalized vectors in an inner-product
+index (flat or HNSW) so scores are true cosines; "l2" keeps the
+original IndexFlatL2 + 1/(1+distance) behaviour.
 """
 
+import json
 import os
 import pickle
+from datetime import datetime
+
 import numpy as np
 import faiss
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 from loguru import logger
 
+from .bm25 import BM25Index
+from .metadata_index import MetadataIndex
+
 
 class VectorStore:
-    def __init__(self, index_path: str = "data/processed/faiss_index"):
+    META_FILE = "index_meta.json"
+
+    def __init__(self, index_path: str = "data/processed/faiss_index", metric: str = None):
         self.index_path = index_path
         self.index = None
         self.chunks: List[Dict] = []
         self.dimension = None
+        self.bm25: Optional[BM25Index] = None  # lexical index over the same chunks
+        self.metadata: Optional[MetadataIndex] = None  # filter postings over the same chunks
+
+        self.metric = (metric or os.getenv("VECTOR_METRIC", "l2")).lower()
+        self.index_type = os.getenv("VECTOR_INDEX_TYPE", "flat").lower()
+        self.hnsw_m = int(os.getenv("HNSW_M", 32))
+        self.hnsw_ef_search = int(os.getenv("HNSW_EF_SEARCH", 64))
+
+        # Background similarity distribution, used to calibrate scores
+        self.score_stats: Dict[str, float] = {}
+        self.calibration_z_mid = float(os.getenv("SCORE_CALIBRATION_Z_MID", 3.0))
 
         os.makedirs(index_path, exist_ok=True)
 
+    # ------------------------------------------------------------------
+    # 🔹 INDEX FACTORY / VECTOR PREP
+    # ------------------------------------------------------------------
+    def _new_index(self, dimension: int):
+        if self.metric != "cosine":
+            return faiss.IndexFlatL2(dimension)
+
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dimension, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = max(40, 2 * self.hnsw_m)
+            return index
+
+        return faiss.IndexFlatIP(dimension)
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        """float32, C-contiguous, unit length in cosine mode"""
+        vectors = np.ascontiguousarray(vectors, dtype="float32")
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if self.metric == "cosine":
+            vectors = vectors.copy()
+            faiss.normalize_L2(vectors)
+        return vectors
+
     # ------------------------------------------------------------------
     # 🔹 CREATE INDEX (ONE-SHOT)
     # ------------------------------------------------------------------
@@ -32,8 +79,8 @@ class VectorStore:
 
         logger.info(f"🔄 Creating FAISS index - {n_embeddings} vectors, dim={self.dimension}")
 
-        self.index = faiss.IndexFlatL2(self.dimension)
-        self.index.add(embeddings.astype("float32"))
+        self.index = self._new_index(self.dimension)
+        self.index.add(self._prepare(embeddings))
         self.chunks = chunks
 
         logger.info(f"✅ Index created with {self.index.ntotal} vectors")
@@ -45,13 +92,13 @@ class VectorStore:
         """
         Incrementally add vectors + metadata (SAFE FOR LARGE DATA)
         """
-        embeddings = embeddings.astype("float32")
+        embeddings = self._prepare(embeddings)
 
         if self.index is None:
             # First batch → create index
             self.dimension = embeddings.shape[1]
-            self.index = faiss.IndexFlatL2(self.dimension)
-            logger.info(f"🆕 Created FAISS index (dim={self.dimension})")
+            self.index = self._new_index(self.dimension)
+            logger.info(f"🆕 Created FAISS index (dim={self.dimension}, metric={self.metric})")
 
         self.index.add(embeddings)
         self.chunks.extend(chunks)
@@ -61,22 +108,162 @@ class VectorStore:
     # ------------------------------------------------------------------
     # 🔹 SEARCH
     # ------------------------------------------------------------------
-    def search(self, query_embedding: np.ndarray, k: int = 3) -> List[Tuple[Dict, float]]:
+    def search(self, query_embedding: np.ndarray, k: int = 3, filters: Dict = None) -> List[Tuple[Dict, float]]:
+        results = [
+            (self.chunks[idx], similarity)
+            for idx, similarity in self.search_ids(query_embedding, k, ids=self.select_ids(filters))
+        ]
+
+        logger.info(f"🔍 Retrieved {len(results)} chunks")
+        return results
+
+    def search_ids(self, query_embedding: np.ndarray, k: int = 3, ids: np.ndarray = None) -> List[Tuple[int, float]]:
+        """Like search(), but returns (chunk id, similarity) pairs"""
+        results = self.search_batch(query_embedding, k, ids=ids)
+        return results[0] if results else []
+
+    def search_batch(
+        self,
+        query_matrix: np.ndarray,
+        k: int = 3,
+        ids: np.ndarray = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Search many queries in one FAISS call
+
+        Args:
+            query_matrix: (n_queries, dim) embeddings (a single vector is
+                treated as one query)
+            ids: optional allowed chunk ids (see select_ids); applied inside
+                FAISS through an IDSelector
+
+        Returns:
+            One list of (chunk id, similarity) pairs per query, in input order
+        """
         if self.index is None:
             logger.error("❌ Index not loaded!")
             return []
 
-        query_vector = query_embedding.reshape(1, -1).astype("float32")
-        distances, indices = self.index.search(query_vector, k)
+        query_vectors = self._prepare(query_matrix)
+        if not len(query_vectors):
+            return []
 
-        results = []
-        for idx, distance in zip(indices[0], distances[0]):
-            if idx < len(self.chunks):
-                similarity = 1 / (1 + distance)
-                results.append((self.chunks[idx], float(similarity)))
+        if ids is not None and not len(ids):
+            return [[] for _ in range(len(query_vectors))]
 
-        logger.info(f"🔍 Retrieved {len(results)} chunks")
-        return results
+        ef_search = max(self.hnsw_ef_search, k)
+        params = None
+        if ids is not None:
+            selector = faiss.IDSelectorBatch(np.ascontiguousarray(ids, dtype="int64"))
+            if hasattr(self.index, "hnsw"):
+                params = faiss.SearchParametersHNSW(sel=selector, efSearch=ef_search)
+            else:
+                params = faiss.SearchParameters(sel=selector)
+        elif hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = ef_search
+
+        raw, indices = self.index.search(query_vectors, k, params=params)
+
+        return [
+            [
+                (int(idx), self._similarity(value))
+                for idx, value in zip(row_ids, row_raw)
+                if 0 <= idx < len(self.chunks)
+            ]
+            for row_ids, row_raw in zip(indices, raw)
+        ]
+
+    def select_ids(self, filters: Optional[Dict]) -> Optional[np.ndarray]:
+        """Allowed chunk ids for metadata filters (None = no filtering)"""
+        if not filters:
+            return None
+        if self.metadata is None:
+            self.metadata = MetadataIndex.build(self.chunks)
+        return self.metadata.select(filters)
+
+    def similarity_for_ids(self, query_embedding: np.ndarray, ids: Sequence[int]) -> Dict[int, float]:
+        """
+        Dense similarity of specific chunks to the query
+
+        Used to score hits that only the lexical index returned.
+        """
+        if self.index is None or not len(ids):
+            return {}
+
+        query_vector = self._prepare(query_embedding)[0]
+        vectors = np.vstack([self.index.reconstruct(int(i)) for i in ids])
+        similarities = self._pair_similarity(query_vector, vectors)
+
+        return {int(i): float(sim) for i, sim in zip(ids, similarities)}
+
+    def _similarity(self, value: float) -> float:
+        """
+        FAISS output -> similarity
+
+        cosine: inner product of unit vectors, already in [-1, 1]
+        l2:     squared distance -> 1 / (1 + distance), in (0, 1]
+        """
+        if self.metric == "cosine":
+            return float(min(max(value, -1.0), 1.0))
+        return float(1 / (1 + value))
+
+    def _pair_similarity(self, query_vector: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        """Similarity of one (prepared) query to stored vectors, same scale as search"""
+        if self.metric == "cosine":
+            return np.clip(vectors @ query_vector, -1.0, 1.0)
+        return 1 / (1 + ((vectors - query_vector) ** 2).sum(axis=1))
+
+    # ------------------------------------------------------------------
+    # 🔹 SCORE CALIBRATION
+    # ------------------------------------------------------------------
+    def calibrated_score(self, similarity: float) -> float:
+        """
+        Similarity -> (0, 1), comparable across queries and metrics
+
+        z = (similarity - background mean) / background std, where the
+        background is the similarity of random chunk pairs in this index;
+        sigmoid(z - z_mid) is 0.5 for a hit z_mid std-devs above chance.
+        """
+        mean = self.score_stats.get("mean")
+        std = self.score_stats.get("std")
+        if mean is None or not std:
+            return float(similarity)
+
+        z = (similarity - mean) / std
+        return float(1 / (1 + np.exp(-(z - self.calibration_z_mid))))
+
+    def _compute_score_stats(self, n_queries: int = 256, n_docs: int = 2048, seed: int = 0):
+        """Background similarity distribution from random stored vectors"""
+        n = self.index.ntotal if self.index is not None else 0
+        if n < 2:
+            self.score_stats = {}
+            return
+
+        rng = np.random.default_rng(seed)
+        q_ids = rng.choice(n, size=min(n_queries, n), replace=False)
+        d_ids = rng.choice(n, size=min(n_docs, n), replace=False)
+
+        queries = np.vstack([self.index.reconstruct(int(i)) for i in q_ids])
+        docs = np.vstack([self.index.reconstruct(int(i)) for i in d_ids])
+
+        sims = [
+            self._pair_similarity(query, docs)[d_ids != q]  # ignore self-matches
+            for q, query in zip(q_ids, queries)
+        ]
+        sims = np.concatenate(sims)
+
+        self.score_stats = {
+            "mean": float(sims.mean()),
+            "std": float(sims.std()),
+            "p50": float(np.percentile(sims, 50)),
+            "p95": float(np.percentile(sims, 95)),
+            "p99": float(np.percentile(sims, 99)),
+            "samples": int(sims.size),
+        }
+        logger.info(
+            f"📏 Score stats ({self.metric}): mean={self.score_stats['mean']:.4f} "
+            f"std={self.score_stats['std']:.4f}"
+        )
 
     # ------------------------------------------------------------------
     # 🔹 SAVE
@@ -90,8 +277,31 @@ class VectorStore:
         with open(chunks_file, "wb") as f:
             pickle.dump(self.chunks, f)
 
+        self.bm25 = BM25Index.build(c["text"] for c in self.chunks)
+        self.bm25.save(self.index_path)
+        self.metadata = MetadataIndex.build(self.chunks)
+
+        self._compute_score_stats()
+        self._save_meta()
+
         logger.info(f"💾 Index saved to {self.index_path}")
 
+    def _save_meta(self):
+        meta = {
+            "metric": self.metric,
+            "index_type": type(self.index).__name__,
+            "dimension": self.dimension,
+            "ntotal": int(self.index.ntotal),
+            "score_stats": self.score_stats,
+            "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        }
+        # Atomic, so workers starting together never read a half-written file
+        meta_file = os.path.join(self.index_path, self.META_FILE)
+        tmp_file = meta_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_file, meta_file)
+
     # ------------------------------------------------------------------
     # 🔹 LOAD
     # ------------------------------------------------------------------
@@ -110,9 +320,81 @@ class VectorStore:
                 self.chunks = pickle.load(f)
 
             self.dimension = self.index.d
-            logger.info(f"✅ Loaded index with {self.index.ntotal} vectors")
+            self._load_bm25()
+            self._load_meta()
+            self.metadata = MetadataIndex.build(self.chunks)
+            logger.info(f"✅ Loaded index with {self.index.ntotal} vectors ({self.metric})")
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to load index: {e}")
             return False
+
+    def _load_bm25(self):
+        """Load the BM25 postings, rebuilding them if missing or stale"""
+        try:
+            bm25 = BM25Index.load(self.index_path)
+            if bm25.n_docs == len(self.chunks):
+                self.bm25 = bm25
+                return
+            logger.warning("⚠️ BM25 index out of date, rebuilding")
+        except FileNotFoundError:
+            logger.info("ℹ️ No BM25 index yet, building from chunks")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load BM25 index ({e}), rebuilding")
+
+        self.bm25 = BM25Index.build(c["text"] for c in self.chunks)
+        try:
+            self.bm25.save(self.index_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save BM25 index: {e}")
+
+    def _load_meta(self):
+        """
+        Restore metric + score stats; convert an L2 index when cosine is requested
+        """
+        loaded_metric = (
+            "cosine" if self.index.metric_type == faiss.METRIC_INNER_PRODUCT else "l2"
+        )
+        requested = self.metric
+        self.metric = loaded_metric
+
+        meta = {}
+        meta_file = os.path.join(self.index_path, self.META_FILE)
+        if os.path.exists(meta_file):
+            with open(meta_file, encoding="utf-8") as f:
+                meta = json.load(f)
+
+        if requested == "cosine" and loaded_metric == "l2":
+            self._convert_to_cosine()
+            return
+
+        if requested != loaded_metric:
+            logger.warning(f"⚠️ Index uses {loaded_metric}, ignoring VECTOR_METRIC={requested}")
+
+        if meta.get("metric") == self.metric and meta.get("ntotal") == self.index.ntotal:
+            self.score_stats = meta.get("score_stats", {})
+        else:
+            self._compute_score_stats()
+            try:
+                self._save_meta()
+            except OSError as e:
+                logger.warning(f"⚠️ Could not save index metadata: {e}")
+
+    def _convert_to_cosine(self):
+        """
+        Re-index stored vectors as unit vectors in an inner-product index
+
+        In memory only: the shipped L2 index and its metadata stay as they
+        are on disk (rebuild with VECTOR_METRIC=cosine and force_rebuild=True to
+        persist a cosine index).
+        """
+        logger.info("🔄 Converting L2 index to cosine in memory (no re-embedding needed)")
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+
+        self.metric = "cosine"
+        self.index = self._new_index(self.dimension)
+        self.index.add(self._prepare(vectors))
+
+        self._compute_score_stats()
+        logger.info(f"✅ Converted index ready ({type(self.index).__name__})")
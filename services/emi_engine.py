@@ -0,0 +1,123 @@
+"""
+EMI Engine - Vectorized EMI, amortization schedules and what-if grids
+All functions broadcast over numpy arrays; a 0% rate is handled exactly
+"""
+
+from typing import Dict, Iterable
+
+import numpy as np
+
+
+def emi(principal, annual_rate, months) -> np.ndarray:
+    """
+    Monthly installment for reducing-balance loans
+
+    principal, annual_rate (percent) and months broadcast together.
+    Non-positive principal or tenure gives 0.
+    """
+    P = np.asarray(principal, dtype=np.float64)
+    r = np.asarray(annual_rate, dtype=np.float64) / (12 * 100)
+    n = np.asarray(months, dtype=np.float64)
+
+    growth = (1 + r) ** n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = np.where(
+            r > 0,
+            P * r * growth / (growth - 1),
+            P / n  # zero-interest: equal principal installments
+        )
+
+    return np.where((P > 0) & (n > 0), payment, 0.0)
+
+
+def amortization_schedule(principal: float, annual_rate: float, months: int) -> Dict[str, np.ndarray]:
+    """
+    Month-by-month split of every installment, computed in closed form
+
+    Balance after k payments: P(1+r)^k - EMI((1+r)^k - 1)/r
+    (or P - k·EMI at 0%), so no Python loop over months.
+    """
+    months = int(months)
+    payment = float(emi(principal, annual_rate, months))
+    r = annual_rate / (12 * 100)
+    k = np.arange(months + 1, dtype=np.float64)
+
+    if r > 0:
+        growth = (1 + r) ** k
+        balance = principal * growth - payment * (growth - 1) / r
+    else:
+        balance = principal - payment * k
+
+    balance = np.maximum(balance, 0.0)
+    balance[-1] = 0.0  # absorb floating-point residue
+
+    interest = balance[:-1] * r
+    principal_paid = balance[:-1] - balance[1:]
+
+    return {
+        "month": np.arange(1, months + 1),
+        "payment": interest + principal_paid,
+        "interest": interest,
+        "principal": principal_paid,
+        "balance": balance[1:],
+    }
+
+
+def emi_grid(amounts: Iterable[float], annual_rates: Iterable[float],
+             tenures: Iterable[int]) -> Dict[str, np.ndarray]:
+    """
+    EMI for every (amount, rate, tenure) combination in one broadcast
+
+    Returns arrays of shape (len(amounts), len(rates), len(tenures)).
+    """
+    A = np.asarray(list(amounts), dtype=np.float64)[:, None, None]
+    R = np.asarray(list(annual_rates), dtype=np.float64)[None, :, None]
+    T = np.asarray(list(tenures), dtype=np.float64)[None, None, :]
+
+    payment = emi(A, R, T)
+    total = payment * T
+
+    return {
+        "emi": payment,
+        "total_payment": total,
+        "total_interest": total - A,
+    }
+
+
+def grid_rows(amounts, annual_rates, tenures) -> list:
+    """emi_grid flattened into rows (amount-major, then rate, then tenure)"""
+    amounts, annual_rates, tenures = list(amounts), list(annual_rates), list(tenures)
+    grid = emi_grid(amounts, annual_rates, tenures)
+
+    rows = []
+    for i, amount in enumerate(amounts):
+        for j, rate in enumerate(annual_rates):
+            for k, tenure in enumerate(tenures):
+                rows.append({
+                    "amount": amount,
+                    "interest_rate": rate,
+                    "tenure_months": tenure,
+                    "emi": round(float(grid["emi"][i, j, k]), 2),
+                    "total_payment": round(float(grid["total_payment"][i, j, k]), 2),
+                    "total_interest": round(float(grid["total_interest"][i, j, k]), 2),
+                })
+    return rows
+
+
+# Self-check: python -m services.emi_engine
+if __name__ == "__main__":
+    # Matches the scalar formula previously used in LoanService
+    P, rate, n = 500000, 8.5, 36
+    r = rate / 1200
+    scalar = P * r * (1 + r) ** n / ((1 + r) ** n - 1)
+    assert abs(float(emi(P, rate, n)) - scalar) < 1e-6
+
+    schedule = amortization_schedule(P, rate, n)
+    assert np.allclose(schedule["payment"], scalar)
+    assert abs(schedule["principal"].sum() - P) < 1e-6
+    assert float(emi(120000, 0, 12)) == 10000.0
+
+    grid = emi_grid([100000, 500000], [4, 8.5, 12], [12, 24, 36, 60])
+    print(f"EMI grid shape: {grid['emi'].shape}")
+    print(f"₹5L @ 8.5% for 36 months: EMI ₹{scalar:,.2f}, "
+          f"interest ₹{schedule['interest'].sum():,.2f}")
@@ -0,0 +1,385 @@
+"""
+FAQ Index - Precomputed answers for the most frequent questions
+An offline job mines rag_queries for the head of the question
+distribution, answers each once (rate-limited) and writes a versioned
+JSON index that RAGService serves without retrieval or the LLM
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from rag.bm25 import tokenize
+from rag.extractive import STOPWORDS
+from utils.llm_backends import TokenBucket
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_FAQ_PATH = BASE_DIR / "data" / "processed" / "faq_index.json"
+
+_PUNCT_RE = re.compile(r"[^\w\s\u0900-\u097F]|[\u0964\u0965]")
+
+# Question words decide what is being asked ("KCC कैसे मिलता है" vs
+# "KCC कब मिलता है"), so unlike the extractive stopwords they are kept
+QUESTION_WORDS = {
+    "क्या", "कैसे", "कौन", "कितना", "कितनी", "कितने", "कब", "कहाँ", "कहां", "क्यों",
+    "what", "how", "which", "who", "when", "where", "why",
+}
+FAQ_FILLER_WORDS = STOPWORDS - QUESTION_WORDS
+
+
+def normalize_question(text: str) -> str:
+    """Lowercase, punctuation (incl. danda) stripped, whitespace collapsed"""
+    return " ".join(_PUNCT_RE.sub(" ", text.lower()).split())
+
+
+def content_signature(text: str) -> str:
+    """Content + question words of a question, in order ("kcc ब्याज दर क्या")"""
+    return " ".join(
+        t for t in tokenize(normalize_question(text))
+        if t not in FAQ_FILLER_WORDS and len(t) > 1
+    )
+
+
+def _question_words(signature: str) -> frozenset:
+    return frozenset(w for w in signature.split() if w in QUESTION_WORDS)
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(max(1, len(text) - 2))}
+
+
+class FAQSnapshot:
+    """
+    Immutable index over one FAQ file, per language:
+
+    exact      normalized question
+    signature  sorted content + question words (word order, fillers, "है"/"हैं")
+    near       character-trigram Jaccard of the signature via an inverted
+               trigram index (typos, inflections), with the same question
+               words required; the bar is high so "KCC interest rate"
+               never answers "MUDRA interest rate"
+    """
+
+    def __init__(self, version: str, entries: List[Dict], min_similarity: float):
+        self.version = version
+        self.entries = entries
+        self.min_similarity = min_similarity
+
+        self.exact: Dict[Tuple[str, str], int] = {}
+        self.signatures: Dict[Tuple[str, str], int] = {}
+        self.grams: List[set] = []
+        self.question_words: List[frozenset] = []
+        self.postings: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+
+        for i, entry in enumerate(entries):
+            language = entry.get("language", "hindi")
+            signature = content_signature(entry["question"])
+            self.exact.setdefault((language, normalize_question(entry["question"])), i)
+            self.signatures.setdefault((language, " ".join(sorted(signature.split()))), i)
+
+            grams = _trigrams(signature) if signature else set()
+            self.grams.append(grams)
+            self.question_words.append(_question_words(signature))
+            for gram in grams:
+                self.postings[(language, gram)].append(i)
+
+    @classmethod
+    def empty(cls) -> "FAQSnapshot":
+        return cls("empty", [], 1.0)
+
+    @classmethod
+    def from_dict(cls, data: Dict, min_similarity: float) -> "FAQSnapshot":
+        entries = data.get("entries", [])
+        for entry in entries:
+            if not isinstance(entry.get("question"), str) or not isinstance(entry.get("answer"), str):
+                raise ValueError("every FAQ entry needs string 'question' and 'answer'")
+        return cls(str(data.get("version", "unversioned")), entries, min_similarity)
+
+    def lookup(self, question: str, language: str = "hindi") -> Tuple[Optional[Dict], Optional[str]]:
+        i = self.exact.get((language, normalize_question(question)))
+        if i is not None:
+            return self.entries[i], "exact"
+
+        signature = content_signature(question)
+        if not signature:
+            return None, None
+
+        i = self.signatures.get((language, " ".join(sorted(signature.split()))))
+        if i is not None:
+            return self.entries[i], "near"
+
+        grams = _trigrams(signature)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self.postings.get((language, gram), ()))
+
+        asked = _question_words(signature)
+        best, best_score = None, 0.0
+        for i, common in shared.items():
+            if self.question_words[i] != asked:
+                continue
+            score = common / (len(grams) + len(self.grams[i]) - common)
+            if score > best_score:
+                best, best_score = i, score
+
+        if best is not None and best_score >= self.min_similarity:
+            return self.entries[best], "near"
+        return None, None
+
+
+class FAQIndex:
+    """
+    Serves the current FAQSnapshot, reloading when the file changes
+
+    Same copy-on-write scheme as the fraud rules: the file's mtime is
+    checked at most every FAQ_CHECK_INTERVAL seconds and a new snapshot
+    replaces the old one in a single reference swap.
+    """
+
+    def __init__(self, path: Optional[str] = None, check_interval: Optional[float] = None):
+        self.path = Path(path or os.getenv("FAQ_INDEX_PATH", DEFAULT_FAQ_PATH))
+        self.check_interval = float(
+            check_interval if check_interval is not None
+            else os.getenv("FAQ_CHECK_INTERVAL", 60)
+        )
+        self.min_similarity = float(os.getenv("FAQ_NEAR_MIN_SIMILARITY", 0.8))
+
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._next_check = 0.0
+        self._snapshot = FAQSnapshot.empty()
+
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+        self.reload()
+
+    def current(self) -> FAQSnapshot:
+        now = time.monotonic()
+        if now >= self._next_check and self._lock.acquire(blocking=False):
+            try:
+                self._next_check = now + self.check_interval
+                self._reload_if_changed()
+            finally:
+                self._lock.release()
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def lookup(self, question: str, language: str = "hindi") -> Tuple[Optional[Dict], Optional[str]]:
+        """(entry, 'exact' | 'near') or (None, None)"""
+        entry, how = self.current().lookup(question, language)
+        if how == "exact":
+            self.hits += 1
+        elif how == "near":
+            self.near_hits += 1
+        else:
+            self.misses += 1
+        return entry, how
+
+    def reload(self) -> bool:
+        with self._lock:
+            self._mtime = None
+            return self._reload_if_changed()
+
+    def _reload_if_changed(self) -> bool:
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        if mtime == self._mtime:
+            return False
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                snapshot = FAQSnapshot.from_dict(json.load(f), self.min_similarity)
+        except Exception as e:
+            # Keep serving the previous snapshot
+            logger.error(f"❌ Invalid FAQ index {self.path}: {e}")
+            self._mtime = mtime
+            return False
+
+        self._mtime = mtime
+        self._snapshot = snapshot
+        logger.info(f"✅ FAQ index v{snapshot.version} loaded: {len(snapshot.entries)} answers")
+        return True
+
+    def stats(self) -> Dict[str, any]:
+        total = self.hits + self.near_hits + self.misses
+        return {
+            "version": self.version,
+            "entries": len(self._snapshot.entries),
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.near_hits) / total, 4) if total else 0.0,
+        }
+
+
+# ----------------------------------------------------------------------
+# Offline builder
+# ----------------------------------------------------------------------
+
+def mine_frequent_questions(
+    rows: Iterable[Tuple[str, Optional[str]]],
+    top_n: int = 200,
+    min_count: int = 3
+) -> List[Dict]:
+    """
+    Most frequent normalized questions per language
+
+    Each result carries the most common raw wording as 'question'.
+    """
+    counts: Counter = Counter()
+    wordings: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+
+    for question, language in rows:
+        key = normalize_question(question or "")
+        if not key:
+            continue
+        group = (language or "hindi", key)
+        counts[group] += 1
+        wordings[group][question.strip()] += 1
+
+    return [
+        {
+            "question": wordings[group].most_common(1)[0][0],
+            "language": group[0],
+            "count": count,
+        }
+        for group, count in counts.most_common(top_n)
+        if count >= min_count
+    ]
+
+
+def build_faq(
+    rag_service,
+    questions: List[Dict],
+    previous: Optional[Dict] = None,
+    rate_per_minute: float = None,
+    refresh: bool = False
+) -> Dict:
+    """
+    FAQ document with an answer for every mined question
+
+    Answers from `previous` are reused unless refresh=True; new ones go
+    through rag_service at most `rate_per_minute` per minute (default
+    GROQ_RPM) so the job never starves live traffic of LLM quota.
+    """
+    rate = rate_per_minute or float(os.getenv("FAQ_BUILD_RPM", os.getenv("GROQ_RPM", 20)))
+    bucket = TokenBucket(rate, burst=1)
+
+    reusable = {}
+    if previous and not refresh:
+        reusable = {
+            (e.get("language", "hindi"), normalize_question(e["question"])): e
+            for e in previous.get("entries", [])
+        }
+
+    entries, generated, reused = [], 0, 0
+    for item in questions:
+        key = (item["language"], normalize_question(item["question"]))
+        old = reusable.get(key)
+        if old is not None:
+            entries.append({**old, "count": item["count"]})
+            reused += 1
+            continue
+
+        while not bucket.try_acquire():
+            time.sleep(0.25)
+
+        result = rag_service.answer_question(
+            item["question"], language=item["language"], include_sources=False, use_faq=False
+        )
+        generated += 1
+        if result.get("answer_mode") == "none":
+            logger.warning(f"⚠️ No answer, skipping: {item['question'][:60]}")
+            continue
+
+        entries.append({
+            **item,
+            "answer": result["answer"],
+            "sources": result["sources"],
+            "confidence": result["confidence"],
+            "answer_mode": result.get("answer_mode", "generative"),
+        })
+        logger.info(f"📝 FAQ {len(entries)}/{len(questions)}: {item['question'][:60]}")
+
+    digest = hashlib.sha256(
+        json.dumps(entries, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:12]
+
+    logger.info(f"✅ FAQ built: {len(entries)} answers ({generated} generated, {reused} reused)")
+    return {
+        "version": digest,
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "entries": entries,
+    }
+
+
+def write_faq(faq: Dict, path: Path = DEFAULT_FAQ_PATH):
+    """Write atomically so serving workers never read a half-written file"""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(faq, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+    os.replace(tmp_path, path)
+    logger.info(f"💾 FAQ index v{faq['version']} written to {path}")
+
+
+_default_index: Optional[FAQIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_faq_index() -> FAQIndex:
+    """Process-wide FAQ index"""
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = FAQIndex()
+    return _default_index
+
+
+# CLI: python -m services.faq_index [--top 200] [--min-count 3] [--days 30] [--rpm 20] [--refresh] [--output path]
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild the FAQ index from logged RAG questions")
+    parser.add_argument("--top", type=int, default=200)
+    parser.add_argument("--min-count", type=int, default=3)
+    parser.add_argument("--days", type=int, default=30, help="look-back window (0 = all history)")
+    parser.add_argument("--rpm", type=float, default=None, help="max answers generated per minute")
+    parser.add_argument("--refresh", action="store_true", help="regenerate answers already in the index")
+    parser.add_argument("--output", type=Path, default=DEFAULT_FAQ_PATH)
+    args = parser.parse_args()
+
+    from database.db_manager import db
+    from services.rag_service import RAGService
+
+    since = datetime.utcnow() - timedelta(days=args.days) if args.days else None
+    mined = mine_frequent_questions(db.iter_rag_questions(since=since), args.top, args.min_count)
+    logger.info(f"🔎 {len(mined)} frequent questions mined")
+
+    previous = None
+    if args.output.exists():
+        with open(args.output, encoding="utf-8") as f:
+            previous = json.load(f)
+
+    write_faq(build_faq(RAGService(), mined, previous, args.rpm, args.refresh), args.output)
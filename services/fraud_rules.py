@@ -0,0 +1,257 @@
+"""
+Fraud Rules Registry - Versioned, hot-reloadable fraud rules
+Keyword and verified-scheme lists live in a JSON rules file that is
+compiled once into matchers and swapped atomically when it changes
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from services.scheme_registry import normalize_name
+from utils.keyword_matcher import KeywordMatcher
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_RULES_PATH = BASE_DIR / "data" / "processed" / "fraud_rules.json"
+
+# Built-in rules - used when no rules file exists
+DEFAULT_FRAUD_KEYWORDS = [
+    "instant approval", "no documents", "guaranteed loan",
+    "pay first", "advance fee", "processing fee upfront",
+    "तुरंत स्वीकृति", "बिना दस्तावेज", "पक्की मंजूरी",
+    "पहले पैसे दें", "एडवांस फीस", "प्रोसेसिंग शुल्क पहले",
+    "100% approval", "no credit check", "urgent loan",
+    "whatsapp loan", "telegram loan", "personal loan agent"
+]
+
+# Phrases that map to a named signal rather than to themselves
+DEFAULT_SIGNAL_PHRASES = {
+    "no verification": "no_verification",
+    "without verification": "no_verification",
+}
+
+DEFAULT_VERIFIED_SCHEMES = [
+    "pradhan mantri mudra yojana",
+    "kisan credit card",
+    "stand up india",
+    "प्रधानमंत्री मुद्रा योजना",
+    "किसान क्रेडिट कार्ड",
+    "स्टैंड अप इंडिया",
+    "nabard",
+    "sidbi",
+    "pmegp",
+    "shishu",
+    "kishor",
+    "tarun"
+]
+
+
+class CompiledRules:
+    """
+    Immutable snapshot of the rules plus their compiled matchers
+
+    Requests hold on to the snapshot they started with, so a reload
+    never changes rules half-way through a request.
+    """
+
+    def __init__(self, version: str, fraud_keywords: Iterable[str],
+                 verified_schemes: Iterable[str], signal_phrases: Dict[str, str]):
+        self.version = version
+        self.fraud_keywords = tuple(k.lower() for k in fraud_keywords)
+        self.verified_schemes = tuple(v.lower() for v in verified_schemes)
+        self.signal_phrases = dict(signal_phrases)
+
+        self.signal_matcher = KeywordMatcher({
+            **{k: k for k in self.fraud_keywords},
+            **self.signal_phrases,
+        })
+        self.verified_names = frozenset(normalize_name(v) for v in self.verified_schemes)
+
+    def is_verified(self, scheme_name: str) -> bool:
+        """Whole-name match only - a listed name inside a pitch does not count"""
+        return normalize_name(scheme_name) in self.verified_names
+
+    @classmethod
+    def defaults(cls) -> "CompiledRules":
+        return cls(
+            "builtin",
+            DEFAULT_FRAUD_KEYWORDS,
+            DEFAULT_VERIFIED_SCHEMES,
+            DEFAULT_SIGNAL_PHRASES,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CompiledRules":
+        keywords = data.get("fraud_keywords", [])
+        schemes = data.get("verified_schemes", [])
+        phrases = data.get("signal_phrases", {})
+
+        if not all(isinstance(k, str) for k in keywords + schemes):
+            raise ValueError("fraud_keywords and verified_schemes must be lists of strings")
+        if not isinstance(phrases, dict):
+            raise ValueError("signal_phrases must be an object")
+
+        return cls(str(data.get("version", "unversioned")), keywords, schemes, phrases)
+
+
+class FraudRuleRegistry:
+    """
+    Holds the current CompiledRules and reloads them when the file changes
+
+    current() checks the file's mtime at most every `check_interval`
+    seconds. A reload compiles the new rules off to the side and then
+    swaps one reference (copy-on-write), so readers are never blocked.
+    """
+
+    def __init__(self, rules_path: Optional[str] = None, check_interval: Optional[float] = None):
+        self.rules_path = Path(rules_path or os.getenv("FRAUD_RULES_PATH", DEFAULT_RULES_PATH))
+        self.check_interval = float(
+            check_interval if check_interval is not None
+            else os.getenv("FRAUD_RULES_CHECK_INTERVAL", 30)
+        )
+
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[CompiledRules], None]] = []
+        self._mtime = None
+        self._next_check = 0.0
+        self._rules = CompiledRules.defaults()
+
+        self.reload()
+
+    # ------------------------------------------------------------------
+
+    def current(self) -> CompiledRules:
+        """Rules snapshot to use for one request"""
+        now = time.monotonic()
+        if now >= self._next_check and self._lock.acquire(blocking=False):
+            try:
+                self._next_check = now + self.check_interval
+                self._reload_if_changed()
+            finally:
+                self._lock.release()
+        return self._rules
+
+    @property
+    def version(self) -> str:
+        return self._rules.version
+
+    def add_listener(self, callback: Callable[[CompiledRules], None]):
+        """Call `callback(new_rules)` after every successful reload"""
+        self._listeners.append(callback)
+
+    def reload(self) -> bool:
+        """Force a reload from disk (returns True if new rules were loaded)"""
+        with self._lock:
+            self._mtime = None
+            return self._reload_if_changed()
+
+    # ------------------------------------------------------------------
+
+    def _reload_if_changed(self) -> bool:
+        try:
+            mtime = self.rules_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        if mtime == self._mtime:
+            return False
+
+        try:
+            with open(self.rules_path, encoding="utf-8") as f:
+                rules = CompiledRules.from_dict(json.load(f))
+        except Exception as e:
+            # Keep serving the previous rules
+            logger.error(f"❌ Invalid fraud rules file {self.rules_path}: {e}")
+            self._mtime = mtime
+            return False
+
+        self._mtime = mtime
+        self._rules = rules  # atomic reference swap
+
+        logger.info(
+            f"✅ Fraud rules v{rules.version} loaded: {len(rules.fraud_keywords)} keywords, "
+            f"{len(rules.verified_schemes)} verified schemes"
+        )
+
+        for callback in self._listeners:
+            try:
+                callback(rules)
+            except Exception as e:
+                logger.error(f"Fraud rules listener failed: {e}")
+
+        return True
+
+
+# ----------------------------------------------------------------------
+# Rules file builder
+# ----------------------------------------------------------------------
+
+def build_rules(extra_keywords: Iterable[str] = ()) -> Dict:
+    """
+    Rules document from the built-in rules
+
+    The verified list stays curated: every name on it cancels a fraud
+    verdict, so it is not bulk-filled from schemes.csv (the scheme
+    registry already knows those names and matches them exactly).
+    """
+    verified = list(DEFAULT_VERIFIED_SCHEMES)
+
+    rules = {
+        "fraud_keywords": list(dict.fromkeys(
+            k.lower() for k in [*DEFAULT_FRAUD_KEYWORDS, *extra_keywords]
+        )),
+        "signal_phrases": DEFAULT_SIGNAL_PHRASES,
+        "verified_schemes": list(dict.fromkeys(verified)),
+    }
+
+    digest = hashlib.sha256(
+        json.dumps(rules, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:12]
+
+    return {
+        "version": digest,
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        **rules,
+    }
+
+
+def write_rules(rules: Dict, path: Path = DEFAULT_RULES_PATH):
+    """Write atomically so workers never read a half-written file"""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(rules, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+    os.replace(tmp_path, path)
+    logger.info(f"💾 Fraud rules v{rules['version']} written to {path}")
+
+
+_default_registry: Optional[FraudRuleRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_rule_registry() -> FraudRuleRegistry:
+    """Process-wide registry (one compile per worker)"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = FraudRuleRegistry()
+    return _default_registry
+
+
+# CLI: python -m services.fraud_rules [output_path]
+if __name__ == "__main__":
+    import sys
+
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RULES_PATH
+    write_rules(build_rules(), output)
@@ -2,18 +2,39 @@
 Fraud Detection Service - Detects fake loan schemes
 """
 
+import os
 from pathlib import Path
-import joblib
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 from loguru import logger
 
+from services.fraud_rules import CompiledRules, get_rule_registry
+from services.scheme_registry import get_scheme_registry
+from utils.model_bundle import load_artifacts
+from utils.verdict_cache import VerdictCache, normalize_text
+
+# Compiled once - used on every request
+_PHONE_RE = re.compile(r"\d{10}")
+_ADVANCE_PAYMENT_RE = re.compile(r"(advance|एडवांस).*(₹|\d+)", re.IGNORECASE)
+
 
 class FraudService:
     """
     Fraud detection for loan schemes
     """
 
+    # Model artifacts: one bundle, or the legacy pickles
+    BUNDLE_NAME = "fraud.bundle"
+    LEGACY_FILES = {
+        "model": "fraud_detector_model.pkl",
+        "vectorizer": "fraud_vectorizer.pkl",
+    }
+    REQUIRED_ARTIFACTS = ("model", "vectorizer")
+    FEATURE_SCHEMA = {
+        "input": "text",
+        "text_fields": ["scheme_name", "description", "source", "contact"],
+    }
+
     def __init__(self):
         BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -22,130 +43,215 @@ class FraudService:
 
         self.model = None
         self.vectorizer = None
+        self.model_version = "none"
 
-        # Fraud keywords (Hindi + English)
-        self.fraud_keywords = [
-            "instant approval", "no documents", "guaranteed loan",
-            "pay first", "advance fee", "processing fee upfront",
-            "तुरंत स्वीकृति", "बिना दस्तावेज", "पक्की मंजूरी",
-            "पहले पैसे दें", "एडवांस फीस", "प्रोसेसिंग शुल्क पहले",
-            "100% approval", "no credit check", "urgent loan",
-            "whatsapp loan", "telegram loan", "personal loan agent"
-        ]
+        # ML score + rule matches per normalized text; repeated forwards
+        # skip vectorizing and scanning entirely
+        self.cache = VerdictCache(
+            maxsize=int(os.getenv("FRAUD_CACHE_SIZE", 10000)),
+            near_distance=int(os.getenv("FRAUD_NEAR_DUP_DISTANCE", 6))
+        )
 
-        # Government verified schemes
-        self.verified_schemes = [
-            "pradhan mantri mudra yojana",
-            "kisan credit card",
-            "stand up india",
-            "प्रधानमंत्री मुद्रा योजना",
-            "किसान क्रेडिट कार्ड",
-            "स्टैंड अप इंडिया",
-            "nabard",
-            "sidbi",
-            "pmegp",
-            "shishu",
-            "kishor",
-            "tarun"
-        ]
+        # Keywords + verified schemes - versioned and hot-reloaded
+        self.rules = get_rule_registry()
+        self.rules.add_listener(lambda _: self.cache.clear())
+
+        # Official scheme names + aliases (KCC, मनरेगा, ...) - indexed once
+        self.schemes = get_scheme_registry()
 
         self._load_model()
 
+    @property
+    def fraud_keywords(self) -> List[str]:
+        return list(self.rules.current().fraud_keywords)
+
+    @property
+    def verified_schemes(self) -> List[str]:
+        return list(self.rules.current().verified_schemes)
+
     # ------------------------------------------------------------------
 
     def _load_model(self):
         """Load trained fraud detection model"""
 
-        model_path = self.model_dir / "fraud_detector_model.pkl"
-        vectorizer_path = self.model_dir / "fraud_vectorizer.pkl"
-
-        if not model_path.exists() or not vectorizer_path.exists():
+        try:
+            objects, manifest = load_artifacts(
+                self.model_dir, self.BUNDLE_NAME, self.LEGACY_FILES,
+                required=self.REQUIRED_ARTIFACTS
+            )
+        except FileNotFoundError:
             logger.warning(
                 f"⚠️ Fraud ML model not found, using rule-based detection only\n"
                 f"📁 Checked path: {self.model_dir}"
             )
             return
 
-        try:
-            self.model = joblib.load(model_path)
-            self.vectorizer = joblib.load(vectorizer_path)
-
-            logger.success("✅ Fraud detection model loaded successfully")
-
         except Exception as e:
             logger.exception("❌ Failed to load fraud detection model")
             self.model = None
             self.vectorizer = None
+            self.model_version = "none"
+            self.cache.clear()
+            return
+
+        self.model = objects["model"]
+        self.vectorizer = objects["vectorizer"]
+        self.model_version = manifest["version"]
+        self.cache.clear()
+
+        logger.success("✅ Fraud detection model loaded successfully")
 
     # ------------------------------------------------------------------
 
     def detect_fraud(self, scheme_data: Dict) -> Dict[str, any]:
         """Detect if a scheme is fraudulent"""
+        return self.detect_fraud_batch([scheme_data])[0]
 
-        scheme_name = scheme_data.get("scheme_name", "").lower()
-        description = scheme_data.get("description", "").lower()
-        source = scheme_data.get("source", "").lower()
-        contact = scheme_data.get("contact", "").lower()
+    def detect_fraud_batch(self, schemes: List[Dict]) -> List[Dict[str, any]]:
+        """
+        Screen many schemes at once
 
-        combined_text = f"{scheme_name} {description} {source} {contact}"
+        All texts are vectorized in one sparse-matrix call and scored
+        with a single predict_proba; rules run against one snapshot.
+        """
+        if not schemes:
+            return []
 
-        # Verified scheme check
-        is_verified = self._is_verified_scheme(scheme_name)
+        # One rules snapshot for the whole batch
+        rules = self.rules.current()
 
-        # Rule-based signals
-        fraud_signals = self._detect_fraud_signals(combined_text)
+        names = [s.get("scheme_name", "").lower() for s in schemes]
+        texts = [
+            normalize_text(
+                f"{name} {s.get('description', '')} {s.get('source', '')} {s.get('contact', '')}"
+            )
+            for name, s in zip(names, schemes)
+        ]
 
-        # ML-based score
-        ml_score = 0.0
-        if self.model and self.vectorizer:
-            try:
-                vec = self.vectorizer.transform([combined_text])
-                ml_score = float(self.model.predict_proba(vec)[0][1])
-            except Exception as e:
-                logger.error(f"ML fraud prediction failed: {e}")
+        # Cached results are only valid for this rules + model pair
+        namespace = f"{rules.version}:{self.model_version}"
+        cores = [self._cached_core(text, namespace, rules) for text in texts]
 
-        rule_score = min(len(fraud_signals) * 0.2, 1.0)
-        final_score = max(ml_score, rule_score)
+        # Score every miss together in one vectorize/predict pass
+        misses = [i for i, core in enumerate(cores) if core is None]
+        if misses:
+            ml_scores = self._score_texts([texts[i] for i in misses])
+            for i, ml_score in zip(misses, ml_scores):
+                cores[i] = {
+                    "ml_score": ml_score,
+                    "signal_matches": self._match_fraud_signals(texts[i], rules)
+                }
+                self.cache.put(texts[i], cores[i], namespace)
 
-        is_fraud = final_score > 0.5 and not is_verified
+        results = []
+        for scheme_name, core in zip(names, cores):
+            ml_score = core["ml_score"]
+            signal_matches = [dict(m) for m in core["signal_matches"]]
 
-        messages = self._generate_warning_messages(
-            is_fraud, is_verified, fraud_signals, scheme_name
-        )
+            # Verified scheme check
+            is_verified = self._is_verified_scheme(scheme_name, rules)
 
-        return {
-            "is_fraud": is_fraud,
-            "confidence": round(final_score, 2),
-            "fraud_signals": fraud_signals,
-            "warning_message_hindi": messages["hindi"],
-            "warning_message_english": messages["english"],
-            "verified": is_verified
-        }
+            fraud_signals = list(dict.fromkeys(m["signal"] for m in signal_matches))
+
+            rule_score = min(len(fraud_signals) * 0.2, 1.0)
+            final_score = max(ml_score, rule_score)
+
+            is_fraud = final_score > 0.5 and not is_verified
+
+            messages = self._generate_warning_messages(
+                is_fraud, is_verified, fraud_signals, scheme_name
+            )
+
+            results.append({
+                "is_fraud": is_fraud,
+                "confidence": round(final_score, 2),
+                "fraud_signals": fraud_signals,
+                "warning_message_hindi": messages["hindi"],
+                "warning_message_english": messages["english"],
+                "verified": is_verified,
+                "signal_matches": signal_matches,
+                "rules_version": rules.version
+            })
+
+        return results
+
+    def _cached_core(self, text: str, namespace: str, rules: CompiledRules) -> Optional[Dict]:
+        """
+        Cached ML score + rule matches for text, or None on a miss
+
+        A near-duplicate hit reuses only the ML score; rules are re-run
+        so signals and offsets always describe this exact text.
+        """
+        core, how = self.cache.get(text, namespace)
+        if how == "near":
+            return {
+                "ml_score": core["ml_score"],
+                "signal_matches": self._match_fraud_signals(text, rules)
+            }
+        return core
+
+    def _score_texts(self, texts: List[str]) -> List[float]:
+        """ML fraud probability per text (0.0 when no model is loaded)"""
+        if not (self.model and self.vectorizer):
+            return [0.0] * len(texts)
+
+        try:
+            vec = self.vectorizer.transform(texts)
+            return self.model.predict_proba(vec)[:, 1].astype(float).tolist()
+        except Exception as e:
+            logger.error(f"ML fraud prediction failed: {e}")
+            return [0.0] * len(texts)
 
     # ------------------------------------------------------------------
 
-    def _is_verified_scheme(self, scheme_name: str) -> bool:
-        return any(v in scheme_name for v in self.verified_schemes)
+    def _is_verified_scheme(self, scheme_name: str, rules: Optional[CompiledRules] = None) -> bool:
+        """
+        Exact registry name/alias, or an exact rules-file entry
 
-    def _detect_fraud_signals(self, text: str) -> List[str]:
-        signals = []
+        Only whole names count: a real scheme named inside a pitch
+        ("KCC instant loan") must not cancel the fraud verdict.
+        """
+        if self.schemes.is_known(scheme_name):
+            return True
+        rules = rules or self.rules.current()
+        return rules.is_verified(scheme_name)
 
-        for keyword in self.fraud_keywords:
-            if keyword in text:
-                signals.append(keyword)
+    def _detect_fraud_signals(self, text: str) -> List[str]:
+        return list(dict.fromkeys(m["signal"] for m in self._match_fraud_signals(text)))
+
+    def _match_fraud_signals(self, text: str, rules: Optional[CompiledRules] = None) -> List[Dict]:
+        """
+        All rule matches in one scan of the keyword automaton
+
+        Returns:
+            List of {'signal', 'start', 'end'} with character offsets into text
+        """
+        rules = rules or self.rules.current()
+        matches = [
+            {"signal": m.value, "start": m.start, "end": m.end}
+            for m in rules.signal_matcher.iter_matches(text)
+        ]
 
         # Suspicious contact pattern
-        if re.search(r"\d{10}", text) and ("whatsapp" in text or "telegram" in text):
-            signals.append("suspicious_contact_method")
+        if "whatsapp" in text or "telegram" in text:
+            phone = _PHONE_RE.search(text)
+            if phone:
+                matches.append({
+                    "signal": "suspicious_contact_method",
+                    "start": phone.start(),
+                    "end": phone.end()
+                })
 
         # Advance payment detection
-        if re.search(r"(advance|एडवांस).*(₹|\d+)", text, re.IGNORECASE):
-            signals.append("advance_payment_required")
-
-        if "no verification" in text or "without verification" in text:
-            signals.append("no_verification")
-
-        return list(set(signals))
+        advance = _ADVANCE_PAYMENT_RE.search(text)
+        if advance:
+            matches.append({
+                "signal": "advance_payment_required",
+                "start": advance.start(),
+                "end": advance.end()
+            })
+
+        return matches
 
     # ------------------------------------------------------------------
 
@@ -4,21 +4,25 @@ Predicts eligibility and calculates EMI
 FIXED: Now provides all 11 features the model expects
 """
 
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
 
-import joblib
 import numpy as np
 from loguru import logger
 import sys
 
-def clean_text(text):
-    if text is None or (isinstance(text, float) and text != text):
-        return ""
-    text = str(text).lower()
-    text = ' '.join(text.split())
-    return text.strip()
+from services.emi_engine import emi
+from utils.compiled_model import compile_model
+from utils.debug_log import get_debug_logger
+from utils.label_index import LabelIndex
+from utils.model_bundle import load_artifacts
+from utils.text_normalizer import clean_text
 
+debug_log = get_debug_logger("loan")
+
+# Pickles from the old training notebook reference __main__.clean_text;
+# models trained with training/train_models.py do not need this
 sys.modules['__main__'].clean_text = clean_text
 
 
@@ -28,11 +32,52 @@ class LoanService:
     FIXED: Provides all 11 features
     """
 
+    # Categorical model features in column order:
+    # (name, user_data key, default value, label map attr, encoder attr, default index)
+    CATEGORICAL_FEATURES = [
+        ("gender", "gender", "Male", "gender_map", "gender_encoder", 0),
+        ("married", "marital_status", "No", "status_map", "status_encoder", 0),
+        ("dependents", "dependents", "0", "dependents_map", "dependents_encoder", 0),
+        ("education", "education", "Graduate", "education_map", "edu_encoder", 0),
+        ("employment", "employment_type", "No", "employment_map", "self_emp_encoder", 0),
+        ("property", "property_area", "Semiurban", "property_map", "property_encoder", 1),
+    ]
+
+    # Model artifacts: one bundle, or the legacy per-component pickles
+    BUNDLE_NAME = "loan.bundle"
+    LEGACY_FILES = {
+        "model": "loan_eligibility_model.pkl",
+        "edu_encoder": "edu_encoder.pkl",
+        "self_emp_encoder": "self_emp_encoder.pkl",
+        "status_encoder": "status_encoder.pkl",
+        "gender_encoder": "gender_encoder.pkl",
+        "dependents_encoder": "dependents_encoder.pkl",
+        "property_encoder": "property_encoder.pkl",
+        "text_preprocessor": "text_preprocessor.pkl",
+    }
+    REQUIRED_ARTIFACTS = ("model", "edu_encoder", "self_emp_encoder", "status_encoder")
+    FEATURE_SCHEMA = {
+        "features": [
+            "ApplicantIncome", "CoapplicantIncome", "LoanAmount", "Loan_Amount_Term",
+            "Credit_History", "Gender", "Married", "Dependents", "Education",
+            "Self_Employed", "Property_Area",
+        ]
+    }
+
+    # Fallback classes when an optional encoder is missing
+    DUMMY_ENCODER_CLASSES = {
+        "gender_encoder": [' Male', ' Female'],
+        "dependents_encoder": ['0', '1', '2', '3+'],
+        "property_encoder": [' Rural', ' Semiurban', ' Urban'],
+    }
+
     def __init__(self):
         BASE_DIR = Path(__file__).resolve().parent.parent
         self.model_dir = BASE_DIR / "models" / "loan_eligibility"
 
         self.model = None
+        self.model_version = None
+        self.fast_model = None  # numpy predict_proba, None -> sklearn
         self.edu_encoder = None
         self.self_emp_encoder = None
         self.status_encoder = None
@@ -51,50 +96,40 @@ class LoanService:
         self.dependents_map = {}
         self.property_map = {}
 
+        # Precompiled variant -> code lookups, one per categorical feature
+        self.label_indexes: Dict[str, LabelIndex] = {}
+
         self._load_model()
         self._build_label_maps()
+        self._compile_label_indexes()
         
         # Log expected feature count
         if self.model:
             logger.info(f"Model expects {self.model.n_features_in_} features")
 
+            if os.getenv("LOAN_COMPILED_INFERENCE", "true").lower() == "true":
+                self.fast_model = compile_model(self.model)
+
     # ------------------------------------------------------------------
 
     def _load_model(self):
         """Load model and all encoders"""
         try:
-            # Core files
-            self.model = joblib.load(self.model_dir / "loan_eligibility_model.pkl")
-            self.edu_encoder = joblib.load(self.model_dir / "edu_encoder.pkl")
-            self.self_emp_encoder = joblib.load(self.model_dir / "self_emp_encoder.pkl")
-            self.status_encoder = joblib.load(self.model_dir / "status_encoder.pkl")
-            
-            # Try to load additional encoders if they exist
-            try:
-                self.gender_encoder = joblib.load(self.model_dir / "gender_encoder.pkl")
-                logger.info("✅ Gender encoder loaded")
-            except FileNotFoundError:
-                logger.warning("⚠️  Gender encoder not found - will create dummy")
-                self.gender_encoder = self._create_dummy_encoder([' Male', ' Female'])
-            
-            try:
-                self.dependents_encoder = joblib.load(self.model_dir / "dependents_encoder.pkl")
-                logger.info("✅ Dependents encoder loaded")
-            except FileNotFoundError:
-                logger.warning("⚠️  Dependents encoder not found - will create dummy")
-                self.dependents_encoder = self._create_dummy_encoder(['0', '1', '2', '3+'])
-            
-            try:
-                self.property_encoder = joblib.load(self.model_dir / "property_encoder.pkl")
-                logger.info("✅ Property encoder loaded")
-            except FileNotFoundError:
-                logger.warning("⚠️  Property encoder not found - will create dummy")
-                self.property_encoder = self._create_dummy_encoder([' Rural', ' Semiurban', ' Urban'])
-            
-            try:
-                self.text_preprocessor = joblib.load(self.model_dir / "text_preprocessor.pkl")
-            except:
-                pass
+            objects, manifest = load_artifacts(
+                self.model_dir, self.BUNDLE_NAME, self.LEGACY_FILES,
+                required=self.REQUIRED_ARTIFACTS,
+                features=self.FEATURE_SCHEMA["features"]
+            )
+            self.model_version = manifest["version"]
+
+            for attr in self.LEGACY_FILES:
+                setattr(self, attr, objects.get(attr))
+
+            # Optional encoders fall back to dummies
+            for attr, classes in self.DUMMY_ENCODER_CLASSES.items():
+                if getattr(self, attr) is None:
+                    logger.warning(f"⚠️  {attr} not found - will create dummy")
+                    setattr(self, attr, self._create_dummy_encoder(classes))
 
             logger.success("✅ Loan eligibility model loaded")
             logger.info(f"Education classes: {list(self.edu_encoder.classes_)}")
@@ -237,27 +272,34 @@ class LoanService:
 
     # ------------------------------------------------------------------
 
-    def _map_label(self, user_input: str, label_map: dict, encoder_name: str, default_idx: int = 0) -> str:
-        """Smart label mapping"""
-        if not user_input:
-            return list(label_map.values())[default_idx] if label_map else ""
-        
-        user_input_clean = str(user_input).strip().lower()
-        
-        if user_input in label_map:
-            return label_map[user_input]
-        
-        if user_input_clean in label_map:
-            return label_map[user_input_clean]
-        
-        for key, value in label_map.items():
-            if user_input_clean in key.lower() or key.lower() in user_input_clean:
-                logger.info(f"Fuzzy matched '{user_input}' -> '{value}' in {encoder_name}")
-                return value
-        
-        default = list(label_map.values())[default_idx] if label_map else ""
-        logger.warning(f"No match for '{user_input}' in {encoder_name}, using: '{default}'")
-        return default
+    def _compile_label_indexes(self):
+        """Compile every label map into a single variant -> code lookup"""
+        for name, _, _, map_attr, encoder_attr, default_idx in self.CATEGORICAL_FEATURES:
+            encoder = getattr(self, encoder_attr)
+            if encoder is None:
+                continue
+            self.label_indexes[name] = LabelIndex(
+                getattr(self, map_attr), encoder.classes_, default_idx
+            )
+
+    def _encode(self, name: str, user_input) -> Tuple[int, str]:
+        """
+        Map user input to (encoder code, model label) for one feature
+        """
+        if name == "dependents":
+            user_input = str(user_input)
+
+        code, label, how = self.label_indexes[name].lookup(user_input)
+
+        if how == "fuzzy":
+            debug_log.log("fuzzy_match", feature=name, user_input=user_input, label=label)
+        elif how == "default" and user_input:
+            logger.warning(f"No match for '{user_input}' in {name}, using: '{label}'")
+
+        if code is None:
+            raise ValueError(f"No label mapping available for {name}")
+
+        return code, label
 
     # ------------------------------------------------------------------
 
@@ -273,14 +315,13 @@ class LoanService:
             # Verify feature count
             expected = self.model.n_features_in_
             actual = features.shape[1]
-            logger.info(f"Features: expected={expected}, actual={actual}")
             
             if actual != expected:
                 logger.error(f"Feature mismatch! Expected {expected}, got {actual}")
                 return self._error_response(f"Feature count mismatch: {actual} vs {expected}")
             
-            prediction = self.model.predict(features)[0]
-            probability = self.model.predict_proba(features)[0]
+            probability = self._predict_proba(features)[0]
+            prediction = self.model.classes_[probability.argmax()]
 
             eligible = bool(prediction == 1)
             confidence = float(max(probability))
@@ -303,6 +344,66 @@ class LoanService:
             logger.exception("❌ Loan prediction error")
             return self._error_response("आंतरिक त्रुटि")
 
+    def predict_eligibility_batch(self, records: List[Dict]) -> List[Dict[str, any]]:
+        """
+        Predict loan eligibility for many applicants at once
+
+        Builds one N×11 feature matrix, encodes each categorical column
+        in a single transform call and runs one predict_proba.
+        """
+        if not records:
+            return []
+
+        if self.model is None:
+            return [self._error_response("मॉडल लोड नहीं हो पाया") for _ in records]
+
+        try:
+            features = self._prepare_features_batch(records)
+
+            expected = self.model.n_features_in_
+            actual = features.shape[1]
+            if actual != expected:
+                logger.error(f"Feature mismatch! Expected {expected}, got {actual}")
+                error = self._error_response(f"Feature count mismatch: {actual} vs {expected}")
+                return [dict(error) for _ in records]
+
+            probabilities = self._predict_proba(features)
+            predictions = self.model.classes_[probabilities.argmax(axis=1)]
+
+            eligible = predictions == 1
+            confidence = probabilities.max(axis=1)
+
+            loan_details = self._calculate_loan_details_batch(records, eligible)
+
+            results = []
+            for i in range(len(records)):
+                details = {key: values[i] for key, values in loan_details.items()}
+                messages = self._generate_messages(bool(eligible[i]), details)
+
+                results.append({
+                    "eligible": bool(eligible[i]),
+                    "confidence": round(float(confidence[i]), 2),
+                    "recommended_amount": details["recommended_amount"],
+                    "emi": details["emi"],
+                    "interest_rate": details["interest_rate"],
+                    "tenure_months": details["tenure_months"],
+                    "message_hindi": messages["hindi"],
+                    "message_english": messages["english"],
+                })
+
+            logger.info(f"✅ Batch prediction: {int(eligible.sum())}/{len(records)} eligible")
+            return results
+
+        except Exception:
+            logger.exception("❌ Batch loan prediction error")
+            return [self._error_response("आंतरिक त्रुटि") for _ in records]
+
+    def _predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Class probabilities - compiled path when available, else sklearn"""
+        if self.fast_model is not None:
+            return self.fast_model.predict_proba(features)
+        return self.model.predict_proba(features)
+
     # ------------------------------------------------------------------
 
     def _prepare_features(self, user_data: Dict) -> np.ndarray:
@@ -330,40 +431,14 @@ class LoanService:
         loan_term = user_data.get("loan_term", 360)  # NEW: Default 360 months (30 years)
         credit_history = 1.0 if user_data.get("credit_score", 300) >= 650 else 0.0  # NEW: Binary
         
-        # Categorical features - raw
-        gender_raw = user_data.get("gender", "Male")  # NEW
-        married_raw = user_data.get("marital_status", "No")
-        dependents_raw = str(user_data.get("dependents", "0"))  # NEW
-        education_raw = user_data.get("education", "Graduate")
-        self_employed_raw = user_data.get("employment_type", "No")
-        property_area_raw = user_data.get("property_area", "Semiurban")  # NEW
-        
-        # Map to model labels
-        gender = self._map_label(gender_raw, self.gender_map, "gender", 0)
-        married = self._map_label(married_raw, self.status_map, "married", 0)
-        dependents = self._map_label(dependents_raw, self.dependents_map, "dependents", 0)
-        education = self._map_label(education_raw, self.education_map, "education", 0)
-        self_employed = self._map_label(self_employed_raw, self.employment_map, "employment", 0)
-        property_area = self._map_label(property_area_raw, self.property_map, "property", 1)
-        
-        logger.info(f"Mapping - Gender: '{gender_raw}' -> '{gender}'")
-        logger.info(f"Mapping - Married: '{married_raw}' -> '{married}'")
-        logger.info(f"Mapping - Dependents: '{dependents_raw}' -> '{dependents}'")
-        logger.info(f"Mapping - Education: '{education_raw}' -> '{education}'")
-        logger.info(f"Mapping - Self_Employed: '{self_employed_raw}' -> '{self_employed}'")
-        logger.info(f"Mapping - Property: '{property_area_raw}' -> '{property_area}'")
-        
-        # Encode categorical features
-        try:
-            gender_enc = self.gender_encoder.transform([gender])[0]
-            married_enc = self.status_encoder.transform([married])[0]
-            dependents_enc = self.dependents_encoder.transform([dependents])[0]
-            education_enc = self.edu_encoder.transform([education])[0]
-            self_employed_enc = self.self_emp_encoder.transform([self_employed])[0]
-            property_enc = self.property_encoder.transform([property_area])[0]
-        except Exception as e:
-            logger.error(f"Encoding error: {e}")
-            raise
+        # Categorical features - mapped straight to encoder codes
+        encoded = []
+        mapping = {}
+        for name, key, default, *_ in self.CATEGORICAL_FEATURES:
+            raw = user_data.get(key, default)
+            code, label = self._encode(name, raw)
+            mapping[name] = (raw, label)
+            encoded.append(code)
         
         # Build feature array in correct order
         features = np.array([[
@@ -372,19 +447,49 @@ class LoanService:
             loan_amount,           # 3
             loan_term,             # 4
             credit_history,        # 5
-            gender_enc,            # 6
-            married_enc,           # 7
-            dependents_enc,        # 8
-            education_enc,         # 9
-            self_employed_enc,     # 10
-            property_enc           # 11
-        ]])
+            *encoded               # 6-11: gender, married, dependents,
+                                   #       education, self_employed, property
+        ]], dtype=np.float64)
         
-        logger.info(f"Feature array shape: {features.shape}")
-        logger.info(f"Features: {features[0]}")
+        debug_log.log(
+            "features",
+            mapping=mapping,
+            income=applicant_income,
+            loan_amount_requested=user_data.get("loan_amount_requested", 0),
+            credit_score=user_data.get("credit_score"),
+            shape=features.shape,
+        )
         
         return features
 
+    def _prepare_features_batch(self, records: List[Dict]) -> np.ndarray:
+        """
+        Prepare the N×11 feature matrix for a batch of applicants
+
+        Same column order and defaults as _prepare_features.
+        """
+        def column(key, default):
+            return [record.get(key, default) for record in records]
+
+        def encode(name, key, default):
+            return [self._encode(name, raw)[0] for raw in column(key, default)]
+
+        n = len(records)
+        features = np.empty((n, 11), dtype=np.float64)
+
+        # Numeric features
+        features[:, 0] = column("income", 0)
+        features[:, 1] = column("coapplicant_income", 0)
+        features[:, 2] = np.asarray(column("loan_amount_requested", 0), dtype=np.float64) / 1000
+        features[:, 3] = column("loan_term", 360)
+        features[:, 4] = np.asarray(column("credit_score", 300), dtype=np.float64) >= 650
+
+        # Categorical features - precompiled code lookups per column
+        for offset, (name, key, default, *_) in enumerate(self.CATEGORICAL_FEATURES):
+            features[:, 5 + offset] = encode(name, key, default)
+
+        return features
+
     # ------------------------------------------------------------------
 
     def _calculate_loan_details(self, user_data: Dict, eligible: bool) -> Dict:
@@ -398,19 +503,34 @@ class LoanService:
         recommended = min(requested, max_eligible) if eligible else 0
         tenure_months = 36
 
-        if recommended > 0:
-            r = interest_rate / (12 * 100)
-            emi = recommended * r * (1 + r) ** tenure_months / ((1 + r) ** tenure_months - 1)
-        else:
-            emi = 0
+        monthly = float(emi(recommended, interest_rate, tenure_months))
 
         return {
             "recommended_amount": round(recommended, 2),
-            "emi": round(emi, 2),
+            "emi": round(monthly, 2),
             "interest_rate": interest_rate,
             "tenure_months": tenure_months,
         }
 
+    def _calculate_loan_details_batch(self, records: List[Dict], eligible: np.ndarray) -> Dict[str, list]:
+        """Vectorized _calculate_loan_details for a batch"""
+        requested = np.array([r.get("loan_amount_requested", 0) for r in records], dtype=np.float64)
+        income = np.array([r.get("income", 0) for r in records], dtype=np.float64)
+        interest_rate = np.array([self._get_interest_rate(r) for r in records], dtype=np.float64)
+
+        max_eligible = income * 60
+        recommended = np.where(eligible, np.minimum(requested, max_eligible), 0.0)
+        tenure_months = 36
+
+        monthly = emi(recommended, interest_rate, tenure_months)
+
+        return {
+            "recommended_amount": np.round(recommended, 2).tolist(),
+            "emi": np.round(monthly, 2).tolist(),
+            "interest_rate": interest_rate.tolist(),
+            "tenure_months": [tenure_months] * len(records),
+        }
+
     def _get_interest_rate(self, user_data: Dict) -> float:
         """Interest rate based on profile"""
         credit = user_data.get("credit_score", 300)
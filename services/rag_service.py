@@ -2,13 +2,26 @@
 RAG Service - High-level service combining RAG + LLM
 """
 
-from typing import Dict
+import os
+from typing import Dict, List, Optional
 from loguru import logger
 
+from rag.extractive import ExtractiveAnswerer, content_tokens
 from rag.rag_pipeline import RAGPipeline
+from services.faq_index import get_faq_index
+from services.scheme_registry import Scheme, get_scheme_registry
 from utils.llm_client import LLMClient
 
 
+# Words that only ask "what is it" - a question made of these plus one
+# scheme name is answered from the scheme registry
+DEFINITION_WORDS = {
+    "योजना", "स्कीम", "मतलब", "अर्थ", "बारे", "जानकारी", "बताएं", "समझाओ", "समझाइए",
+    "scheme", "yojana", "meaning", "mean", "explain", "kya", "hai", "batao", "bare", "mein",
+    "information", "info", "describe", "please",
+}
+
+
 class RAGService:
     """
     Service for RAG-based question answering
@@ -19,6 +32,16 @@ class RAGService:
         self.llm_client = LLMClient()
         self._initialized = False  # ✅ prevents double indexing
 
+        # Answer confident hits straight from the chunk, skipping the LLM
+        self.extractive = (
+            ExtractiveAnswerer(embedder=self.rag_pipeline.embedder)
+            if os.getenv('RAG_EXTRACTIVE', 'true').lower() == 'true' else None
+        )
+        self.schemes = get_scheme_registry()
+
+        # Precomputed answers for frequent questions (python -m services.faq_index)
+        self.faq = get_faq_index() if os.getenv('RAG_FAQ', 'true').lower() == 'true' else None
+
         logger.info("🧠 RAGService created (lazy initialization enabled)")
 
     def _ensure_initialized(self):
@@ -33,33 +56,71 @@ class RAGService:
         self,
         question: str,
         language: str = "hindi",
-        include_sources: bool = True
+        include_sources: bool = True,
+        filters: Optional[Dict] = None,
+        use_faq: bool = True
     ) -> Dict[str, any]:
         """
         Answer a question using RAG + LLM
+
+        filters optionally restrict retrieval to matching chunks
+        (source, language, scheme, page_from/page_to); use_faq=False
+        bypasses the FAQ index (the FAQ builder itself)
         """
         try:
+            if self.faq and use_faq and not filters:
+                entry, how = self.faq.lookup(question, language)
+                if entry is not None:
+                    return self._faq_answer(entry, how, include_sources)
+
+            # "What is KCC?" - straight from the scheme registry
+            scheme = self._definitional_scheme(question) if self.extractive and not filters else None
+            if scheme is not None:
+                return self._registry_answer(scheme, include_sources)
+
             # ✅ Ensure index exists
             self._ensure_initialized()
 
-            rag_result = self.rag_pipeline.query(question, language=language)
+            rag_result = self.rag_pipeline.query(question, language=language, filters=filters)
 
             if not rag_result.get('context'):
                 return {
                     'answer': "क्षमा करें, मुझे इस प्रश्न का उत्तर देने के लिए पर्याप्त जानकारी नहीं है।",
                     'sources': [],
                     'context_used': '',
-                    'confidence': 0.0
+                    'confidence': 0.0,
+                    'answer_mode': 'none'
+                }
+
+            extracted = (
+                self.extractive.answer(question, rag_result['retrieved_chunks'])
+                if self.extractive else None
+            )
+            if extracted:
+                answer = f"📄 {extracted['answer']}"
+                if include_sources:
+                    answer += f"\n\n📚 स्रोत: {', '.join(extracted['sources'])}"
+
+                return {
+                    'answer': answer,
+                    'sources': extracted['sources'],
+                    'context_used': rag_result['context'][:500],
+                    'confidence': extracted['confidence'],
+                    'answer_mode': 'extractive'
                 }
 
             answer = self.llm_client.generate(
-                rag_result['prompt'],
+                rag_result['user_prompt'],
                 max_tokens=400,
-                temperature=0.3
+                temperature=0.3,
+                system_prompt=rag_result['system_prompt'],
+                raise_errors=True  # an apology is not an answer (answer_mode 'none')
             )
 
+            # Calibrated scores are comparable across queries; raw
+            # L2-derived similarities are not
             avg_score = sum(
-                c['score'] for c in rag_result['retrieved_chunks']
+                c.get('calibrated_score', c['score']) for c in rag_result['retrieved_chunks']
             ) / len(rag_result['retrieved_chunks'])
 
             if include_sources and rag_result.get('sources'):
@@ -69,7 +130,8 @@ class RAGService:
                 'answer': answer,
                 'sources': rag_result['sources'],
                 'context_used': rag_result['context'][:500],
-                'confidence': round(float(avg_score), 2)
+                'confidence': round(float(avg_score), 2),
+                'answer_mode': 'generative'
             }
 
         except Exception as e:
@@ -78,14 +140,68 @@ class RAGService:
                 'answer': "क्षमा करें, अभी उत्तर उपलब्ध नहीं है।",
                 'sources': [],
                 'context_used': '',
-                'confidence': 0.0
+                'confidence': 0.0,
+                'answer_mode': 'none'
             }
 
+    def _faq_answer(self, entry: Dict, how: str, include_sources: bool) -> Dict[str, any]:
+        answer = entry['answer']
+        sources = entry.get('sources', [])
+        if include_sources and sources:
+            answer += f"\n\n📚 स्रोत: {', '.join(sources)}"
+
+        logger.info(f"⚡ FAQ {how} hit (v{self.faq.version}): {entry['question'][:60]}")
+        return {
+            'answer': answer,
+            'sources': sources,
+            'context_used': '',
+            'confidence': entry.get('confidence', 0.0),
+            'answer_mode': 'faq'
+        }
+
+    def _definitional_scheme(self, question: str) -> Optional[Scheme]:
+        """The one scheme a "what is X" question asks about, else None"""
+        mentioned = self.schemes.find_in_text(question)
+        if len(mentioned) != 1:
+            return None
+
+        scheme = mentioned[0]
+        name_words = set(content_tokens(" ".join(
+            [scheme.name, scheme.name_hi or "", scheme.id.replace("-", " "), *scheme.aliases]
+        )))
+        leftover = [
+            t for t in content_tokens(question)
+            if t not in name_words and t not in DEFINITION_WORDS
+        ]
+        return None if leftover else scheme
+
+    def _registry_answer(self, scheme: Scheme, include_sources: bool) -> Dict[str, any]:
+        title = f"{scheme.name_hi} ({scheme.name})" if scheme.name_hi else scheme.name
+        lines = [f"🏛️ {title}", scheme.description]
+        if scheme.amount_max:
+            lines.append(f"💰 अधिकतम राशि: ₹{scheme.amount_max:,.0f}")
+        if scheme.interest_rate:
+            lines.append(f"📈 ब्याज दर: {scheme.interest_rate}")
+
+        sources = [scheme.source] if scheme.source else []
+        answer = "\n".join(lines)
+        if include_sources and sources:
+            answer += f"\n\n📚 स्रोत: {', '.join(sources)}"
+
+        logger.info(f"⚡ Registry answer: {scheme.id}")
+        return {
+            'answer': answer,
+            'sources': sources,
+            'context_used': scheme.description,
+            'confidence': 1.0,
+            'answer_mode': 'extractive'
+        }
+
     def explain_scheme(self, scheme_name: str) -> str:
         try:
             self._ensure_initialized()
-            prompt = self.rag_pipeline.explain_scheme(scheme_name)
-            return self.llm_client.generate(prompt, max_tokens=600)
+            system_prompt, prompt = self.rag_pipeline.scheme_messages(scheme_name)
+            return self.llm_client.generate(prompt, max_tokens=600, system_prompt=system_prompt)
         except Exception as e:
             logger.error(f"Error explaining scheme: {e}")
             return "क्षमा करें, योजना की जानकारी नहीं मिली।"
@@ -93,19 +209,25 @@ class RAGService:
     def explain_term(self, term: str) -> str:
         try:
             self._ensure_initialized()
-            prompt = self.rag_pipeline.explain_term(term)
-            return self.llm_client.generate(prompt, max_tokens=300)
+            system_prompt, prompt = self.rag_pipeline.term_messages(term)
+            return self.llm_client.generate(prompt, max_tokens=300, system_prompt=system_prompt)
         except Exception as e:
             logger.error(f"Error explaining term: {e}")
             return "क्षमा करें, शब्द का अर्थ नहीं मिला।"
 
+    def get_filter_options(self) -> Dict[str, List[str]]:
+        self._ensure_initialized()
+        return self.rag_pipeline.get_filter_options()
+
     def get_service_status(self) -> Dict[str, any]:
         rag_stats = self.rag_pipeline.get_stats()
-        llm_available = self.llm_client.client is not None
+        llm_available = self.llm_client.is_available()
 
         return {
             'rag_status': rag_stats.get('status', 'unknown'),
             'llm_available': llm_available,
+            'llm_backends': self.llm_client.router.stats(),
+            'faq': self.faq.stats() if self.faq else None,
             'total_documents': rag_stats.get('total_chunks', 0),
             'service_healthy': rag_stats.get('status') == 'indexed'
         }
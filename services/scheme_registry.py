@@ -0,0 +1,443 @@
+"""
+Scheme Registry - Indexed in-memory knowledge base of government schemes
+schemes.csv (plus a few built-in loan schemes) is loaded once into
+dictionary/trie/posting indexes, so lookups never need the LLM
+"""
+
+import csv
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from loguru import logger
+
+from utils.keyword_matcher import KeywordMatcher
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SCHEMES_CSV = BASE_DIR / "data" / "processed" / "schemes.csv"
+
+# Loan schemes the API always listed, not (yet) in schemes.csv
+BUILTIN_SCHEMES = [
+    {
+        "scheme_name": "Pradhan Mantri MUDRA Yojana",
+        "description": "Collateral-free loans up to ₹10 lakh for non-farm micro enterprises "
+                       "under Shishu, Kishore and Tarun categories",
+        "source": "mudra.org.in",
+    },
+    {
+        "scheme_name": "Stand Up India",
+        "description": "Bank loans between ₹10 lakh and ₹1 crore for SC/ST and women "
+                       "entrepreneurs setting up greenfield enterprises",
+        "source": "standupmitra.in",
+    },
+]
+
+# Curated extras keyed by scheme id: Hindi name, aliases, loan terms.
+# amount_min/amount_max are loan limits and only ever come from here -
+# amounts in descriptions are pensions, fund sizes or benefit payouts.
+# "purpose" is the label the old hard-coded /loan/schemes list used
+SCHEME_DETAILS: Dict[str, Dict] = {
+    "pradhan-mantri-mudra-yojana": {
+        "name_hi": "प्रधानमंत्री मुद्रा योजना",
+        "aliases": ["mudra", "pm mudra", "pmmy", "मुद्रा", "मुद्रा योजना", "mudra loan"],
+        "amount_max": 1000000, "interest_rate": "8-12%", "purpose": "Business",
+    },
+    "stand-up-india": {
+        "name_hi": "स्टैंड अप इंडिया",
+        "aliases": ["standup india", "stand-up india"],
+        "amount_min": 1000000, "amount_max": 10000000, "interest_rate": "Base rate + margin",
+        "purpose": "SC/ST/Women entrepreneurs",
+    },
+    "kisan-credit-card": {
+        "name_hi": "किसान क्रेडिट कार्ड",
+        "aliases": ["kcc", "किसान क्रेडिट कार्ड", "केसीसी"],
+        "amount_max": 300000, "interest_rate": "4-7%", "purpose": "Agriculture",
+    },
+    "pm-kisan-samman-nidhi": {
+        "name_hi": "पीएम किसान सम्मान निधि",
+        "aliases": ["pm kisan", "pm-kisan", "पीएम किसान", "किसान सम्मान निधि"],
+    },
+    "pradhan-mantri-fasal-bima-yojana": {
+        "name_hi": "प्रधानमंत्री फसल बीमा योजना",
+        "aliases": ["pmfby", "fasal bima", "फसल बीमा", "फसल बीमा योजना"],
+    },
+    "mahatma-gandhi-national-rural-employment-guarantee-act": {
+        "name_hi": "मनरेगा",
+        "aliases": ["mgnrega", "nrega", "manrega", "मनरेगा", "नरेगा"],
+    },
+    "pradhan-mantri-awas-yojana-gramin": {
+        "name_hi": "प्रधानमंत्री आवास योजना ग्रामीण",
+        "aliases": ["pmay-g", "pmayg", "pm awas", "आवास योजना"],
+    },
+    "soil-health-card-scheme": {"name_hi": "मृदा स्वास्थ्य कार्ड", "aliases": ["मृदा स्वास्थ्य कार्ड"]},
+    "day-nrlm-deendayal-antyodaya-yojana": {"aliases": ["nrlm", "day-nrlm", "आजीविका मिशन"]},
+    "pradhan-mantri-kisan-maan-dhan-yojana": {"aliases": ["pm kmy", "किसान मानधन"]},
+    "enam-electronic-national-agriculture-market": {"aliases": ["enam", "e-nam", "ई-नाम"]},
+    "formation-and-promotion-of-farmer-producer-organizations": {"aliases": ["fpo", "एफपीओ"]},
+    "agri-infrastructure-fund": {
+        # The ₹1 lakh crore in the description is the fund size, not a loan cap
+        "aliases": ["aif", "agri infra fund"],
+        "amount_max": 20000000, "interest_rate": "3% subvention",
+    },
+    "modified-interest-subvention-scheme": {"aliases": ["interest subvention", "ब्याज छूट"]},
+}
+
+# Sector, matched on name + description
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "agriculture": ["farm", "crop", "agricultur", "cultivation", "soil", "horticultur", "organic",
+                    "seed", "fertiliz", "agroforestry", "mechaniz", "edible oil", "bamboo"],
+    "livestock": ["livestock", "dairy", "milk", "bovine", "cow", "gokul", "kamdhenu"],
+    "fisheries": ["fisheries", "fish", "matsya"],
+    "beekeeping": ["beekeeping", "honey"],
+    "water": ["irrigation", "water", "watershed", "rainfed", "drinking"],
+    "housing": ["housing", "pucca house", "awas"],
+    "employment": ["employment", "wage", "livelihood", "self help group", "self-employment"],
+    "enterprise": ["enterprise", "entrepreneur", "business"],
+    "social-security": ["pension", "social security", "old age", "widow"],
+    "infrastructure": ["infrastructure", "road", "connectivity", "warehouse", "cold storage"],
+    "sanitation": ["sanitation", "toilet", "swachh"],
+    "women": ["women", "didi"],
+    "education": ["education", "training", "skill", "capacity building"],
+    "digital": ["digital", "electronic", "drone", "online", "portal"],
+}
+
+# Benefit type
+PURPOSE_KEYWORDS: Dict[str, List[str]] = {
+    "loan": ["loan", "credit", "financing facility"],
+    "subsidy": ["subsidy", "subsidized", "financial assistance", "incentiv", "capital investment"],
+    "insurance": ["insurance", "risk coverage"],
+    "pension": ["pension"],
+    "income-support": ["income support", "direct benefit transfer", "guarantees 100 days"],
+    "training": ["training", "skill", "helpline", "capacity building"],
+    "market-support": ["market", "price support", "procurement", "distress sale"],
+    "infrastructure": ["infrastructure", "road", "connectivity", "warehouse", "drinking water supply"],
+}
+
+# Generic trailing words dropped to form an extra alias ("Soil Health Card")
+_GENERIC_SUFFIXES = {"scheme", "yojana", "programme", "program", "mission", "abhiyan"}
+
+# Anything but Latin/Devanagari word characters separates words; the
+# danda (। ॥) is Devanagari punctuation, so it separates too
+_NON_WORD_RE = re.compile(r"[^\w\u0900-\u0963\u0966-\u097F]+")
+
+
+class Scheme(NamedTuple):
+    id: str
+    name: str
+    name_hi: Optional[str]
+    description: str
+    source: str
+    aliases: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    purposes: Tuple[str, ...]
+    amount_min: Optional[float]
+    amount_max: Optional[float]
+    interest_rate: Optional[str]
+
+    def to_dict(self) -> Dict:
+        data = self._asdict()
+        data["aliases"] = list(self.aliases)
+        data["categories"] = list(self.categories)
+        data["purposes"] = list(self.purposes)
+        # Fields the old hard-coded /loan/schemes list exposed
+        data["max_amount"] = self.amount_max
+        data["purpose"] = SCHEME_DETAILS.get(self.id, {}).get("purpose")
+        data["verified"] = True
+        return data
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase, punctuation to spaces, collapsed - the lookup key"""
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+def slugify(text: str) -> str:
+    return normalize_name(text).replace(" ", "-")
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: Set[str] = set()
+
+
+class NameTrie:
+    """Prefix trie over normalized names/aliases (autocomplete)"""
+
+    def __init__(self):
+        self.root = _TrieNode()
+
+    def insert(self, key: str, scheme_id: str):
+        node = self.root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+        node.ids.add(scheme_id)
+
+    def prefix(self, prefix: str, limit: int = 10) -> List[str]:
+        """Scheme ids whose name/alias starts with prefix, shortest keys first"""
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+
+        found: List[str] = []
+        level = [node]
+        while level and len(found) < limit:
+            next_level = []
+            for current in level:
+                for scheme_id in sorted(current.ids):
+                    if scheme_id not in found:
+                        found.append(scheme_id)
+                next_level.extend(current.children[ch] for ch in sorted(current.children))
+            level = next_level
+        return found[:limit]
+
+
+class SchemeRegistry:
+    """
+    Read-only indexes over all schemes
+
+    by_id / by_key      exact id and name/alias hits (dict)
+    trie                prefix search on names and aliases
+    by_category/purpose posting lists of ids
+    amount index        ids sorted by amount_max for range queries
+    """
+
+    def __init__(self, csv_path: Path = DEFAULT_SCHEMES_CSV):
+        self.csv_path = Path(csv_path)
+        self.by_id: Dict[str, Scheme] = {}
+        self.by_key: Dict[str, List[str]] = {}
+        self.trie = NameTrie()
+        self.by_category: Dict[str, List[str]] = {}
+        self.by_purpose: Dict[str, List[str]] = {}
+        self._amount_keys: List[float] = []
+        self._amount_ids: List[str] = []
+        self._matcher: Optional[KeywordMatcher] = None
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 🔹 LOAD / INDEX
+    # ------------------------------------------------------------------
+    def _load(self):
+        rows = []
+        if self.csv_path.exists():
+            with open(self.csv_path, encoding="utf-8") as f:
+                rows = [r for r in csv.DictReader(f) if (r.get("scheme_name") or "").strip()]
+        else:
+            logger.warning(f"⚠️ {self.csv_path} not found, using built-in schemes only")
+
+        category_matcher = KeywordMatcher(
+            {k: cat for cat, words in CATEGORY_KEYWORDS.items() for k in words}
+        )
+        purpose_matcher = KeywordMatcher(
+            {k: p for p, words in PURPOSE_KEYWORDS.items() for k in words}
+        )
+
+        for row in [*rows, *BUILTIN_SCHEMES]:
+            name = row["scheme_name"].strip()
+            scheme_id = slugify(name)
+            if scheme_id in self.by_id:
+                continue
+
+            description = (row.get("description") or "").strip()
+            details = SCHEME_DETAILS.get(scheme_id, {})
+            text = f"{name} {description}"
+
+            scheme = Scheme(
+                id=scheme_id,
+                name=name,
+                name_hi=details.get("name_hi"),
+                description=description,
+                source=(row.get("source") or "").strip(),
+                aliases=tuple(dict.fromkeys(details.get("aliases", []))),
+                categories=tuple(dict.fromkeys(m.value for m in category_matcher.iter_matches(text))),
+                purposes=tuple(dict.fromkeys(m.value for m in purpose_matcher.iter_matches(text))),
+                amount_min=details.get("amount_min"),
+                amount_max=details.get("amount_max"),
+                interest_rate=details.get("interest_rate"),
+            )
+            self._index(scheme)
+
+        amounts = sorted(
+            (s.amount_max, s.id) for s in self.by_id.values() if s.amount_max is not None
+        )
+        self._amount_keys = [a for a, _ in amounts]
+        self._amount_ids = [i for _, i in amounts]
+
+        self._matcher = KeywordMatcher({
+            key: key for key in self.by_key if len(key) >= 3
+        })
+
+        logger.info(
+            f"🏛️ Scheme registry: {len(self.by_id)} schemes, {len(self.by_key)} names/aliases, "
+            f"{len(self.by_category)} categories"
+        )
+
+    def _keys_for(self, scheme: Scheme) -> Iterable[str]:
+        yield normalize_name(scheme.name)
+        yield scheme.id.replace("-", " ")
+        if scheme.name_hi:
+            yield normalize_name(scheme.name_hi)
+        for alias in scheme.aliases:
+            yield normalize_name(alias)
+
+        words = normalize_name(scheme.name).split()
+        if len(words) > 2 and words[-1] in _GENERIC_SUFFIXES:
+            yield " ".join(words[:-1])
+
+    def _index(self, scheme: Scheme):
+        self.by_id[scheme.id] = scheme
+
+        for key in dict.fromkeys(self._keys_for(scheme)):
+            if not key:
+                continue
+            ids = self.by_key.setdefault(key, [])
+            if scheme.id not in ids:
+                ids.append(scheme.id)
+            self.trie.insert(key, scheme.id)
+
+        for category in scheme.categories:
+            self.by_category.setdefault(category, []).append(scheme.id)
+        for purpose in scheme.purposes:
+            self.by_purpose.setdefault(purpose, []).append(scheme.id)
+
+    # ------------------------------------------------------------------
+    # 🔹 LOOKUPS
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def get(self, scheme_id: str) -> Optional[Scheme]:
+        return self.by_id.get(scheme_id)
+
+    def lookup(self, name: str) -> Optional[Scheme]:
+        """Exact name/alias hit (case and punctuation insensitive)"""
+        ids = self.by_key.get(normalize_name(name))
+        return self.by_id[ids[0]] if ids else None
+
+    def is_known(self, name: str) -> bool:
+        return normalize_name(name) in self.by_key
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Scheme]:
+        return [self.by_id[i] for i in self.trie.prefix(normalize_name(prefix), limit)]
+
+    def find_in_text(self, text: str) -> List[Scheme]:
+        """
+        Schemes named anywhere in free text (whole-word matches), longest
+        mention first
+        """
+        normalized = f" {normalize_name(text)} "
+        matches = [
+            m for m in self._matcher.iter_matches(normalized)
+            if normalized[m.start - 1] == " " and normalized[m.end] == " "
+        ]
+        matches.sort(key=lambda m: m.start - m.end)
+
+        found: List[Scheme] = []
+        for m in matches:
+            for scheme_id in self.by_key[m.value]:
+                scheme = self.by_id[scheme_id]
+                if scheme not in found:
+                    found.append(scheme)
+        return found
+
+    def categories(self) -> Dict[str, int]:
+        return {c: len(ids) for c, ids in sorted(self.by_category.items())}
+
+    def purposes(self) -> Dict[str, int]:
+        return {p: len(ids) for p, ids in sorted(self.by_purpose.items())}
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        purpose: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        query: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[Scheme], int]:
+        """
+        Page of schemes matching every given filter, plus the total count
+
+        min_amount keeps schemes offering at least that much (amount_max);
+        max_amount keeps schemes whose minimum ticket fits under it.
+        """
+        candidates: Optional[Set[str]] = None
+
+        def narrow(ids: Iterable[str]):
+            nonlocal candidates
+            ids = set(ids)
+            candidates = ids if candidates is None else candidates & ids
+
+        if category:
+            narrow(self.by_category.get(category.lower(), []))
+        if purpose:
+            narrow(self.by_purpose.get(purpose.lower(), []))
+        if min_amount is not None:
+            narrow(self._amount_ids[bisect_left(self._amount_keys, min_amount):])
+        if max_amount is not None:
+            narrow(
+                s.id for s in self.by_id.values()
+                if (s.amount_min if s.amount_min is not None else s.amount_max) is not None
+                and (s.amount_min if s.amount_min is not None else 0) <= max_amount
+            )
+        if query:
+            hits = [s.id for s in self.search_prefix(query, limit=len(self.by_id))]
+            hits += [s.id for s in self.find_in_text(query)]
+            narrow(hits)
+
+        # Registry order (CSV order, built-ins last)
+        ordered = [i for i in self.by_id if candidates is None or i in candidates]
+        page = ordered[offset:offset + limit]
+        return [self.by_id[i] for i in page], len(ordered)
+
+    def amount_range(self, low: float, high: float) -> List[Scheme]:
+        """Schemes whose amount_max lies in [low, high]"""
+        start = bisect_left(self._amount_keys, low)
+        end = bisect_right(self._amount_keys, high)
+        return [self.by_id[i] for i in self._amount_ids[start:end]]
+
+
+_default_registry: Optional[SchemeRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_scheme_registry() -> SchemeRegistry:
+    """Process-wide registry (CSV parsed once per worker)"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = SchemeRegistry()
+    return _default_registry
+
+
+# Quick check + lookup benchmark
+if __name__ == "__main__":
+    import timeit
+
+    registry = get_scheme_registry()
+    print(registry.categories())
+    print(registry.purposes())
+
+    for probe in ["KCC", "किसान क्रेडिट कार्ड", "pm kisan", "Mudra"]:
+        scheme = registry.lookup(probe)
+        print(f"{probe!r:>24} -> {scheme.name if scheme else None}")
+
+    print([s.name for s in registry.search_prefix("pradhan mantri k")])
+    print([s.name for s in registry.find_in_text("KCC और फसल बीमा योजना के बारे में बताओ")])
+
+    page, total = registry.filter(purpose="loan", limit=5)
+    print(total, [s.name for s in page])
+
+    n = 100000
+    exact = timeit.timeit(lambda: registry.lookup("kisan credit card"), number=n) / n
+    text = timeit.timeit(lambda: registry.find_in_text("what is the kisan credit card interest rate"), number=n // 10) / (n // 10)
+    print(f"lookup {exact * 1e6:.2f} µs | find_in_text {text * 1e6:.2f} µs")
@@ -0,0 +1,265 @@
+"""
+Compiled Model - Pure-numpy predict_proba for fitted sklearn classifiers
+Skips estimator validation/dispatch, which dominates 1-row latency
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class _FlatForest:
+    """
+    All trees of an ensemble in one set of flat arrays
+
+    Nodes of tree t live at [offsets[t], offsets[t+1]). Leaves point to
+    themselves, so walking every tree max_depth steps lands each one on
+    its leaf without per-tree branching.
+    """
+
+    def __init__(self, trees):
+        left, right, feature, threshold, values, offsets = [], [], [], [], [], []
+        offset = 0
+        self.max_depth = 0
+
+        for tree in trees:
+            t = tree.tree_
+            n = t.node_count
+            idx = np.arange(n)
+            is_leaf = t.children_left == -1
+
+            offsets.append(offset)
+            left.append(np.where(is_leaf, idx, t.children_left) + offset)
+            right.append(np.where(is_leaf, idx, t.children_right) + offset)
+            feature.append(np.where(is_leaf, 0, t.feature))
+            threshold.append(t.threshold)
+            values.append(t.value[:, :, :])
+            self.max_depth = max(self.max_depth, t.max_depth)
+            offset += n
+
+        self.roots = np.array(offsets, dtype=np.intp)
+        self.left = np.concatenate(left).astype(np.intp)
+        self.right = np.concatenate(right).astype(np.intp)
+        self.feature = np.concatenate(feature).astype(np.intp)
+        self.threshold = np.concatenate(threshold)
+        self.value = np.concatenate(values)
+
+    def leaves(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node per (row, tree) -> shape (n_rows, n_trees)"""
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots)))
+
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        return nodes
+
+
+class CompiledClassifier(ABC):
+    """Base class: predict_proba over flat arrays, classes_ as in sklearn"""
+
+    kind = "base"
+
+    def __init__(self, model):
+        self.classes_ = np.asarray(model.classes_)
+        self.n_features_in_ = model.n_features_in_
+
+    @abstractmethod
+    def predict_proba(self, X) -> np.ndarray:
+        """(n_rows, n_classes) class probabilities"""
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+class CompiledTreeEnsemble(CompiledClassifier):
+    """DecisionTree / RandomForest / ExtraTrees: mean of leaf class fractions"""
+
+    kind = "tree_ensemble"
+
+    def __init__(self, model):
+        super().__init__(model)
+        trees = getattr(model, "estimators_", [model])
+        self.forest = _FlatForest(trees)
+
+        # Leaf values as class fractions (older sklearn stores raw counts)
+        value = self.forest.value[:, 0, :]
+        totals = value.sum(axis=1, keepdims=True)
+        self.leaf_proba = np.divide(value, totals, out=np.zeros_like(value), where=totals > 0)
+
+    def predict_proba(self, X) -> np.ndarray:
+        leaves = self.forest.leaves(X)
+        return self.leaf_proba[leaves].mean(axis=1)
+
+
+class CompiledGradientBoosting(CompiledClassifier):
+    """Binary GradientBoostingClassifier with log-loss"""
+
+    kind = "gradient_boosting"
+
+    def __init__(self, model, bias: float):
+        super().__init__(model)
+        self.forest = _FlatForest(model.estimators_[:, 0])
+        self.leaf_value = self.forest.value[:, 0, 0] * model.learning_rate
+        self.bias = bias
+
+    def raw(self, X) -> np.ndarray:
+        return self.bias + self.leaf_value[self.forest.leaves(X)].sum(axis=1)
+
+    def predict_proba(self, X) -> np.ndarray:
+        p = _sigmoid(self.raw(X))
+        return np.column_stack([1.0 - p, p])
+
+
+class CompiledLogistic(CompiledClassifier):
+    """Binary LogisticRegression: sigmoid(x·w + b)"""
+
+    kind = "linear"
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.coef = np.ascontiguousarray(model.coef_[0], dtype=np.float64)
+        self.intercept = float(model.intercept_[0])
+
+    def predict_proba(self, X) -> np.ndarray:
+        p = _sigmoid(np.asarray(X, dtype=np.float64) @ self.coef + self.intercept)
+        return np.column_stack([1.0 - p, p])
+
+
+# ----------------------------------------------------------------------
+
+def _build(model) -> Optional[CompiledClassifier]:
+    from sklearn.ensemble import (ExtraTreesClassifier, GradientBoostingClassifier,
+                                  RandomForestClassifier)
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+
+    if isinstance(model, (RandomForestClassifier, ExtraTreesClassifier, DecisionTreeClassifier)):
+        if getattr(model, "n_outputs_", 1) != 1:
+            return None
+        return CompiledTreeEnsemble(model)
+
+    if isinstance(model, GradientBoostingClassifier):
+        if len(model.classes_) != 2 or getattr(model, "loss", "log_loss") not in ("log_loss", "deviance"):
+            return None
+        if model.init_ not in ("zero", None) and type(model.init_).__name__ != "DummyClassifier":
+            return None
+        # Constant init term, recovered from one decision_function call
+        compiled = CompiledGradientBoosting(model, 0.0)
+        probe = np.zeros((1, model.n_features_in_))
+        compiled.bias = float(model.decision_function(probe).ravel()[0] - compiled.raw(probe)[0])
+        return compiled
+
+    if isinstance(model, LogisticRegression) and len(model.classes_) == 2:
+        return CompiledLogistic(model)
+
+    return None
+
+
+def probe_rows(model, n: int = 256, seed: int = 0) -> np.ndarray:
+    """
+    Inputs that exercise the model: values at and around split
+    thresholds for trees, Gaussian noise for linear models
+    """
+    rng = np.random.default_rng(seed)
+    n_features = model.n_features_in_
+    X = rng.normal(0, 10, size=(n, n_features))
+
+    trees = []
+    if hasattr(model, "tree_"):
+        trees = [model]
+    elif hasattr(model, "estimators_"):
+        trees = list(np.ravel(model.estimators_))
+
+    thresholds = {f: [] for f in range(n_features)}
+    for tree in trees:
+        t = tree.tree_
+        for f, thr in zip(t.feature, t.threshold):
+            if f >= 0:
+                thresholds[f].append(thr)
+
+    for f, values in thresholds.items():
+        if values:
+            picks = rng.choice(values, size=n)
+            jitter = rng.choice([-1e-3, 0.0, 1e-3], size=n) * np.maximum(1.0, np.abs(picks))
+            X[:, f] = picks + jitter
+
+    return X
+
+
+def compile_model(model, X_probe: Optional[np.ndarray] = None,
+                  atol: float = 1e-9) -> Optional[CompiledClassifier]:
+    """
+    Compile a fitted classifier, or return None if unsupported
+
+    The compiled model must reproduce sklearn's predict_proba on the
+    probe rows; any mismatch means the sklearn path keeps being used.
+    """
+    if model is None:
+        return None
+
+    try:
+        compiled = _build(model)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not compile {type(model).__name__}: {e}")
+        return None
+
+    if compiled is None:
+        logger.info(f"ℹ️ No compiled path for {type(model).__name__}, using sklearn")
+        return None
+
+    X_probe = probe_rows(model) if X_probe is None else X_probe
+    expected = model.predict_proba(X_probe)
+    actual = compiled.predict_proba(X_probe)
+
+    if expected.shape != actual.shape or not np.allclose(expected, actual, rtol=0, atol=atol):
+        logger.error(f"❌ Compiled {type(model).__name__} failed parity check, using sklearn")
+        return None
+
+    logger.info(f"⚡ Compiled {type(model).__name__} ({compiled.kind}) passed parity check")
+    return compiled
+
+
+# Parity + latency check: python -m utils.compiled_model
+if __name__ == "__main__":
+    import time
+
+    from sklearn.datasets import make_classification
+    from sklearn.ensemble import (ExtraTreesClassifier, GradientBoostingClassifier,
+                                  RandomForestClassifier)
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+
+    X, y = make_classification(n_samples=2000, n_features=11, random_state=0)
+    row = X[:1]
+
+    def per_call_us(fn, repeat=2000):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn(row)
+        return (time.perf_counter() - start) / repeat * 1e6
+
+    for model in (
+        LogisticRegression(max_iter=1000),
+        DecisionTreeClassifier(random_state=0),
+        RandomForestClassifier(n_estimators=100, random_state=0),
+        ExtraTreesClassifier(n_estimators=100, random_state=0),
+        GradientBoostingClassifier(random_state=0),
+    ):
+        model.fit(X, y)
+        compiled = compile_model(model, np.vstack([X, probe_rows(model)]))
+        assert compiled is not None, type(model).__name__
+        assert np.array_equal(compiled.predict(X), model.predict(X))
+
+        sk = per_call_us(model.predict_proba, 200)
+        fast = per_call_us(compiled.predict_proba)
+        print(f"{type(model).__name__:28s} sklearn {sk:9.1f} µs   compiled {fast:7.1f} µs   ({sk / fast:.0f}x)")
@@ -0,0 +1,81 @@
+"""
+Debug logging - Sampled, lazily formatted, PII-redacted event logs
+Keeps per-request detail out of the hot path under load
+"""
+
+import os
+import random
+from typing import Any, Dict, Iterable, Optional
+
+from loguru import logger
+
+# Fields that must never reach the logs in clear text
+PII_FIELDS = frozenset({
+    "income", "coapplicant_income", "existing_loan", "loan_amount_requested",
+    "credit_score", "contact", "phone_number", "username",
+    "first_name", "last_name", "user", "user_id", "chat_id",
+})
+
+REDACTED = "<redacted>"
+
+
+def redact(fields: Dict[str, Any], pii_fields: Iterable[str] = PII_FIELDS) -> Dict[str, Any]:
+    """
+    Copy of `fields` with PII values replaced (nested dicts included)
+    """
+    pii_fields = pii_fields if isinstance(pii_fields, (set, frozenset)) else set(pii_fields)
+    clean = {}
+    for key, value in fields.items():
+        if key in pii_fields:
+            clean[key] = REDACTED
+        elif isinstance(value, dict):
+            clean[key] = redact(value, pii_fields)
+        else:
+            clean[key] = value
+    return clean
+
+
+class SampledLogger:
+    """
+    Structured debug events, emitted for a sample of calls only
+
+    Cost when sampled out is one random() call. When sampled in, the
+    message is built lazily by loguru - callable field values and the
+    redaction/formatting step only run if a handler accepts the level.
+    """
+
+    def __init__(self, name: str, sample_rate: Optional[float] = None,
+                 level: str = "DEBUG", pii_fields: Iterable[str] = PII_FIELDS):
+        if sample_rate is None:
+            sample_rate = float(os.getenv("DEBUG_LOG_SAMPLE_RATE", 0.01))
+
+        self.name = name
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.level = os.getenv("DEBUG_LOG_LEVEL", level)
+        self.pii_fields = frozenset(pii_fields)
+
+    def log(self, event: str, **fields):
+        """Log `event` with key=value fields (subject to sampling)"""
+        if self.sample_rate <= 0.0:
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+
+        logger.opt(lazy=True, depth=1).log(
+            self.level, "{} | {} | {}", lambda: self.name, lambda: event,
+            lambda: self._format(fields)
+        )
+
+    def _format(self, fields: Dict[str, Any]) -> str:
+        resolved = {
+            key: value() if callable(value) else value
+            for key, value in fields.items()
+        }
+        return " ".join(
+            f"{key}={value!r}" for key, value in redact(resolved, self.pii_fields).items()
+        )
+
+
+def get_debug_logger(name: str, sample_rate: Optional[float] = None) -> SampledLogger:
+    """Create a sampled debug logger for a component"""
+    return SampledLogger(name, sample_rate=sample_rate)
@@ -0,0 +1,136 @@
+"""
+Keyword Matcher - Aho-Corasick multi-pattern search
+Finds every keyword occurrence in one pass, independent of list size
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    value: str        # label attached to the keyword (defaults to the keyword)
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """
+    Compiled Aho-Corasick automaton over a fixed keyword set
+
+    Build once, then scan any text in O(len(text) + matches).
+    Keywords can be given as a list, or as a dict mapping each
+    keyword to a label (several keywords may share one label).
+    """
+
+    def __init__(self, keywords: Union[Iterable[str], Dict[str, str]], lowercase: bool = True):
+        self.lowercase = lowercase
+
+        if isinstance(keywords, dict):
+            items = list(keywords.items())
+        else:
+            items = [(k, k) for k in keywords]
+
+        self.keywords: List[str] = []
+        self.values: List[str] = []
+
+        # Node 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[tuple] = [()]
+
+        seen = set()
+        for keyword, value in items:
+            if lowercase:
+                keyword = keyword.lower()
+            if not keyword or keyword in seen:
+                continue
+            seen.add(keyword)
+            self._add(keyword, len(self.keywords))
+            self.keywords.append(keyword)
+            self.values.append(value)
+
+        self._build_failure_links()
+
+    def _add(self, keyword: str, index: int):
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] = self._out[node] + (index,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+
+                # Inherit matches ending at the failure state
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    # ------------------------------------------------------------------
+
+    def iter_matches(self, text: str) -> Iterator[KeywordMatch]:
+        """Yield all (possibly overlapping) keyword matches in order of end position"""
+        if self.lowercase:
+            text = text.lower()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        keywords, values = self.keywords, self.values
+        node = 0
+
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            for index in out[node]:
+                keyword = keywords[index]
+                yield KeywordMatch(keyword, values[index], i + 1 - len(keyword), i + 1)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        return list(self.iter_matches(text))
+
+    def first(self, text: str) -> Optional[KeywordMatch]:
+        return next(self.iter_matches(text), None)
+
+    def contains_any(self, text: str) -> bool:
+        return self.first(text) is not None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+# Quick self-check + benchmark
+if __name__ == "__main__":
+    import random
+    import timeit
+
+    matcher = KeywordMatcher(["he", "she", "his", "hers", "पहले पैसे दें"])
+    print(matcher.find_all("ushers पहले पैसे दें"))
+
+    random.seed(0)
+    words = ["loan", "fee", "pay", "instant", "approval", "कर्ज", "पैसे", "तुरंत", "शुल्क", "agent"]
+    phrases = {" ".join(random.choices(words, k=3)) + f" {i}" for i in range(5000)}
+    text = " ".join(random.choices(words, k=400))
+
+    for size in (50, 500, 5000):
+        subset = list(phrases)[:size]
+        m = KeywordMatcher(subset)
+        naive = timeit.timeit(lambda: [k for k in subset if k in text], number=20) / 20
+        ac = timeit.timeit(lambda: m.find_all(text), number=20) / 20
+        print(f"{size:>5} keywords: naive {naive * 1e3:.2f} ms | aho-corasick {ac * 1e3:.2f} ms")
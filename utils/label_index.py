@@ -0,0 +1,131 @@
+"""
+Label Index - Precompiled categorical lookups
+Maps user-typed variants (Hindi/English) straight to encoder codes
+"""
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+
+class LabelIndex:
+    """
+    One dict from every known variant to its integer code, plus an
+    n-gram index for substring ("fuzzy") matches
+
+    Fuzzy matching keeps the old semantics - the first key (in label map
+    order) that contains the input or is contained in it wins - but only
+    keys sharing an n-gram with the input are checked.
+    """
+
+    MAX_FUZZY_CACHE = 10_000
+
+    def __init__(self, label_map: Dict[str, str], classes: Sequence, default_idx: int = 0, n: int = 3):
+        self.n = n
+        class_codes = {str(c): i for i, c in enumerate(classes)}
+
+        self.codes: Dict[str, int] = {}
+        self.labels: Dict[int, str] = {}
+
+        # Fuzzy matching structures (keys in label map order)
+        self._keys: List[Tuple[str, int]] = []          # (lowercased key, code)
+        self._ngrams: Dict[str, Set[int]] = {}          # n-gram -> key positions
+        self._substrings: Dict[str, Set[int]] = {}      # substrings shorter than n
+        self._short_keys: Dict[str, int] = {}           # keys shorter than n
+
+        for key, label in label_map.items():
+            code = class_codes.get(str(label))
+            if code is None:
+                continue
+
+            self.labels[code] = str(label)
+            self.codes[key] = code
+            self._index_key(key.lower(), code)
+
+        self.default_code: Optional[int] = None
+        self.default_label = ""
+        if label_map:
+            values = list(label_map.values())
+            self.default_label = str(values[default_idx] if default_idx < len(values) else values[0])
+            self.default_code = class_codes.get(self.default_label)
+
+        self._fuzzy_cache: Dict[str, Tuple[int, str]] = {}
+
+    def _index_key(self, key: str, code: int):
+        pos = len(self._keys)
+        self._keys.append((key, code))
+
+        if len(key) < self.n:
+            self._short_keys.setdefault(key, pos)
+
+        for size in range(1, self.n):
+            for i in range(len(key) - size + 1):
+                self._substrings.setdefault(key[i:i + size], set()).add(pos)
+
+        for i in range(len(key) - self.n + 1):
+            self._ngrams.setdefault(key[i:i + self.n], set()).add(pos)
+
+    # ------------------------------------------------------------------
+
+    def lookup(self, user_input) -> Tuple[Optional[int], str, str]:
+        """
+        Resolve user input
+
+        Returns:
+            (code, label, how) where how is 'exact', 'fuzzy' or 'default'
+        """
+        if not user_input:
+            return self.default_code, self.default_label, "default"
+
+        code = self.codes.get(user_input)
+        if code is None:
+            clean = str(user_input).strip().lower()
+            code = self.codes.get(clean)
+
+            if code is None:
+                cached = self._fuzzy_cache.get(clean)
+                if cached is None:
+                    cached = self._fuzzy(clean)
+                    if len(self._fuzzy_cache) < self.MAX_FUZZY_CACHE:
+                        self._fuzzy_cache[clean] = cached
+
+                code, how = cached
+                if code is None:
+                    return self.default_code, self.default_label, "default"
+                return code, self.labels[code], how
+
+        return code, self.labels[code], "exact"
+
+    def _fuzzy(self, text: str) -> Tuple[Optional[int], str]:
+        # Whitespace-only input: "" is in every key, so the first key wins
+        if not text:
+            return (self._keys[0][1], "fuzzy") if self._keys else (None, "default")
+
+        n = self.n
+        candidates: Set[int] = set()
+
+        if len(text) < n:
+            # Keys containing the (short) input
+            candidates |= self._substrings.get(text, set())
+        else:
+            # Keys containing the input share its first n-gram
+            candidates |= self._ngrams.get(text[:n], set())
+
+            # Keys contained in the input share at least one n-gram with it
+            for i in range(len(text) - n + 1):
+                candidates |= self._ngrams.get(text[i:i + n], set())
+
+        # Short keys contained in the input
+        for size in range(1, min(n, len(text) + 1)):
+            for i in range(len(text) - size + 1):
+                pos = self._short_keys.get(text[i:i + size])
+                if pos is not None:
+                    candidates.add(pos)
+
+        for pos in sorted(candidates):
+            key, code = self._keys[pos]
+            if text in key or key in text:
+                return code, "fuzzy"
+
+        return None, "default"
+
+    def __len__(self) -> int:
+        return len(self.codes)
@@ -3,9 +3,11 @@ Language utilities - Detection, translation helpers
 Optimized for rural Hindi/English users
 """
 
-import re
 from typing import Optional
 
+from utils.number_parser import parse_numbers
+from utils.text_normalizer import is_mostly_devanagari
+
 
 def detect_language(text: str) -> str:
     """
@@ -15,9 +17,7 @@ def detect_language(text: str) -> str:
         'hindi' or 'english'
     """
     # Check for Devanagari script (Hindi)
-    hindi_chars = re.findall(r'[\u0900-\u097F]', text)
-    
-    if len(hindi_chars) > len(text) * 0.3:  # 30% Hindi characters
+    if is_mostly_devanagari(text, 0.3):  # 30% Hindi characters
         return 'hindi'
     else:
         return 'english'
@@ -42,10 +42,10 @@ def romanize_hindi(text: str) -> str:
 def extract_numbers(text: str) -> list:
     """
     Extract all numbers from text (handles Hindi/English)
+
+    Digits in either script plus number words: "ढाई लाख", "25 hazaar"
     """
-    text = romanize_hindi(text)
-    numbers = re.findall(r'\d+(?:,\d+)*(?:\.\d+)?', text)
-    return [float(n.replace(',', '')) for n in numbers]
+    return parse_numbers(text)
 
 
 def format_currency(amount: float, lang: str = 'hindi') -> str:
@@ -145,6 +145,7 @@ if __name__ == "__main__":
     
     # Test number extraction
     print(extract_numbers("मेरी आय ₹25,000 है"))  # [25000.0]
+    print(extract_numbers("ढाई लाख का लोन"))  # [250000.0]
     
     # Test currency formatting
     print(format_currency(250000, 'hindi'))  # ₹2.50 लाख
@@ -0,0 +1,234 @@
+"""
+LLM Backends - Pluggable chat-completion backends + overflow router
+
+GroqBackend     hosted API (fast, rate-limited free tier)
+LlamaCppBackend local CPU inference on a quantized GGUF model, either via a
+                llama.cpp-compatible server (LLAMA_CPP_SERVER_URL, OpenAI
+                /v1/chat/completions API) or in-process llama-cpp-python
+                bindings (LLAMA_CPP_MODEL_PATH)
+LLMRouter       sends traffic to the primary while its token bucket has
+                room and it is healthy; overflow, errors and cool-downs
+                go to the fallback
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+
+Messages = List[Dict[str, str]]
+
+
+class LLMBackend(ABC):
+    """Interface: a named chat-completion endpoint"""
+
+    name = "base"
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """Whether the backend can take a request now"""
+
+    @abstractmethod
+    def complete(self, messages: Messages, max_tokens: int = 500, temperature: float = 0.3) -> str:
+        """Generated text; raises on failure"""
+
+
+class GroqBackend(LLMBackend):
+    name = "groq"
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "llama-3.1-8b-instant"):
+        self.model = model
+        self.client = None
+
+        api_key = api_key or os.getenv('GROQ_API_KEY')
+        if not api_key:
+            logger.warning("⚠️ GROQ_API_KEY not found! Groq backend disabled.")
+            return
+
+        from groq import Groq
+        self.client = Groq(api_key=api_key)
+        logger.info("✅ Groq client initialized")
+
+    def is_available(self) -> bool:
+        return self.client is not None
+
+    def complete(self, messages: Messages, max_tokens: int = 500, temperature: float = 0.3) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=0.9,
+        )
+        return response.choices[0].message.content.strip()
+
+
+class LlamaCppBackend(LLMBackend):
+    name = "llama_cpp"
+
+    def __init__(self, server_url: Optional[str] = None, model_path: Optional[str] = None):
+        self.server_url = (server_url or os.getenv('LLAMA_CPP_SERVER_URL', '')).rstrip('/')
+        self.model_path = model_path or os.getenv('LLAMA_CPP_MODEL_PATH', '')
+        self.timeout = float(os.getenv('LLAMA_CPP_TIMEOUT', 120))
+        self.n_ctx = int(os.getenv('LLAMA_CPP_CTX', 4096))
+        self.n_threads = int(os.getenv('LLAMA_CPP_THREADS', os.cpu_count() or 4))
+
+        self._llm = None
+        self._load_failed = False
+        self._lock = threading.Lock()  # bindings are not re-entrant
+
+        if self.server_url:
+            logger.info(f"🖥️ Local LLM server: {self.server_url}")
+        elif self.model_path:
+            logger.info(f"🖥️ Local GGUF model: {self.model_path}")
+
+    def is_available(self) -> bool:
+        if self.server_url:
+            return True
+        return bool(self.model_path) and os.path.exists(self.model_path) and not self._load_failed
+
+    def complete(self, messages: Messages, max_tokens: int = 500, temperature: float = 0.3) -> str:
+        if self.server_url:
+            return self._complete_http(messages, max_tokens, temperature)
+        return self._complete_bindings(messages, max_tokens, temperature)
+
+    def _complete_http(self, messages: Messages, max_tokens: int, temperature: float) -> str:
+        payload = json.dumps({
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": 0.9,
+        }).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.server_url}/v1/chat/completions",
+            data=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = json.loads(response.read().decode("utf-8"))
+        return body["choices"][0]["message"]["content"].strip()
+
+    def _complete_bindings(self, messages: Messages, max_tokens: int, temperature: float) -> str:
+        with self._lock:
+            if self._llm is None:
+                try:
+                    from llama_cpp import Llama
+                    self._llm = Llama(
+                        model_path=self.model_path,
+                        n_ctx=self.n_ctx,
+                        n_threads=self.n_threads,
+                        verbose=False,
+                    )
+                    logger.info("✅ Local GGUF model loaded")
+                except Exception:
+                    self._load_failed = True
+                    raise
+
+            response = self._llm.create_chat_completion(
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=0.9,
+            )
+        return response["choices"][0]["message"]["content"].strip()
+
+
+class TokenBucket:
+    """Non-blocking token bucket: `rate_per_minute` refill, `burst` capacity"""
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst or max(1, int(rate_per_minute)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class LLMRouter(LLMBackend):
+    """
+    Primary while it has rate-limit headroom, fallback otherwise
+
+    A primary failure (quota, outage) sends traffic to the fallback for
+    LLM_PRIMARY_COOLDOWN seconds before the primary is tried again.
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        primary: LLMBackend,
+        fallback: Optional[LLMBackend] = None,
+        rate_per_minute: float = None,
+        cooldown: float = None
+    ):
+        self.primary = primary
+        self.fallback = fallback
+        self.bucket = TokenBucket(rate_per_minute or float(os.getenv('GROQ_RPM', 20)))
+        self.cooldown = cooldown if cooldown is not None else float(os.getenv('LLM_PRIMARY_COOLDOWN', 30))
+        self._primary_down_until = 0.0
+
+        self.routed: Dict[str, int] = {"primary": 0, "overflow": 0, "failover": 0}
+
+    def _fallback_ready(self) -> bool:
+        return self.fallback is not None and self.fallback.is_available()
+
+    def is_available(self) -> bool:
+        return self.primary.is_available() or self._fallback_ready()
+
+    def complete(self, messages: Messages, max_tokens: int = 500, temperature: float = 0.3) -> str:
+        primary_ok = self.primary.is_available() and time.monotonic() >= self._primary_down_until
+
+        if primary_ok and (self.bucket.try_acquire() or not self._fallback_ready()):
+            try:
+                answer = self.primary.complete(messages, max_tokens, temperature)
+                self.routed["primary"] += 1
+                return answer
+            except Exception as e:
+                if not self._fallback_ready():
+                    raise
+                self._primary_down_until = time.monotonic() + self.cooldown
+                self.routed["failover"] += 1
+                logger.warning(
+                    f"⚠️ {self.primary.name} failed ({e}); using {self.fallback.name} "
+                    f"for {self.cooldown:.0f}s"
+                )
+        elif self._fallback_ready():
+            self.routed["overflow"] += 1
+            logger.info(f"↪️ {self.primary.name} saturated/unavailable, routing to {self.fallback.name}")
+
+        if not self._fallback_ready():
+            raise RuntimeError("No LLM backend available")
+
+        return self.fallback.complete(messages, max_tokens, temperature)
+
+    def stats(self) -> Dict[str, any]:
+        return {
+            "primary": self.primary.name,
+            "primary_available": self.primary.is_available(),
+            "fallback": self.fallback.name if self.fallback else None,
+            "fallback_available": self._fallback_ready(),
+            "routed": dict(self.routed),
+        }
+
+
+def build_default_router(api_key: Optional[str] = None, model: str = "llama-3.1-8b-instant") -> LLMRouter:
+    """Groq first, local llama.cpp for overflow (when configured)"""
+    local = LlamaCppBackend()
+    fallback = local if (local.server_url or local.model_path) else None
+    return LLMRouter(GroqBackend(api_key, model), fallback)
@@ -1,38 +1,56 @@
 """
 LLM Client - Handles Groq API calls (FREE tier)
-Groq provides fast inference with generous free limits
+Groq provides fast inference with generous free limits; overflow and
+outages fall back to a local llama.cpp model when one is configured
 """
 
+import hashlib
 import os
-from typing import Optional
-from groq import Groq
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from loguru import logger
 
+from utils.llm_backends import LLMRouter, build_default_router
+from utils.verdict_cache import VerdictCache
+
+
+@lru_cache(maxsize=64)
+def _prefix_key(system_prompt: str) -> str:
+    """Short hash of a (static, reused) system prompt"""
+    return hashlib.sha1(system_prompt.encode("utf-8")).hexdigest()[:16]
+
 
 class LLMClient:
     """
     Groq API client for text generation
-    FREE tier: 14,400 requests/day, 20 requests/minute
+    FREE tier: 14,400 requests/day, 20 requests/minute (GROQ_RPM)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, router: Optional[LLMRouter] = None):
         self.api_key = api_key or os.getenv('GROQ_API_KEY')
         
-        if not self.api_key:
-            logger.warning("⚠️ GROQ_API_KEY not found! LLM features will not work.")
-            self.client = None
-        else:
-            self.client = Groq(api_key=self.api_key)
-            logger.info("✅ Groq client initialized")
-        
         # Default model - llama3 is fast and good for Hindi/English
         self.model = "llama-3.1-8b-instant"  # or "mixtral-8x7b-32768"
+
+        # Groq first, local GGUF model for overflow / outages
+        self.router = router or build_default_router(self.api_key, self.model)
+        self.client = getattr(self.router.primary, 'client', None)
+
+        if not self.router.is_available():
+            logger.warning("⚠️ No LLM backend configured! LLM features will not work.")
+
+        # Response cache: identical (system prefix, prompt, settings) -> answer
+        cache_size = int(os.getenv('LLM_CACHE_SIZE', 512))
+        self.cache = VerdictCache(maxsize=cache_size) if cache_size > 0 else None
+        self.cache_ttl = float(os.getenv('LLM_CACHE_TTL', 3600))
     
     def generate(self, 
                  prompt: str, 
                  max_tokens: int = 500,
                  temperature: float = 0.3,
-                 system_prompt: Optional[str] = None) -> str:
+                 system_prompt: Optional[str] = None,
+                 raise_errors: bool = False) -> str:
         """
         Generate response from prompt
         
@@ -41,12 +59,22 @@ class LLMClient:
             max_tokens: Maximum response length
             temperature: Creativity (0-1, lower = more focused)
             system_prompt: Optional system instruction
+            raise_errors: Raise on failure instead of returning an apology
+                text (for callers that must not mistake it for an answer)
         
         Returns:
             Generated text
         """
-        if not self.client:
+        if not self.router.is_available():
+            if raise_errors:
+                raise RuntimeError("No LLM backend available")
             return "⚠️ LLM सेवा उपलब्ध नहीं है। कृपया API कुंजी जांचें।"
+
+        namespace = self._cache_namespace(system_prompt, max_tokens, temperature)
+        cached = self._cache_get(prompt, namespace)
+        if cached is not None:
+            logger.info("⚡ LLM cache hit")
+            return cached
         
         try:
             messages = []
@@ -62,24 +90,42 @@ class LLMClient:
                 "content": prompt
             })
             
-            # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                top_p=0.9,
-            )
-            
-            answer = response.choices[0].message.content.strip()
+            # Groq API, or the local backend when Groq is saturated/down
+            answer = self.router.complete(messages, max_tokens=max_tokens, temperature=temperature)
             
             logger.info(f"✅ Generated response ({len(answer)} chars)")
+            if self.cache is not None and answer:
+                self.cache.put(prompt, (time.monotonic(), answer), namespace)
             return answer
             
         except Exception as e:
-            logger.error(f"❌ Groq API error: {e}")
+            logger.error(f"❌ LLM error: {e}")
+            if raise_errors:
+                raise
             return f"क्षमा करें, कुछ गलती हुई। कृपया फिर से प्रयास करें। Error: {str(e)}"
     
+    def _cache_namespace(self, system_prompt: Optional[str], max_tokens: int, temperature: float) -> str:
+        prefix = _prefix_key(system_prompt) if system_prompt else "-"
+        return f"{self.model}|{prefix}|{max_tokens}|{temperature}"
+
+    def _cache_get(self, prompt: str, namespace: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        entry, _ = self.cache.get(prompt, namespace)
+        if entry is None:
+            return None
+        created, answer = entry
+        if time.monotonic() - created > self.cache_ttl:
+            return None
+        return answer
+
+    def is_available(self) -> bool:
+        """True when Groq or the local fallback can serve requests"""
+        return self.router.is_available()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats() if self.cache is not None else {"enabled": False}
+
     def generate_with_retry(self, prompt: str, max_retries: int = 2, **kwargs) -> str:
         """
         Generate with automatic retry on failure
@@ -0,0 +1,210 @@
+"""
+Model Bundle - One versioned, memory-mappable file per model
+Replaces a directory of separate pickles with bundle.joblib + manifest.json
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import joblib
+from loguru import logger
+
+BUNDLE_FILE = "bundle.joblib"
+MANIFEST_FILE = "manifest.json"
+BUNDLE_FORMAT = 1
+
+# Checksum verification reads the whole file once at startup
+VERIFY_CHECKSUM = os.getenv("MODEL_BUNDLE_VERIFY", "true").lower() == "true"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe_classes(objects: Dict[str, Any]) -> Dict[str, list]:
+    """classes_ of every fitted component (encoders, classifiers)"""
+    return {
+        name: [str(c) for c in obj.classes_]
+        for name, obj in objects.items()
+        if hasattr(obj, "classes_")
+    }
+
+
+# ----------------------------------------------------------------------
+# Save / load
+# ----------------------------------------------------------------------
+
+def save_bundle(bundle_dir: Path, objects: Dict[str, Any],
+                feature_schema: Optional[Dict] = None,
+                version: Optional[str] = None) -> Dict:
+    """
+    Write all components into one uncompressed joblib file + manifest
+
+    Uncompressed so numpy arrays inside can be memory-mapped on load
+    and shared between worker processes through the page cache.
+    The manifest is written last; a bundle without one is ignored.
+    """
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    bundle_path = bundle_dir / BUNDLE_FILE
+    tmp_path = bundle_dir / (BUNDLE_FILE + ".tmp")
+    joblib.dump(objects, tmp_path, compress=0)
+
+    checksum = _sha256(tmp_path)
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": version or checksum[:12],
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "components": sorted(objects),
+        "feature_schema": feature_schema or {},
+        "files": {
+            BUNDLE_FILE: {"sha256": checksum, "size": tmp_path.stat().st_size}
+        },
+    }
+
+    try:
+        import sklearn
+        manifest["sklearn_version"] = sklearn.__version__
+    except ImportError:
+        pass
+
+    os.replace(tmp_path, bundle_path)
+
+    manifest_tmp = bundle_dir / (MANIFEST_FILE + ".tmp")
+    with open(manifest_tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(manifest_tmp, bundle_dir / MANIFEST_FILE)
+
+    logger.info(f"💾 Model bundle v{manifest['version']} saved to {bundle_dir}")
+    return manifest
+
+
+def load_bundle(bundle_dir: Path, mmap: bool = True,
+                verify: bool = VERIFY_CHECKSUM) -> Tuple[Dict[str, Any], Dict]:
+    """
+    Load (objects, manifest) from a bundle directory
+
+    Raises FileNotFoundError if there is no bundle, ValueError if the
+    manifest is unsupported or the checksum does not match.
+    """
+    bundle_dir = Path(bundle_dir)
+    manifest_path = bundle_dir / MANIFEST_FILE
+    bundle_path = bundle_dir / BUNDLE_FILE
+
+    if not manifest_path.exists() or not bundle_path.exists():
+        raise FileNotFoundError(f"No model bundle in {bundle_dir}")
+
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported bundle format: {manifest.get('format')}")
+
+    if verify:
+        expected = manifest["files"][BUNDLE_FILE]["sha256"]
+        if _sha256(bundle_path) != expected:
+            raise ValueError(f"Checksum mismatch for {bundle_path}")
+
+    objects = joblib.load(bundle_path, mmap_mode="r" if mmap else None)
+    return objects, manifest
+
+
+def load_legacy(model_dir: Path, files: Dict[str, str],
+                required: Iterable[str] = ()) -> Tuple[Dict[str, Any], Dict]:
+    """
+    Load separate pickles {name: filename}; optional ones may be missing
+
+    Returns (objects, manifest-like dict) so callers treat both formats alike.
+    """
+    model_dir = Path(model_dir)
+    objects, mtimes = {}, []
+
+    for name, filename in files.items():
+        path = model_dir / filename
+        if not path.exists():
+            if name in required:
+                raise FileNotFoundError(f"Missing model file: {path}")
+            continue
+        try:
+            objects[name] = joblib.load(path)
+        except Exception as e:
+            if name in required:
+                raise
+            logger.warning(f"⚠️ Skipping unloadable optional file {path}: {e}")
+            continue
+        mtimes.append(path.stat().st_mtime_ns)
+
+    return objects, {"version": f"legacy-{max(mtimes, default=0)}", "feature_schema": {}}
+
+
+def load_artifacts(model_dir: Path, bundle_name: str, legacy_files: Dict[str, str],
+                   required: Iterable[str] = (),
+                   features: Optional[list] = None) -> Tuple[Dict[str, Any], Dict]:
+    """
+    Prefer the bundle, fall back to the legacy pickles
+
+    A bundle whose feature list differs from `features` is not used.
+    """
+    bundle_dir = Path(model_dir) / bundle_name
+
+    try:
+        objects, manifest = load_bundle(bundle_dir)
+
+        bundled_features = manifest.get("feature_schema", {}).get("features")
+        if features is not None and bundled_features != list(features):
+            raise ValueError(f"Feature schema mismatch: {bundled_features}")
+
+        missing = [name for name in required if name not in objects]
+        if missing:
+            raise ValueError(f"Bundle is missing components: {missing}")
+
+        logger.info(f"📦 Loaded model bundle {bundle_name} v{manifest['version']}")
+        return objects, manifest
+
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"❌ Model bundle {bundle_dir} unusable, falling back to pickles: {e}")
+
+    return load_legacy(model_dir, legacy_files, required)
+
+
+def convert_legacy(model_dir: Path, bundle_name: str, legacy_files: Dict[str, str],
+                   required: Iterable[str] = (),
+                   feature_schema: Optional[Dict] = None) -> Dict:
+    """Pack existing pickles into a bundle next to them"""
+    objects, _ = load_legacy(model_dir, legacy_files, required)
+    schema = {**(feature_schema or {}), "classes": describe_classes(objects)}
+    return save_bundle(Path(model_dir) / bundle_name, objects, schema)
+
+
+# CLI: python -m utils.model_bundle [model_dir]
+if __name__ == "__main__":
+    import sys
+
+    from services.fraud_service import FraudService
+    from services.loan_service import LoanService
+
+    model_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else (
+        Path(__file__).resolve().parent.parent / "models" / "loan_eligibility"
+    )
+
+    for service in (LoanService, FraudService):
+        try:
+            manifest = convert_legacy(
+                model_dir, service.BUNDLE_NAME, service.LEGACY_FILES,
+                service.REQUIRED_ARTIFACTS, service.FEATURE_SCHEMA
+            )
+            print(f"✅ {service.__name__}: {service.BUNDLE_NAME} v{manifest['version']}")
+        except FileNotFoundError as e:
+            print(f"⚠️ {service.__name__}: skipped ({e})")
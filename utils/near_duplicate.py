@@ -0,0 +1,107 @@
+"""
+Near-Duplicate Detection - 64-bit SimHash with a banded lookup index
+Lets lightly edited copies of the same text find each other
+"""
+
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+_BITS = np.arange(64, dtype=np.uint64)
+
+
+def simhash(text: str, n: int = 3) -> int:
+    """
+    64-bit SimHash over character n-gram shingles
+
+    Uses Python's string hash, so values are stable only within one
+    process - fine for in-memory indexes, not for persisting.
+    """
+    if len(text) <= n:
+        shingles = [text]
+    else:
+        shingles = [text[i:i + n] for i in range(len(text) - n + 1)]
+
+    hashes = np.array([hash(s) for s in shingles], dtype=np.int64).view(np.uint64)
+
+    # Per bit: +1 if set, -1 if clear, summed over all shingles
+    bits = ((hashes[:, None] >> _BITS) & np.uint64(1)).astype(np.int32)
+    votes = bits.sum(axis=0) * 2 - len(shingles)
+
+    return int(np.packbits(votes[::-1] > 0).view(">u8")[0])
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")  # int.bit_count() needs Python 3.10
+
+
+class SimHashIndex:
+    """
+    Finds a stored fingerprint within `max_distance` bits of a query
+
+    The 64 bits are split into max_distance + 1 bands; two fingerprints
+    that differ in at most max_distance bits must agree on one whole
+    band (pigeonhole), so only same-band candidates are compared.
+    """
+
+    def __init__(self, max_distance: int = 6):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self._width = 64 // self.bands
+        self._mask = (1 << self._width) - 1
+
+        self._buckets: Dict[Tuple[int, int], set] = {}
+        self._hashes: Dict[Hashable, int] = {}
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def _band_keys(self, h: int):
+        return [(b, (h >> (b * self._width)) & self._mask) for b in range(self.bands)]
+
+    def add(self, key: Hashable, h: int):
+        if key in self._hashes:
+            self.remove(key)
+        self._hashes[key] = h
+        for band in self._band_keys(h):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: Hashable):
+        h = self._hashes.pop(key, None)
+        if h is None:
+            return
+        for band in self._band_keys(h):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def query(self, h: int) -> Optional[Hashable]:
+        """Closest stored key within max_distance, or None"""
+        best_key, best_dist = None, self.max_distance + 1
+
+        for band in self._band_keys(h):
+            for key in self._buckets.get(band, ()):
+                dist = hamming(h, self._hashes[key])
+                if dist < best_dist:
+                    best_key, best_dist = key, dist
+                    if dist == 0:
+                        return key
+
+        return best_key
+
+    def clear(self):
+        self._buckets.clear()
+        self._hashes.clear()
+
+
+# Quick demo: python -m utils.near_duplicate
+if __name__ == "__main__":
+    a = "instant approval loan ₹50000 pay processing fee 2000 on whatsapp 9876543210"
+    b = "instant approval loan ₹50000!! pay processing fee 2000 on whatsapp 9876543210"
+    c = "pradhan mantri mudra yojana apply through your nearest bank branch"
+
+    ha, hb, hc = simhash(a), simhash(b), simhash(c)
+    print(f"edited copy: {hamming(ha, hb)} bits apart")
+    print(f"unrelated:   {hamming(ha, hc)} bits apart")
@@ -0,0 +1,449 @@
+"""
+Number Parser - Indian number words and digits in Hindi, Hinglish, English
+"ढाई लाख", "1.5 lakh", "25 hazaar", "दो करोड़ पचास लाख", "२५,०००", "25k"
+
+Text is split into tokens by one precompiled regex, each token is looked
+up in a flat lexicon, and a small state machine folds the token stream
+into numbers:
+
+    token      example            effect
+    NUM        25, 1.5, 1,00,000  start a number (or a new one)
+    UNIT       पच्चीस, ढाई, twenty  start a number / extend "तीन सौ पचास", "twenty five"
+    FRACTION   साढ़े, सवा, पौने      +0.5 / +0.25 / -0.25 on the next value
+    HUNDRED    सौ, sau, hundred    current *= 100
+    SCALE      हज़ार, lakh, करोड़, k  total += current * scale (descending scales)
+    JOIN       और, aur, and        ignored inside a number
+    RANGE      -, से, se, to        "20-25 हजार": the bare lower end takes the
+                                  upper end's scale (20000, 25000)
+    other      anything else      ends the number in progress
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# ----------------------------------------------------------------------
+# 🔹 LEXICON
+# ----------------------------------------------------------------------
+
+NUM, UNIT, FRACTION, HUNDRED, SCALE, JOIN, RANGE = range(7)
+
+HINDI_UNITS = [
+    "शून्य", "एक", "दो", "तीन", "चार", "पांच", "छह", "सात", "आठ", "नौ",
+    "दस", "ग्यारह", "बारह", "तेरह", "चौदह", "पंद्रह", "सोलह", "सत्रह", "अठारह", "उन्नीस",
+    "बीस", "इक्कीस", "बाईस", "तेईस", "चौबीस", "पच्चीस", "छब्बीस", "सत्ताईस", "अट्ठाईस", "उनतीस",
+    "तीस", "इकतीस", "बत्तीस", "तैंतीस", "चौंतीस", "पैंतीस", "छत्तीस", "सैंतीस", "अड़तीस", "उनतालीस",
+    "चालीस", "इकतालीस", "बयालीस", "तैंतालीस", "चवालीस", "पैंतालीस", "छियालीस", "सैंतालीस", "अड़तालीस", "उनचास",
+    "पचास", "इक्यावन", "बावन", "तिरपन", "चौवन", "पचपन", "छप्पन", "सत्तावन", "अट्ठावन", "उनसठ",
+    "साठ", "इकसठ", "बासठ", "तिरसठ", "चौंसठ", "पैंसठ", "छियासठ", "सड़सठ", "अड़सठ", "उनहत्तर",
+    "सत्तर", "इकहत्तर", "बहत्तर", "तिहत्तर", "चौहत्तर", "पचहत्तर", "छिहत्तर", "सतहत्तर", "अठहत्तर", "उनासी",
+    "अस्सी", "इक्यासी", "बयासी", "तिरासी", "चौरासी", "पचासी", "छियासी", "सत्तासी", "अट्ठासी", "नवासी",
+    "नब्बे", "इक्यानवे", "बानवे", "तिरानवे", "चौरानवे", "पचानवे", "छियानवे", "सत्तानवे", "अट्ठानवे", "निन्यानवे",
+]
+
+ENGLISH_UNITS = [
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+    "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen",
+    "eighteen", "nineteen",
+]
+ENGLISH_TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+
+# Spelling variants and romanized (Hinglish) forms
+UNIT_VARIANTS = {
+    "पाँच": 5, "पाच": 5, "छः": 6, "छै": 6, "छे": 6, "पन्द्रह": 15, "सत्तरह": 17,
+    "ek": 1, "do": 2, "teen": 3, "tin": 3, "char": 4, "chaar": 4, "paanch": 5, "panch": 5,
+    "chhe": 6, "chah": 6, "saat": 7, "aath": 8, "nau": 9, "das": 10, "gyarah": 11, "barah": 12,
+    "pandrah": 15, "bees": 20, "bis": 20, "pachees": 25, "pachchis": 25, "pachis": 25,
+    "tees": 30, "tis": 30, "chalis": 40, "chaalis": 40, "pachas": 50, "pachaas": 50,
+    "saath": 60, "sattar": 70, "assi": 80, "nabbe": 90,
+    "ढाई": 2.5, "dhai": 2.5, "dhaai": 2.5, "arhai": 2.5, "adhai": 2.5,
+    "डेढ़": 1.5, "डेढ": 1.5, "dedh": 1.5, "derh": 1.5, "dedhh": 1.5,
+    "आधा": 0.5, "आधे": 0.5, "aadha": 0.5, "adha": 0.5, "aadhe": 0.5, "half": 0.5,
+}
+
+FRACTIONS = {
+    "साढ़े": 0.5, "साढे": 0.5, "sadhe": 0.5, "saadhe": 0.5, "sade": 0.5, "saade": 0.5,
+    "सवा": 0.25, "sawa": 0.25, "sava": 0.25,
+    "पौने": -0.25, "paune": -0.25, "pone": -0.25,
+}
+
+HUNDREDS = ["सौ", "sau", "so", "hundred"]
+
+SCALES = {
+    "हज़ार": 1e3, "हजार": 1e3, "hazaar": 1e3, "hazar": 1e3, "hajar": 1e3, "thousand": 1e3,
+    "लाख": 1e5, "lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lacs": 1e5, "laakh": 1e5,
+    "करोड़": 1e7, "करोड": 1e7, "crore": 1e7, "crores": 1e7, "karod": 1e7, "karor": 1e7, "cr": 1e7,
+    "million": 1e6, "billion": 1e9,
+    "k": 1e3,
+}
+
+JOINS = ["और", "aur", "and"]
+
+RANGES = ["-", "–", "से", "se", "to"]
+
+# Abbreviations that only count right after a number ("25k", not "k")
+BOUND_SCALES = {"k", "cr", "lac"}
+
+# Words that are also ordinary words ("लोन दो", "do you", "saath mein");
+# alone they only count when they are the whole input
+WEAK_WORDS = {"दो", "do", "one", "nau", "saath", "das", "so", "tin", "bis", "tis",
+              "आधा", "आधे", "aadha", "adha", "aadhe", "half"}
+
+CURRENCY_BEFORE = {"₹", "rs", "inr", "रु", "rupees", "रुपये"}
+CURRENCY_AFTER = {"रुपये", "रुपए", "रुपया", "रु", "rupees", "rupee", "rs", "rupaye", "rupay"}
+
+
+def _spellings(word: str) -> Tuple[str, ...]:
+    """
+    ड़/ढ़ arrive either as one code point or as letter + nukta; the lexicon
+    holds both so input never needs (length-changing) normalization
+    """
+    decomposed = unicodedata.normalize("NFD", word)
+    composed = decomposed.replace("\u0921\u093c", "\u095c").replace("\u0922\u093c", "\u095d")
+    return tuple(dict.fromkeys([word, decomposed, composed]))
+
+
+def _build_lexicon() -> Dict[str, Tuple[int, float]]:
+    lexicon: Dict[str, Tuple[int, float]] = {}
+    for value, word in enumerate(HINDI_UNITS):
+        lexicon[word] = (UNIT, value)
+    for value, word in enumerate(ENGLISH_UNITS):
+        lexicon[word] = (UNIT, value)
+    for word, value in {**ENGLISH_TENS, **UNIT_VARIANTS}.items():
+        lexicon[word] = (UNIT, value)
+    for word, value in FRACTIONS.items():
+        lexicon[word] = (FRACTION, value)
+    for word in HUNDREDS:
+        lexicon[word] = (HUNDRED, 100)
+    for word, value in SCALES.items():
+        lexicon[word] = (SCALE, value)
+    for word in JOINS:
+        lexicon[word] = (JOIN, 0)
+    for word in RANGES:
+        lexicon[word] = (RANGE, 0)
+    return {form: entry for word, entry in lexicon.items() for form in _spellings(word)}
+
+
+LEXICON = _build_lexicon()
+_WEAK = {form for w in WEAK_WORDS for form in _spellings(w)}
+_CURRENCY_BEFORE = {form for w in CURRENCY_BEFORE for form in _spellings(w)}
+_CURRENCY_AFTER = {form for w in CURRENCY_AFTER for form in _spellings(w)}
+
+_DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+# Digits (Indian/Western grouping, decimals, ".5" but not the "Rs.3" dot),
+# ₹, a range dash, or a Latin/Devanagari word (letters + matras + nukta,
+# no danda)
+_TOKEN_RE = re.compile(
+    r"(?P<num>\d+(?:,\d+)*(?:\.\d+)?|(?<![\w.])\.\d+)"
+    r"|(?P<word>[a-z\u0900-\u0963\u0970-\u097F]+|₹|[-–])"
+)
+
+
+class NumberMatch(NamedTuple):
+    value: float
+    start: int
+    end: int
+    text: str
+
+
+class _Phrase:
+    """State of the number being read"""
+
+    __slots__ = ("total", "current", "current_start", "last", "last_scale", "fraction",
+                 "start", "end", "total_end", "tokens", "weak", "top_scale")
+
+    def __init__(self, start: int):
+        self.total = 0.0
+        self.current: Optional[float] = None
+        self.current_start = start
+        self.last: Optional[int] = None
+        self.last_scale = float("inf")
+        self.fraction: Optional[float] = None
+        self.start = start
+        self.end = start
+        self.total_end = start
+        self.tokens = 0
+        self.weak = False
+        self.top_scale = 0.0
+
+    @property
+    def value(self) -> float:
+        return self.total + (self.current or 0.0)
+
+
+class NumberParser:
+    """Lexicon + state machine; one shared instance is enough (stateless)"""
+
+    def __init__(self, lexicon: Dict[str, Tuple[int, float]] = None):
+        self.lexicon = lexicon or LEXICON
+
+    def _tokens(self, text: str):
+        for m in _TOKEN_RE.finditer(text):
+            if m.group("num") is not None:
+                yield NUM, float(m.group("num").replace(",", "")), m.start(), m.end(), m.group()
+            else:
+                kind, value = self.lexicon.get(m.group(), (None, 0))
+                yield kind, value, m.start(), m.end(), m.group()
+
+    def find_numbers(self, text: str) -> List[NumberMatch]:
+        """Every number in text with its character span"""
+        if not text:
+            return []
+
+        normalized = text.lower().translate(_DEVANAGARI_DIGITS)
+        whole_input = len(normalized.split()) == 1
+        found: List[NumberMatch] = []
+        phrase: Optional[_Phrase] = None
+        range_from: Optional[int] = None  # index in found of a bare "20" in "20-25 हजार"
+
+        def finish():
+            nonlocal phrase, range_from
+            if phrase is not None and (phrase.current is not None or phrase.total):
+                # A lone ambiguous word ("लोन दो") is not a number
+                if not (phrase.weak and phrase.tokens == 1 and not whole_input):
+                    value = round(phrase.value, 6)
+                    if range_from is not None and phrase.top_scale:
+                        low = found[range_from]
+                        if low.value * phrase.top_scale <= value:  # not "100 to 5 lakh"
+                            found[range_from] = low._replace(value=round(low.value * phrase.top_scale, 6))
+                    found.append(NumberMatch(
+                        value, phrase.start, phrase.end, text[phrase.start:phrase.end]
+                    ))
+            phrase = None
+            range_from = None
+
+        for kind, value, start, end, token in self._tokens(normalized):
+            if kind is None:
+                finish()
+                continue
+
+            if kind == JOIN:
+                continue
+
+            if kind == RANGE:
+                bare = (phrase is not None and phrase.current is not None and not phrase.total
+                        and phrase.last in (NUM, UNIT))
+                if bare:
+                    phrase.weak = False  # "दो से तीन लाख"
+                    finish()
+                    range_from = len(found) - 1
+                else:
+                    finish()
+                continue
+
+            if kind == FRACTION:
+                finish()
+                phrase = _Phrase(start)
+                phrase.fraction = value
+                phrase.end = end
+                phrase.tokens = 1
+                continue
+
+            if kind in (NUM, UNIT):
+                if phrase is not None and not self._extends(phrase, kind, value):
+                    finish()
+                if phrase is None:
+                    phrase = _Phrase(start)
+
+                if phrase.fraction is not None:
+                    value += phrase.fraction
+                    phrase.fraction = None
+
+                if phrase.current is None:
+                    phrase.current = value
+                    phrase.current_start = start
+                else:
+                    phrase.current += value
+                phrase.weak = token in _WEAK
+                phrase.last = kind
+
+            elif kind == HUNDRED:
+                if phrase is None:
+                    if token in _WEAK:   # "so" / bare English
+                        continue
+                    phrase = _Phrase(start)
+                if phrase.current is None:
+                    phrase.current = 1.0 + (phrase.fraction or 0.0)
+                    phrase.current_start = start
+                    phrase.fraction = None
+                phrase.current *= value
+                phrase.last = HUNDRED
+
+            else:  # SCALE
+                if phrase is None:
+                    if token in BOUND_SCALES:
+                        continue
+                    phrase = _Phrase(start)
+
+                if phrase.current is None and phrase.fraction is not None:
+                    phrase.current = 1.0 + phrase.fraction
+                    phrase.current_start = phrase.start
+                    phrase.fraction = None
+
+                if phrase.current is None:
+                    if phrase.last == SCALE and value > phrase.last_scale:
+                        # "1 lakh crore"
+                        phrase.total *= value
+                        phrase.last_scale = value
+                        phrase.top_scale = max(phrase.top_scale, value)
+                    elif phrase.last is None:
+                        phrase.current = 1.0  # bare "हज़ार"
+                        phrase.current_start = start
+                    else:
+                        continue
+                if phrase.current is not None:
+                    if value >= phrase.last_scale:
+                        # "5 लाख 10 लाख" - two numbers
+                        current, current_start = phrase.current, phrase.current_start
+                        phrase.current = None
+                        phrase.end = phrase.total_end
+                        finish()
+                        phrase = _Phrase(current_start)
+                        phrase.current = current
+                        phrase.tokens = 1
+                    phrase.total += phrase.current * value
+                    phrase.current = None
+                    phrase.last_scale = value
+                    phrase.top_scale = max(phrase.top_scale, value)
+                phrase.last = SCALE
+                phrase.total_end = end
+
+            phrase.tokens += 1
+            phrase.end = end
+
+        finish()
+        return found
+
+    @staticmethod
+    def _extends(phrase: _Phrase, kind: int, value: float) -> bool:
+        """Whether a NUM/UNIT continues the phrase in progress"""
+        if phrase.fraction is not None and phrase.current is None:
+            return True
+        if phrase.current is None:
+            return phrase.last in (None, SCALE)
+        if phrase.last == HUNDRED:
+            return value < 100 and phrase.current % 100 == 0
+        if phrase.last == UNIT and kind == UNIT:
+            # "twenty five"
+            return 20 <= phrase.current < 100 and phrase.current % 10 == 0 and 0 < value < 10
+        return False
+
+    def find_amounts(self, text: str) -> List[NumberMatch]:
+        """Numbers marked as money: "₹10 lakh", "Rs. 5000", "दो लाख रुपये" """
+        normalized = text.lower()
+        amounts = []
+        for match in self.find_numbers(text):
+            before = re.findall(r"[^\s.]+", normalized[max(0, match.start - 12):match.start])
+            after = re.findall(r"[^\s.,]+", normalized[match.end:match.end + 12])
+            if (before and before[-1] in _CURRENCY_BEFORE) or (after and after[0] in _CURRENCY_AFTER):
+                amounts.append(match)
+        return amounts
+
+
+_parser = NumberParser()
+
+
+def parse_numbers(text: str) -> List[float]:
+    return [m.value for m in _parser.find_numbers(text)]
+
+
+def parse_number(text: str) -> Optional[float]:
+    """First number in text, or None"""
+    matches = _parser.find_numbers(text)
+    return matches[0].value if matches else None
+
+
+def find_numbers(text: str) -> List[NumberMatch]:
+    return _parser.find_numbers(text)
+
+
+def find_amounts(text: str) -> List[NumberMatch]:
+    return _parser.find_amounts(text)
+
+
+# ----------------------------------------------------------------------
+# 🔹 TEST CORPUS + BENCHMARK: python -m utils.number_parser
+# ----------------------------------------------------------------------
+
+TEST_CORPUS = [
+    ("25000", [25000]),
+    ("₹25,000", [25000]),
+    ("1,00,000", [100000]),
+    ("२५,०००", [25000]),
+    ("मेरी आय ₹25,000 है", [25000]),
+    ("25 हजार", [25000]),
+    ("25 hazaar", [25000]),
+    ("पच्चीस हज़ार", [25000]),
+    ("25k", [25000]),
+    ("2.5K", [2500]),
+    ("1.5 lakh", [150000]),
+    ("ढाई लाख", [250000]),
+    ("dhai lakh", [250000]),
+    ("डेढ़ लाख रुपये", [150000]),
+    ("साढ़े तीन लाख", [350000]),
+    ("sadhe teen lakh", [350000]),
+    ("सवा लाख", [125000]),
+    ("पौने दो लाख", [175000]),
+    ("सवा सौ", [125]),
+    ("तीन सौ पचास", [350]),
+    ("पच्चीस सौ", [2500]),
+    ("दो करोड़", [20000000]),
+    ("do crore", [20000000]),
+    ("दो करोड़ पचास लाख", [25000000]),
+    ("5 लाख 50 हजार", [550000]),
+    ("ek lakh aur pachas hazaar", [150000]),
+    ("₹1 lakh crore", [1e12]),
+    ("Rs.3 lakh", [300000]),
+    ("twenty five thousand", [25000]),
+    ("one hundred and five", [105]),
+    ("two lakh", [200000]),
+    ("लाख", [100000]),
+    ("हजार रुपये", [1000]),
+    ("बीस", [20]),
+    ("तीस हजार", [30000]),
+    ("दो", [2]),
+    ("मुझे लोन दो", []),
+    ("what do you need", []),
+    ("credit score 750", [750]),
+    ("5 लाख 10 लाख", [500000, 1000000]),
+    ("2 बच्चे, आय 30 हजार", [2, 30000]),
+    ("ब्याज 9.5% है", [9.5]),
+    ("आधा लाख", [50000]),
+    ("aadha lakh rupaye", [50000]),
+    ("आधा घंटा लगेगा", []),
+    (".5 lakh", [50000]),
+    ("₹.5 lakh", [50000]),
+    ("20-25 हजार", [20000, 25000]),
+    ("2 से 3 लाख", [200000, 300000]),
+    ("do se teen lakh", [200000, 300000]),
+    ("1.5 to 2 crore", [15000000, 20000000]),
+    ("100 to 5 lakh", [100, 500000]),
+    ("2020-21 में 5 लाख", [2020, 21, 500000]),
+    ("कोई संख्या नहीं", []),
+]
+
+
+if __name__ == "__main__":
+    import timeit
+
+    failures = 0
+    for text, expected in TEST_CORPUS:
+        got = parse_numbers(text)
+        ok = got == [float(e) for e in expected]
+        failures += not ok
+        if not ok:
+            print(f"❌ {text!r}: expected {expected}, got {got}")
+    print(f"✅ {len(TEST_CORPUS) - failures}/{len(TEST_CORPUS)} corpus cases pass")
+
+    print([(m.value, m.text) for m in find_amounts("Loans between ₹10 lakh and ₹1 crore for 100 days")])
+
+    texts = [text for text, _ in TEST_CORPUS]
+    n = 2000
+    seconds = timeit.timeit(lambda: [parse_numbers(t) for t in texts], number=n)
+    print(f"⏱️ {seconds / (n * len(texts)) * 1e6:.1f} µs per parse ({len(texts)} inputs x {n})")
+
+    raise SystemExit(1 if failures else 0)
@@ -0,0 +1,106 @@
+"""
+Text normalization - Precompiled cleaning for Hindi/English text
+Shared by PDF ingestion and language detection
+"""
+
+import re
+
+# Characters outside Hindi/English text + basic punctuation
+_DISALLOWED_RE = re.compile(r"[^\w\s\u0900-\u097F.,;:!?()\-'\"/]")
+
+# Page-number markers ("Page 12"), matched after whitespace is collapsed
+_PAGE_MARKER_RE = re.compile(r"Page \d+")
+
+# UTF-8 encodes U+0900-U+097F as E0 A4 xx / E0 A5 xx, and these byte
+# pairs cannot occur inside any other character
+_DEVANAGARI_LEAD_BYTES = (b"\xe0\xa4", b"\xe0\xa5")
+
+
+def clean_pdf_text(text: str) -> str:
+    """
+    Clean extracted PDF text
+
+    Same output as the old three re.sub passes, but whitespace is
+    collapsed with str.split/join (C speed), disallowed characters are
+    removed by one precompiled pattern, and the page-marker pass only
+    runs when "Page" actually occurs in the text.
+    """
+    if not text:
+        return ""
+
+    text = _DISALLOWED_RE.sub("", " ".join(text.split()))
+
+    if "Page" in text:
+        text = _PAGE_MARKER_RE.sub("", text)
+
+    return text.strip()
+
+
+def count_devanagari(text: str) -> int:
+    """
+    Count Devanagari characters without building intermediate lists
+    """
+    if not text:
+        return 0
+    encoded = text.encode("utf-8")
+    return sum(encoded.count(lead) for lead in _DEVANAGARI_LEAD_BYTES)
+
+
+def is_mostly_devanagari(text: str, threshold: float = 0.3) -> bool:
+    """
+    True if more than `threshold` of the characters are Devanagari
+    """
+    return count_devanagari(text) > len(text) * threshold
+
+
+def clean_text(text) -> str:
+    """
+    Model text preprocessor: lowercase + collapse whitespace
+
+    Lives here (not in a training script's __main__) so pickled
+    vectorizers that reference it can be loaded from anywhere.
+    """
+    if text is None or (isinstance(text, float) and text != text):
+        return ""
+    return " ".join(str(text).lower().split())
+
+
+# Micro-benchmarks
+if __name__ == "__main__":
+    import os
+    import sys
+    import timeit
+
+    from pypdf import PdfReader
+
+    pdf_directory = sys.argv[1] if len(sys.argv) > 1 else "data/pdfs"
+
+    def legacy_clean(text: str) -> str:
+        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'[^\w\s\u0900-\u097F.,;:!?()\-\'\"\/]', '', text)
+        text = re.sub(r'Page \d+', '', text)
+        return text.strip()
+
+    def legacy_count(text: str) -> int:
+        return len(re.findall(r'[\u0900-\u097F]', text))
+
+    print(f"{'PDF':<60} {'chars':>9} {'legacy ms':>10} {'new ms':>10} {'speedup':>8}")
+
+    for filename in sorted(os.listdir(pdf_directory)):
+        if not filename.endswith(".pdf"):
+            continue
+
+        reader = PdfReader(os.path.join(pdf_directory, filename))
+        raw = "\n".join(page.extract_text() or "" for page in reader.pages)
+        assert clean_pdf_text(raw) == legacy_clean(raw)
+
+        runs = 5
+        legacy = timeit.timeit(lambda: legacy_clean(raw), number=runs) / runs
+        new = timeit.timeit(lambda: clean_pdf_text(raw), number=runs) / runs
+        print(f"{filename[:60]:<60} {len(raw):>9} {legacy * 1000:>10.2f} {new * 1000:>10.2f} {legacy / new:>7.1f}x")
+
+        cleaned = clean_pdf_text(raw)
+        legacy_detect = timeit.timeit(lambda: legacy_count(cleaned), number=runs) / runs
+        new_detect = timeit.timeit(lambda: count_devanagari(cleaned), number=runs) / runs
+        print(f"{'  script detection':<60} {len(cleaned):>9} {legacy_detect * 1000:>10.2f} "
+              f"{new_detect * 1000:>10.2f} {legacy_detect / new_detect:>7.1f}x")
@@ -0,0 +1,124 @@
+"""
+Token counter - Prompt size in LLM tokens
+Uses the LLM's own tokenizer when available, a conservative estimate otherwise
+"""
+
+import os
+import threading
+from typing import Optional
+
+from loguru import logger
+
+from utils.text_normalizer import count_devanagari
+
+
+# Fallback estimate: Latin text ~4 chars/token, Devanagari ~2 chars/token
+_LATIN_CHARS_PER_TOKEN = 4.0
+_DEVANAGARI_CHARS_PER_TOKEN = 2.0
+
+
+class TokenCounter:
+    """
+    Counts tokens with a Hugging Face tokenizer matching the LLM
+
+    LLM_TOKENIZER names a tokenizer repo or local directory (e.g. one
+    holding the Llama 3.1 tokenizer.json for llama-3.1-8b-instant). When
+    unset or unloadable, counts fall back to a character-based estimate
+    that errs on the high side, so budgets are never overshot.
+    """
+
+    def __init__(self, tokenizer_name: Optional[str] = None):
+        self.tokenizer_name = tokenizer_name or os.getenv('LLM_TOKENIZER', '')
+        self._tokenizer = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _get_tokenizer(self):
+        if self._loaded:
+            return self._tokenizer
+
+        with self._lock:
+            if not self._loaded:
+                if self.tokenizer_name:
+                    try:
+                        from transformers import AutoTokenizer
+                        self._tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_name)
+                        logger.info(f"✅ Tokenizer loaded: {self.tokenizer_name}")
+                    except Exception as e:
+                        logger.warning(f"⚠️ Tokenizer unavailable ({e}), estimating tokens")
+                self._loaded = True
+
+        return self._tokenizer
+
+    @property
+    def exact(self) -> bool:
+        """True when counts come from the real tokenizer"""
+        return self._get_tokenizer() is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+
+        tokenizer = self._get_tokenizer()
+        if tokenizer is not None:
+            return len(tokenizer.encode(text, add_special_tokens=False))
+
+        devanagari = count_devanagari(text)
+        latin = len(text) - devanagari
+        return int(latin / _LATIN_CHARS_PER_TOKEN + devanagari / _DEVANAGARI_CHARS_PER_TOKEN) + 1
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Longest prefix within max_tokens, cut back to a sentence or word end
+        """
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+
+        # Binary search on character length (token count is monotonic in it)
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.count(text[:mid]) <= max_tokens:
+                lo = mid
+            else:
+                hi = mid - 1
+
+        prefix = text[:lo]
+        for boundary in ("। ", ". ", "? ", "! ", "\n"):
+            pos = prefix.rfind(boundary)
+            if pos > lo // 2:
+                return prefix[:pos + 1].rstrip()
+
+        pos = prefix.rfind(" ")
+        return (prefix[:pos] if pos > 0 else prefix).rstrip()
+
+
+_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Process-wide counter (the tokenizer is loaded once)"""
+    global _counter
+    if _counter is None:
+        _counter = TokenCounter()
+    return _counter
+
+
+def count_tokens(text: str) -> int:
+    return get_token_counter().count(text)
+
+
+# Quick check
+if __name__ == "__main__":
+    counter = get_token_counter()
+    for sample in [
+        "What is the interest rate of Kisan Credit Card?",
+        "किसान क्रेडिट कार्ड पर ब्याज दर क्या है?",
+    ]:
+        print(f"{counter.count(sample):>4} tokens ({'exact' if counter.exact else 'estimate'}): {sample}")
+
+    long_text = "मुद्रा योजना छोटे व्यवसायों को ऋण देती है। " * 20
+    short = counter.truncate(long_text, 40)
+    print(counter.count(short), "tokens after truncate:", short[:60], "...")
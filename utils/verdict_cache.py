@@ -0,0 +1,104 @@
+"""
+Verdict Cache - Bounded LRU cache for text classification results
+Exact hits by normalized-text hash, optional SimHash near-duplicate hits
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from utils.near_duplicate import SimHashIndex, simhash
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace - the cache key basis"""
+    return " ".join(text.lower().split())
+
+
+class VerdictCache:
+    """
+    Thread-safe LRU cache of per-text verdicts
+
+    get() returns (value, how) where how is 'exact', 'near' or None.
+    Near hits come from a SimHash index over the cached texts and are
+    only attempted when near_distance > 0.
+    """
+
+    def __init__(self, maxsize: int = 10000, near_distance: int = 0):
+        self.maxsize = maxsize
+        self.near_index = SimHashIndex(near_distance) if near_distance > 0 else None
+
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, namespace: str = "") -> str:
+        return hashlib.sha1(f"{namespace}\x00{text}".encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self._data)
+
+    # ------------------------------------------------------------------
+
+    def get(self, text: str, namespace: str = "") -> Tuple[Optional[Any], Optional[str]]:
+        key = self.key(text, namespace)
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1], "exact"
+
+        if self.near_index is not None:
+            h = simhash(text)  # outside the lock
+            with self._lock:
+                near_key = self.near_index.query(h)
+                entry = self._data.get(near_key) if near_key is not None else None
+                # Never serve a near hit computed under another namespace
+                if entry is not None and entry[0] == namespace:
+                    self._data.move_to_end(near_key)
+                    self.near_hits += 1
+                    return entry[1], "near"
+
+        with self._lock:
+            self.misses += 1
+        return None, None
+
+    def put(self, text: str, value: Any, namespace: str = ""):
+        key = self.key(text, namespace)
+        h = simhash(text) if self.near_index is not None else None
+
+        with self._lock:
+            self._data[key] = (namespace, value)
+            self._data.move_to_end(key)
+            if h is not None:
+                self.near_index.add(key, h)
+
+            while len(self._data) > self.maxsize:
+                old_key, _ = self._data.popitem(last=False)
+                if self.near_index is not None:
+                    self.near_index.remove(old_key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            if self.near_index is not None:
+                self.near_index.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.near_hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.near_hits) / total, 4) if total else 0.0,
+            "near_duplicate": self.near_index is not None,
+        }